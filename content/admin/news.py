@@ -2,12 +2,14 @@
 
 from django.contrib import admin
 from django.contrib.admin import SimpleListFilter
+from django.db.models import Q
 from ordered_model.admin import (
     OrderedTabularInline,
     OrderedInlineModelAdminMixin,
 )
 
 from content.models import News, Direction, GalleryImage, Project
+from content.search import get_search_query, is_search_supported
 
 
 class ProjectFilter(SimpleListFilter):
@@ -94,6 +96,24 @@ class NewsAdmin(OrderedInlineModelAdminMixin, admin.ModelAdmin):
         ),
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        """Ищет новости по заголовку и поисковому вектору текста.
+
+        В PostgreSQL краткое описание и текст новости ищутся по
+        GIN-индексу поискового вектора (content.search), а заголовок -
+        по триграммному индексу, вместо icontains по HTML-полям,
+        требующего полного просмотра таблицы.
+        """
+        if not search_term.strip() or not is_search_supported():
+            return super().get_search_results(
+                request, queryset, search_term
+            )
+        queryset = queryset.filter(
+            Q(title__icontains=search_term.strip())
+            | Q(search_vector=get_search_query(search_term))
+        )
+        return queryset, False
+
 
 @admin.register(Direction)
 class DirectionAdmin(admin.ModelAdmin):
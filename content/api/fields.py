@@ -0,0 +1,68 @@
+"""Поля сериализаторов API приложения content.
+
+Этот модуль содержит:
+- ImageMetaField: размеры, заглушки, производные и srcset изображения.
+"""
+
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
+from rest_framework import serializers
+
+from content.storage import get_image_storage
+
+
+@extend_schema_field(OpenApiTypes.OBJECT)
+class ImageMetaField(serializers.Field):
+    """Поле метаданных изображения (<поле>_meta, см. content.images).
+
+    Возвращает размеры оригинала, преобладающий цвет и строку BlurHash
+    (заглушки до загрузки изображения), производные по названиям
+    (thumbnail, card, full) со ссылками по форматам и строки srcset
+    для каждого формата. Пока производные не созданы, возвращает None.
+    """
+
+    def __init__(self, **kwargs):
+        """Создаёт поле только для чтения."""
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_url(self, name: str) -> str:
+        """Возвращает абсолютную ссылку на файл производной."""
+        url = get_image_storage().url(name)
+        request = self.context.get('request')
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+
+    def to_representation(self, meta):
+        """Преобразует метаданные в ссылки на производные и srcset."""
+        if not meta or not meta.get('variants'):
+            return None
+        variants = {}
+        srcset = {}
+        for name, variant in meta['variants'].items():
+            urls = {
+                image_format: self.get_url(file_name)
+                for image_format, file_name in variant['files'].items()
+            }
+            variants[name] = {
+                'width': variant['width'],
+                'height': variant['height'],
+                **urls,
+            }
+            for image_format, url in urls.items():
+                candidates = srcset.setdefault(image_format, {})
+                candidates[variant['width']] = f'{url} {variant["width"]}w'
+        return {
+            'width': meta['width'],
+            'height': meta['height'],
+            'dominant_color': meta.get('dominant_color'),
+            'blurhash': meta.get('blurhash'),
+            'variants': variants,
+            'srcset': {
+                image_format: ', '.join(
+                    candidates[width] for width in sorted(candidates)
+                )
+                for image_format, candidates in srcset.items()
+            },
+        }
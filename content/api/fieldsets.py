@@ -0,0 +1,187 @@
+"""Разреженные наборы полей (sparse fieldsets) для API.
+
+Этот модуль содержит:
+- parse_field_names: разбор списка полей из параметра запроса.
+- get_sparse_fieldset: получение полей fields/omit из контекста.
+- restrict_serializer_fields: удаление полей из сериализатора.
+- get_kept_field_names: поля сериализатора, которые попадут в ответ.
+- get_field_sources: источники данных полей сериализатора.
+- get_needed_sources: источники данных набора полей.
+- prune_relations: отбрасывание ненужных select/prefetch_related.
+- prune_queryset: сужение queryset под набор источников.
+- defer_unused_rich_text: отложенная загрузка неиспользуемых HTML-полей
+  и поисковых векторов.
+
+Источник поля - первый сегмент его source (поле модели, связь или
+атрибут, заполняемый prefetch_related с to_attr). Для полей с
+source='*' (SerializerMethodField) источники задаются в Meta
+сериализатора атрибутом field_sources, например:
+field_sources = {'main_photo': ('photos',)}. Если источник хотя бы
+одного нужного поля неизвестен, queryset не сужается.
+"""
+
+from functools import lru_cache
+
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import Prefetch
+from django_ckeditor_5.fields import CKEditor5Field
+from rest_framework import serializers
+
+FIELDS_QUERY_PARAM = 'fields'
+"""Параметр запроса со списком возвращаемых полей."""
+
+OMIT_QUERY_PARAM = 'omit'
+"""Параметр запроса со списком исключаемых полей."""
+
+
+def parse_field_names(value: str | None) -> frozenset[str] | None:
+    """Разбирает список полей через запятую; None - параметр не задан."""
+    if value is None:
+        return None
+    return frozenset(name.strip() for name in value.split(',') if name)
+
+
+def get_sparse_fieldset(request) -> tuple[frozenset | None, frozenset]:
+    """Возвращает запрошенные (fields, omit) из параметров запроса."""
+    if request is None:
+        return None, frozenset()
+    fields = parse_field_names(request.query_params.get(FIELDS_QUERY_PARAM))
+    omit = parse_field_names(request.query_params.get(OMIT_QUERY_PARAM))
+    return fields, omit or frozenset()
+
+
+def restrict_serializer_fields(serializer, fields=None, omit=frozenset()):
+    """Удаляет из сериализатора незапрошенные и исключённые поля."""
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    for name in list(serializer.fields):
+        if (fields is not None and name not in fields) or name in omit:
+            serializer.fields.pop(name)
+    return serializer
+
+
+def get_kept_field_names(serializer_class, fields=None, omit=frozenset()):
+    """Возвращает имена полей сериализатора, которые попадут в ответ."""
+    return [
+        name
+        for name in get_field_sources(serializer_class)
+        if (fields is None or name in fields) and name not in omit
+    ]
+
+
+@lru_cache(maxsize=None)
+def get_field_sources(serializer_class) -> dict[str, frozenset | None]:
+    """Возвращает источники данных каждого поля сериализатора.
+
+    None означает, что источник поля неизвестен.
+    """
+    meta = getattr(serializer_class, 'Meta', None)
+    hints = getattr(meta, 'field_sources', {})
+    sources = {}
+    for name, field in serializer_class().fields.items():
+        if name in hints:
+            sources[name] = frozenset(hints[name])
+        elif field.source == '*':
+            sources[name] = None
+        else:
+            sources[name] = frozenset((field.source.split('.')[0],))
+    return sources
+
+
+def get_needed_sources(serializer_class, field_names) -> frozenset | None:
+    """Объединяет источники полей; None, если какой-то из них неизвестен."""
+    field_sources = get_field_sources(serializer_class)
+    needed = set()
+    for name in field_names:
+        sources = field_sources[name]
+        if sources is None:
+            return None
+        needed |= sources
+    return frozenset(needed)
+
+
+def _flatten_select_related(select_related, prefix='') -> list[str]:
+    """Преобразует дерево select_related запроса в список путей."""
+    paths = []
+    for name, children in select_related.items():
+        path = f'{prefix}{name}'
+        paths.append(path)
+        paths.extend(_flatten_select_related(children, f'{path}__'))
+    return paths
+
+
+def _get_lookup_root(lookup) -> str:
+    """Возвращает первый сегмент пути prefetch_related."""
+    if isinstance(lookup, Prefetch):
+        lookup = lookup.prefetch_to
+    return lookup.split('__')[0]
+
+
+def prune_relations(queryset, needed: frozenset | None):
+    """Отбрасывает select_related и prefetch_related ненужных связей."""
+    if needed is None:
+        return queryset
+    select_related = queryset.query.select_related
+    if isinstance(select_related, dict):
+        paths = [
+            path
+            for path in _flatten_select_related(select_related)
+            if path.split('__')[0] in needed
+        ]
+        queryset = queryset.select_related(None)
+        if paths:
+            queryset = queryset.select_related(*paths)
+    lookups = [
+        lookup
+        for lookup in queryset._prefetch_related_lookups
+        if _get_lookup_root(lookup) in needed
+    ]
+    queryset = queryset.prefetch_related(None)
+    if lookups:
+        queryset = queryset.prefetch_related(*lookups)
+    return queryset
+
+
+def prune_queryset(queryset, needed: frozenset | None):
+    """Сужает queryset до колонок и связей из набора источников.
+
+    Загружаются только первичный ключ, колонки нужных полей модели
+    и колонки сортировки (их читает, например, курсорная пагинация),
+    а select_related и prefetch_related ненужных связей отбрасываются.
+    """
+    if needed is None:
+        return queryset
+    queryset = prune_relations(queryset, needed)
+    model_fields = {
+        field.name for field in queryset.model._meta.concrete_fields
+    }
+    ordering = queryset.query.order_by or queryset.model._meta.ordering
+    only = {queryset.model._meta.pk.name}
+    only.update(name for name in needed if name in model_fields)
+    only.update(
+        name.lstrip('-')
+        for name in ordering
+        if isinstance(name, str) and name.lstrip('-') in model_fields
+    )
+    return queryset.only(*sorted(only))
+
+
+def defer_unused_rich_text(queryset, needed: frozenset | None):
+    """Откладывает загрузку HTML-полей CKEditor, не входящих в источники.
+
+    Такие колонки - самые объёмные в строках моделей контента, поэтому
+    их загрузка без вывода в ответ заметно увеличивает время запроса.
+    По той же причине откладываются поисковые векторы (content.search),
+    которые сериализаторы не выводят.
+    """
+    if needed is None:
+        return queryset
+    deferred = [
+        field.name
+        for field in queryset.model._meta.concrete_fields
+        if isinstance(field, (CKEditor5Field, SearchVectorField))
+        and field.name not in needed
+    ]
+    if deferred:
+        queryset = queryset.defer(*deferred)
+    return queryset
@@ -19,11 +19,21 @@
 - ProjectPhotoSerializer: для фотографий проектов.
 - ProjectSerializer: для проектов.
 - MissionSerializer: для миссий.
+- HomePageSerializer: для блоков главной страницы.
+- SearchResultSerializer: для результатов полнотекстового поиска.
+- SuggestionSerializer: для подсказок автодополнения.
+
+Сериализаторы верхнего уровня поддерживают выбор полей параметрами
+запроса ?fields= и ?omit= (SparseFieldsetSerializerMixin). Источники
+данных полей SerializerMethodField указываются в Meta.field_sources,
+чтобы представление могло сузить queryset под запрошенные поля.
 """
 
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from content.api.fields import ImageMetaField
+from content.mixins import SparseFieldsetSerializerMixin
 from content.models import (
     AboutUsVideo,
     Article,
@@ -56,11 +66,17 @@ from content.models import (
     TrainingAndInternships,
     TrainingAndInternshipsPhoto,
 )
+from content.search import SEARCH_MODELS
+from content.suggest import SUGGEST_MODELS
 
 
-class GratitudeSerializer(serializers.ModelSerializer):
+class GratitudeSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели Gratitude."""
 
+    file_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора Gratitude."""
 
@@ -69,15 +85,20 @@ class GratitudeSerializer(serializers.ModelSerializer):
             'id',
             'title',
             'file',
+            'file_meta',
             'order',
             'created_at',
             'updated_at',
         ]
 
 
-class PartnersSerializer(serializers.ModelSerializer):
+class PartnersSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели Partner."""
 
+    logo_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора Partner."""
 
@@ -86,6 +107,7 @@ class PartnersSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'logo',
+            'logo_meta',
             'description',
             'order',
             'created_at',
@@ -94,7 +116,9 @@ class PartnersSerializer(serializers.ModelSerializer):
         read_only_fields = ['created_at', 'updated_at']
 
 
-class ReviewSerializer(serializers.ModelSerializer):
+class ReviewSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели Review."""
 
     class Meta:
@@ -112,7 +136,9 @@ class ReviewSerializer(serializers.ModelSerializer):
         ]
 
 
-class AboutUsVideoSerializer(serializers.ModelSerializer):
+class AboutUsVideoSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели AboutUsVideo."""
 
     class Meta:
@@ -128,11 +154,13 @@ class AboutUsVideoSerializer(serializers.ModelSerializer):
 class FundraisingPhotoSerializer(serializers.ModelSerializer):
     """Сериализатор для фотографий, связанных с TargetedFundraising."""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора FundraisingPhoto."""
 
         model = FundraisingPhoto
-        fields = ('title', 'position', 'image')
+        fields = ('title', 'position', 'image', 'image_meta')
 
 
 class FundraisingTextBlockSerializer(serializers.ModelSerializer):
@@ -145,7 +173,9 @@ class FundraisingTextBlockSerializer(serializers.ModelSerializer):
         fields = ('position', 'content')
 
 
-class TargetedFundraisingListSerializer(serializers.ModelSerializer):
+class TargetedFundraisingListSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор списка адресных сборов (TargetedFundraising)."""
 
     main_photo = serializers.SerializerMethodField()
@@ -163,6 +193,7 @@ class TargetedFundraisingListSerializer(serializers.ModelSerializer):
             'created_at',
             'updated_at',
         )
+        field_sources = {'main_photo': ('photos',)}
 
     @extend_schema_field(FundraisingPhotoSerializer(allow_null=True))
     def get_main_photo(self, obj):
@@ -173,7 +204,9 @@ class TargetedFundraisingListSerializer(serializers.ModelSerializer):
         return None
 
 
-class TargetedFundraisingDetailSerializer(serializers.ModelSerializer):
+class TargetedFundraisingDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Детализированный сериализатор для TargetedFundraising.
 
     Включает в себя все фото, текстовые блоки и другие подробности сбора.
@@ -198,9 +231,13 @@ class TargetedFundraisingDetailSerializer(serializers.ModelSerializer):
         )
 
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для краткого отображения информации о сотруднике."""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора Employee."""
 
@@ -209,6 +246,7 @@ class EmployeeSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'image',
+            'image_meta',
             'main_specialities',
             'order',
             'created_at',
@@ -234,12 +272,15 @@ class CategorySerializer(serializers.Serializer):
     documents = DocumentSerializer(many=True)
 
 
-class EmployeeDetailSerializer(serializers.ModelSerializer):
+class EmployeeDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Детализированный сериализатор для модели Employee.
 
     Включает основной список документов и документы по категориям.
     """
 
+    image_meta = ImageMetaField()
     main_documents = serializers.SerializerMethodField()
     category_documents = serializers.SerializerMethodField()
 
@@ -257,9 +298,14 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
             'interviews',
             'specialists_register',
             'image',
+            'image_meta',
             'main_documents',
             'category_documents',
         )
+        field_sources = {
+            'main_documents': ('prefetched_documents_on_main',),
+            'category_documents': ('prefetched_documents',),
+        }
 
     @extend_schema_field(list[dict])
     def get_main_documents(self, obj) -> list[dict]:
@@ -296,16 +342,21 @@ class EmployeeDetailSerializer(serializers.ModelSerializer):
 class ProjectPhotoSerializer(serializers.ModelSerializer):
     """Сериализатор ProjectPhoto."""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора ProjectPhotoSerializer."""
 
         model = ProjectPhoto
-        fields = ('image',)
+        fields = ('image', 'image_meta')
 
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор Project."""
 
+    logo_meta = ImageMetaField()
     photos = ProjectPhotoSerializer(many=True)
     program = serializers.SerializerMethodField()
     source_financing = serializers.SerializerMethodField()
@@ -319,6 +370,7 @@ class ProjectSerializer(serializers.ModelSerializer):
             'order',
             'title',
             'logo',
+            'logo_meta',
             'status',
             'project_start',
             'project_end',
@@ -330,6 +382,10 @@ class ProjectSerializer(serializers.ModelSerializer):
             'project_description',
             'achieved_results',
         )
+        field_sources = {
+            'program': ('program',),
+            'source_financing': ('source_financing',),
+        }
 
     def get_program(self, obj):
         """Возвращает None, если не привязана программа."""
@@ -340,7 +396,9 @@ class ProjectSerializer(serializers.ModelSerializer):
         return obj.source_financing.name if obj.source_financing else None
 
 
-class MissionSerializer(serializers.ModelSerializer):
+class MissionSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор Mission."""
 
     class Meta:
@@ -356,7 +414,9 @@ class MissionSerializer(serializers.ModelSerializer):
         )
 
 
-class DirectionSerializer(serializers.ModelSerializer):
+class DirectionSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели направления деятельности."""
 
     class Meta:
@@ -369,16 +429,21 @@ class DirectionSerializer(serializers.ModelSerializer):
 class GalleryImageSerializer(serializers.ModelSerializer):
     """Сериализатор для изображений галереи."""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора GalleryImageSerializer."""
 
         model = GalleryImage
-        fields = ('id', 'name', 'image', 'order')
+        fields = ('id', 'name', 'image', 'image_meta', 'order')
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели новости на общей странице."""
 
+    photo_meta = ImageMetaField()
     directions = DirectionSerializer(many=True, read_only=True)
 
     class Meta:
@@ -391,14 +456,18 @@ class NewsSerializer(serializers.ModelSerializer):
             'summary',
             'date',
             'photo',
+            'photo_meta',
             'show_on_main',
             'directions',
         )
 
 
-class NewsDetailSerializer(serializers.ModelSerializer):
+class NewsDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для модели новости на подробной странице."""
 
+    photo_meta = ImageMetaField()
     directions = DirectionSerializer(many=True, read_only=True)
     project = ProjectSerializer(read_only=True)
     gallery_images = GalleryImageSerializer(many=True, read_only=True)
@@ -411,6 +480,7 @@ class NewsDetailSerializer(serializers.ModelSerializer):
             'id',
             'title',
             'photo',
+            'photo_meta',
             'date',
             'course_start',
             'summary',
@@ -437,7 +507,9 @@ class ReportSerializer(serializers.ModelSerializer):
         fields = ('id', 'title', 'file', 'download_icon', 'order')
 
 
-class ChapterSerializer(serializers.ModelSerializer):
+class ChapterSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для глав отчетов."""
 
     reports = ReportSerializer(many=True)
@@ -449,15 +521,20 @@ class ChapterSerializer(serializers.ModelSerializer):
         fields = ('id', 'title', 'reports', 'order')
 
 
-class VacancySerializer(serializers.ModelSerializer):
+class VacancySerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для вакансий на общей странице."""
 
+    photo_meta = ImageMetaField()
+
     class Meta:
         model = Vacancy
         fields = (
             'id',
             'profession',
             'photo',
+            'photo_meta',
             'salary',
             'short_description',
             'schedule',
@@ -467,15 +544,20 @@ class VacancySerializer(serializers.ModelSerializer):
         )
 
 
-class VacancyDetailSerializer(serializers.ModelSerializer):
+class VacancyDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для вакансий на общей странице."""
 
+    photo_meta = ImageMetaField()
+
     class Meta:
         model = Vacancy
         fields = (
             'id',
             'profession',
             'photo',
+            'photo_meta',
             'salary',
             'additional_description',
             'detailed_description',
@@ -487,14 +569,18 @@ class VacancyDetailSerializer(serializers.ModelSerializer):
 class CoachingPhotoSerializer(serializers.ModelSerializer):
     """Сериализатор CoachingPhoto."""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора CoachingPhotoSerializer."""
 
         model = CoachingPhoto
-        fields = ('image',)
+        fields = ('image', 'image_meta')
 
 
-class CoachingSerializer(serializers.ModelSerializer):
+class CoachingSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор Coaching."""
 
     photos = CoachingPhotoSerializer(many=True)
@@ -518,19 +604,32 @@ class CoachingSerializer(serializers.ModelSerializer):
         )
 
 
-class SupervisorSerializer(serializers.ModelSerializer):
+class SupervisorSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для супервизоров."""
 
+    image_meta = ImageMetaField()
     directions = DirectionSerializer(many=True, read_only=True)
 
     class Meta:
         model = Supervisor
-        fields = ('id', 'name', 'position', 'image', 'order', 'directions')
+        fields = (
+            'id',
+            'name',
+            'position',
+            'image',
+            'image_meta',
+            'order',
+            'directions',
+        )
 
 
 class ArticleGallerySerializer(serializers.ModelSerializer):
     """Сериализатор ArticleGallery."""
 
+    foto_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатора ArticleGallerySerializer."""
 
@@ -538,12 +637,15 @@ class ArticleGallerySerializer(serializers.ModelSerializer):
         fields = (
             'id',
             'foto',
+            'foto_meta',
         )
 
 
 class ArticleTextBlockSerializer(serializers.ModelSerializer):
     """Сериализатор ArticleTextBlock."""
 
+    foto_meta = ImageMetaField()
+
     class Meta:
         """Meta класс с настройками сериализатор ArticleTextBlockSerializer."""
 
@@ -552,6 +654,7 @@ class ArticleTextBlockSerializer(serializers.ModelSerializer):
             'id',
             'text',
             'foto',
+            'foto_meta',
         )
 
 
@@ -570,7 +673,9 @@ class ArticleMiniSerializer(serializers.ModelSerializer):
         )
 
 
-class ArticleSerializer(serializers.ModelSerializer):
+class ArticleSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор Article."""
 
     chapter = serializers.CharField(source='chapter.title')
@@ -593,7 +698,9 @@ class ArticleSerializer(serializers.ModelSerializer):
         )
 
 
-class ChapterKnowledgeBaseSerializer(serializers.ModelSerializer):
+class ChapterKnowledgeBaseSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор ChapterKnowledgeBase."""
 
     articles = ArticleMiniSerializer(many=True)
@@ -621,7 +728,9 @@ class ArticleUsefulLinksSerializer(serializers.ModelSerializer):
         )
 
 
-class ChapterUsefulLinksSerializer(serializers.ModelSerializer):
+class ChapterUsefulLinksSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор ChapterUsefulLinks."""
 
     article_useful_links = ArticleUsefulLinksSerializer(many=True)
@@ -635,9 +744,13 @@ class ChapterUsefulLinksSerializer(serializers.ModelSerializer):
         )
 
 
-class LiteratureSerializer(serializers.ModelSerializer):
+class LiteratureSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор Literature."""
 
+    cover_meta = ImageMetaField()
+
     class Meta:
         model = Literature
         fields = (
@@ -646,6 +759,7 @@ class LiteratureSerializer(serializers.ModelSerializer):
             'author',
             'publication_year',
             'cover',
+            'cover_meta',
             'description',
             'button_type',
             'file',
@@ -656,12 +770,16 @@ class LiteratureSerializer(serializers.ModelSerializer):
 class TrainAndInternPhotoSerializer(serializers.ModelSerializer):
     """Сериализатор для фотографий обучений и стажировок."""
 
+    image_meta = ImageMetaField()
+
     class Meta:
         model = TrainingAndInternshipsPhoto
-        fields = ('id', 'image', 'on_main', 'order')
+        fields = ('id', 'image', 'image_meta', 'on_main', 'order')
 
 
-class TrainAndInternSerializer(serializers.ModelSerializer):
+class TrainAndInternSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для обучения и стажировок."""
 
     photos = TrainAndInternPhotoSerializer(many=True)
@@ -684,7 +802,9 @@ class TrainAndInternSerializer(serializers.ModelSerializer):
         )
 
 
-class TrainAndInternDetailSerializer(serializers.ModelSerializer):
+class TrainAndInternDetailSerializer(
+    SparseFieldsetSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для обучения и стажировок."""
 
     photos = TrainAndInternPhotoSerializer(many=True)
@@ -703,3 +823,48 @@ class TrainAndInternDetailSerializer(serializers.ModelSerializer):
             'photos',
             'linked_news',
         )
+
+
+class HomePageSerializer(serializers.Serializer):
+    """Сериализатор блоков главной страницы.
+
+    Блоки, отсутствующие в переданных данных, не попадают в ответ.
+    """
+
+    mission = MissionSerializer(read_only=True)
+    about_video = AboutUsVideoSerializer(read_only=True)
+    news = NewsSerializer(many=True, read_only=True)
+    partners = PartnersSerializer(many=True, read_only=True)
+    reviews = ReviewSerializer(many=True, read_only=True)
+    gratitudes = GratitudeSerializer(many=True, read_only=True)
+    fundraisings = TargetedFundraisingListSerializer(
+        many=True, read_only=True
+    )
+    projects = ProjectSerializer(many=True, read_only=True)
+
+
+class SearchResultSerializer(serializers.Serializer):
+    """Сериализатор результата полнотекстового поиска.
+
+    headline - фрагменты текста с найденными словами в тегах <mark>,
+    rank - релевантность результата (content.search).
+    """
+
+    type = serializers.ChoiceField(choices=list(SEARCH_MODELS))
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    headline = serializers.CharField(allow_null=True)
+    rank = serializers.FloatField()
+
+
+class SuggestionSerializer(serializers.Serializer):
+    """Сериализатор подсказки автодополнения.
+
+    text - название или имя объекта, score - похожесть на запрос
+    (content.suggest).
+    """
+
+    type = serializers.ChoiceField(choices=list(SUGGEST_MODELS))
+    id = serializers.IntegerField()
+    text = serializers.CharField()
+    score = serializers.FloatField()
@@ -9,6 +9,9 @@
 - ReviewViewSet: отзывы.
 - AboutUsVideoViewSet: видео «О нас».
 - EmployeeViewSet: сотрудники.
+- HomePageViewSet: все блоки главной страницы одним запросом.
+- SearchViewSet: полнотекстовый поиск по контенту.
+- SuggestViewSet: подсказки автодополнения.
 
 Используется DefaultRouter из DRF для автоматической генерации URL-адресов.
 """
@@ -63,6 +66,9 @@ v1_router_api.register(
 v1_router_api.register(
     r'trainings', views.TrainingAndInternshipsViewSet, basename='trainigs'
 )
+v1_router_api.register(r'homepage', views.HomePageViewSet, basename='homepage')
+v1_router_api.register(r'search', views.SearchViewSet, basename='search')
+v1_router_api.register(r'suggest', views.SuggestViewSet, basename='suggest')
 
 api_urls.extend(v1_router_api.urls)
 
@@ -9,46 +9,92 @@
 - AboutUsVideo (видео о нас)
 - TargetedFundraising (адресные сборы)
 - Employee (сотрудники)
-
-Используются только для чтения (GET-запросов).
+- HomePage (все блоки главной страницы одним запросом)
+- Search (полнотекстовый поиск по контенту)
+- Suggest (подсказки автодополнения по названиям и именам)
+
+Используются только для чтения (GET-запросов). Ответы кэшируются
+до изменения контента моделей, от которых они зависят (см. content.cache).
+Mission и AboutUsVideo отдаются из заранее отрендеренных снимков
+(см. content.snapshots).
+Параметры ?fields= и ?omit= ограничивают набор полей ответа и колонок,
+выбираемых из базы данных (см. content.api.fieldsets).
 """
 
 from django.db.models import Prefetch
 from django_filters.rest_framework import DjangoFilterBackend
-from drf_spectacular.utils import extend_schema, extend_schema_view
+from drf_spectacular.utils import (
+    OpenApiParameter,
+    extend_schema,
+    extend_schema_view,
+)
 from rest_framework import mixins, status, viewsets
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
 from content import filters
-from content.mixins import MultiSerializerViewSetMixin
+from content.api.fieldsets import (
+    defer_unused_rich_text,
+    get_kept_field_names,
+    get_needed_sources,
+    parse_field_names,
+    prune_queryset,
+    prune_relations,
+    restrict_serializer_fields,
+)
+from content.cache import cached_response
+from content.mixins import (
+    CachedResponseViewSetMixin,
+    MultiSerializerViewSetMixin,
+    SparseFieldsetViewSetMixin,
+)
 from content.models import (
     AboutUsVideo,
     Article,
+    ArticleGallery,
+    ArticleTextBlock,
+    ArticleUsefulLinks,
     Chapter,
     ChapterKnowledgeBase,
     ChapterUsefulLinks,
     Coaching,
+    CoachingPhoto,
     Direction,
     Employee,
+    FundraisingPhoto,
+    FundraisingTextBlock,
     Gratitude,
     Literature,
     Mission,
     News,
     Partner,
+    ProgramsProjects,
     Project,
+    ProjectPhoto,
     Review,
     Supervisor,
     TargetedFundraising,
+    TypeDocument,
     Vacancy,
     TrainingAndInternships,
+    TrainingAndInternshipsPhoto,
 )
 from content.models.employees import Document
 from content.models.news import GalleryImage
 from content.models.report import Report
 from content.pagination import (
     LiteraturePageNumberPagination,
-    NewsLimitOffsetPagination,
+    NewsPagination,
+    SearchPagination,
+    get_positive_int,
+)
+from content.search import SEARCH_MODELS, get_search_hits, search
+from content.suggest import (
+    MIN_QUERY_LENGTH,
+    SUGGEST_MODELS,
+    get_suggestions,
 )
+from content.snapshots import snapshot_response
 
 from . import serializers
 
@@ -62,7 +108,11 @@ from . import serializers
         summary='Получить Благодарность по ID.',
     ),
 )
-class GratitudeViewSet(viewsets.ReadOnlyModelViewSet):
+class GratitudeViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получение благодарностей.
 
     Используйте этот эндпоинт, чтобы отобразить благодарности.
@@ -71,6 +121,7 @@ class GratitudeViewSet(viewsets.ReadOnlyModelViewSet):
 
     queryset = Gratitude.objects.filter(is_active=True)
     serializer_class = serializers.GratitudeSerializer
+    query_budget = {'list': 3, 'retrieve': 2}
 
 
 @extend_schema(tags=['Partners group'])
@@ -82,7 +133,11 @@ class GratitudeViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить карточку Партнера по ID.',
     ),
 )
-class PartnersViewSet(viewsets.ReadOnlyModelViewSet):
+class PartnersViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Информация о партнёрах.
 
     Используйте этот эндпоинт, чтобы отобразить информацию о партнёрах.
@@ -91,6 +146,7 @@ class PartnersViewSet(viewsets.ReadOnlyModelViewSet):
 
     queryset = Partner.objects.all()
     serializer_class = serializers.PartnersSerializer
+    query_budget = {'list': 3, 'retrieve': 2}
 
 
 @extend_schema(tags=['Reviews group'])
@@ -102,7 +158,11 @@ class PartnersViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить Отзыв по ID.',
     ),
 )
-class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
+class ReviewViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Информация об отзывах.
 
     Используйте этот эндпоинт, чтобы отобразить информацию об отзывах.
@@ -111,6 +171,7 @@ class ReviewViewSet(viewsets.ReadOnlyModelViewSet):
 
     queryset = Review.objects.filter(is_active=True)
     serializer_class = serializers.ReviewSerializer
+    query_budget = {'list': 3, 'retrieve': 2}
 
 
 @extend_schema(tags=['VideoAboutUs group'])
@@ -126,8 +187,13 @@ class AboutUsVideoViewSet(viewsets.GenericViewSet):
     Используется для блока "О нас".
     """
 
+    queryset = AboutUsVideo.objects.all()
     serializer_class = serializers.AboutUsVideoSerializer
+    cache_models = (AboutUsVideo,)
+    query_budget = {'list': 2}
 
+    @snapshot_response
+    @cached_response
     def list(self, request, *args, **kwargs):
         """Возвращает единственное видео для блока 'О нас'.
 
@@ -156,7 +222,10 @@ class AboutUsVideoViewSet(viewsets.GenericViewSet):
     ),
 )
 class TargetedFundraisingViewSet(
-    MultiSerializerViewSetMixin, viewsets.ReadOnlyModelViewSet
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    MultiSerializerViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
 ):
     """Информация об адресных сборах.
 
@@ -168,6 +237,12 @@ class TargetedFundraisingViewSet(
         'list': serializers.TargetedFundraisingListSerializer,
         'retrieve': serializers.TargetedFundraisingDetailSerializer,
     }
+    cache_models = (
+        TargetedFundraising,
+        FundraisingPhoto,
+        FundraisingTextBlock,
+    )
+    query_budget = {'list': 4, 'retrieve': 4}
 
     def get_queryset(self):
         """Возвращает оптимизированный queryset."""
@@ -190,7 +265,10 @@ class TargetedFundraisingViewSet(
     ),
 )
 class EmployeeViewSet(
-    MultiSerializerViewSetMixin, viewsets.ReadOnlyModelViewSet
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    MultiSerializerViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
 ):
     """Информация о сотрудниках.
 
@@ -202,6 +280,8 @@ class EmployeeViewSet(
         'list': serializers.EmployeeSerializer,
         'retrieve': serializers.EmployeeDetailSerializer,
     }
+    cache_models = (Employee, Document, TypeDocument)
+    query_budget = {'list': 3, 'retrieve': 4}
 
     def get_queryset(self):
         """Оптимизирует выборку данных для разных типов запросов.
@@ -236,7 +316,11 @@ class EmployeeViewSet(
         summary='Получить Проект по ID.',
     ),
 )
-class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
+class ProjectViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список Проектов, или конкретный по его ID."""
 
     queryset = (
@@ -245,6 +329,8 @@ class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
         .all()
     )
     serializer_class = serializers.ProjectSerializer
+    cache_models = (Project, ProjectPhoto, Partner, ProgramsProjects)
+    query_budget = {'list': 4, 'retrieve': 3}
 
 
 @extend_schema(tags=['Missions group'])
@@ -259,8 +345,13 @@ class MissionViewSet(
 ):
     """Получить Миссию."""
 
+    queryset = Mission.objects.all()
     serializer_class = serializers.MissionSerializer
+    cache_models = (Mission,)
+    query_budget = {'list': 2}
 
+    @snapshot_response
+    @cached_response
     def list(self, request, *args, **kwargs):
         """Возвращает единственную Миссию'.
 
@@ -282,22 +373,40 @@ class MissionViewSet(
         summary='Получить Новость по ID.',
     ),
 )
-class NewsViewSet(MultiSerializerViewSetMixin, viewsets.ReadOnlyModelViewSet):
+class NewsViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    MultiSerializerViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список Новостей, или конкретную по её ID."""
 
-    queryset = News.objects.select_related('project').prefetch_related(
+    queryset = News.objects.select_related(
+        'project__program', 'project__source_financing'
+    ).prefetch_related(
         'directions',
+        'project__photos',
         Prefetch(
             'gallery_images', queryset=GalleryImage.objects.order_by('order')
         ),
     )
     filter_backends = [DjangoFilterBackend]
     filterset_class = filters.NewsFilter
-    pagination_class = NewsLimitOffsetPagination
+    pagination_class = NewsPagination
     serializer_classes = {
         'list': serializers.NewsSerializer,
         'retrieve': serializers.NewsDetailSerializer,
     }
+    cache_models = (
+        News,
+        Direction,
+        GalleryImage,
+        Project,
+        ProjectPhoto,
+        Partner,
+        ProgramsProjects,
+    )
+    query_budget = {'list': 4, 'retrieve': 5}
 
 
 @extend_schema(tags=['Directions group'])
@@ -309,11 +418,16 @@ class NewsViewSet(MultiSerializerViewSetMixin, viewsets.ReadOnlyModelViewSet):
         summary='Получить Направление по ID.',
     ),
 )
-class DirectionViewSet(viewsets.ReadOnlyModelViewSet):
+class DirectionViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список Направлений, или конкретное по его ID."""
 
     queryset = Direction.objects.all()
     serializer_class = serializers.DirectionSerializer
+    query_budget = {'list': 3, 'retrieve': 2}
 
 
 @extend_schema(tags=['Reports group'])
@@ -331,7 +445,11 @@ class DirectionViewSet(viewsets.ReadOnlyModelViewSet):
         """,
     ),
 )
-class ReportViewSet(viewsets.ReadOnlyModelViewSet):
+class ReportViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список отчетов, или конкретный по его ID."""
 
     queryset = Chapter.objects.prefetch_related(
@@ -341,6 +459,8 @@ class ReportViewSet(viewsets.ReadOnlyModelViewSet):
         )
     ).all()
     serializer_class = serializers.ChapterSerializer
+    cache_models = (Chapter, Report)
+    query_budget = {'list': 4, 'retrieve': 3}
 
 
 @extend_schema(tags=['Coachings group'])
@@ -352,13 +472,19 @@ class ReportViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить "Консультация и обучение" по ID.',
     ),
 )
-class CoachingViewSet(viewsets.ReadOnlyModelViewSet):
+class CoachingViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список "Консультация и обучение", или конкретный по его ID."""
 
     queryset = Coaching.objects.prefetch_related(
         'photos',
     ).all()
     serializer_class = serializers.CoachingSerializer
+    cache_models = (Coaching, CoachingPhoto)
+    query_budget = {'list': 4, 'retrieve': 3}
 
 
 @extend_schema(tags=['Vacancies group'])
@@ -371,7 +497,10 @@ class CoachingViewSet(viewsets.ReadOnlyModelViewSet):
     ),
 )
 class VacancyViewSet(
-    MultiSerializerViewSetMixin, viewsets.ReadOnlyModelViewSet
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    MultiSerializerViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
 ):
     """Получить список Вакансий, или конкретную по её ID."""
 
@@ -380,6 +509,7 @@ class VacancyViewSet(
         'list': serializers.VacancySerializer,
         'retrieve': serializers.VacancyDetailSerializer,
     }
+    query_budget = {'list': 3, 'retrieve': 2}
 
 
 @extend_schema(tags=['Supervisors group'])
@@ -391,19 +521,25 @@ class VacancyViewSet(
         summary='Получить Супервизора по ID.',
     ),
 )
-class SupervisorViewSet(viewsets.ReadOnlyModelViewSet):
+class SupervisorViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список Супервизоров, или конкретного по его ID."""
 
     queryset = Supervisor.objects.only(
-        'id', 'name', 'position', 'image', 'order'
+        'id', 'name', 'position', 'image', 'image_meta', 'order'
     ).prefetch_related(
         Prefetch(
             'directions', queryset=Direction.objects.only('id', 'name', 'slug')
         )
     )
     serializer_class = serializers.SupervisorSerializer
+    cache_models = (Supervisor, Direction)
     filter_backends = (DjangoFilterBackend,)
     filterset_class = filters.SupervisorFilter
+    query_budget = {'list': 4, 'retrieve': 3}
 
     def get_queryset(self):
         """Возвращает QuerySet с устранением дубликатов при фильтрации."""
@@ -424,7 +560,11 @@ class SupervisorViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить "Раздел Базы знаний" по ID.',
     ),
 )
-class ChapterKnowledgeBaseViewSet(viewsets.ReadOnlyModelViewSet):
+class ChapterKnowledgeBaseViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список "Разделов Базы знаний", или конкретный по его ID."""
 
     queryset = ChapterKnowledgeBase.objects.prefetch_related(
@@ -433,6 +573,8 @@ class ChapterKnowledgeBaseViewSet(viewsets.ReadOnlyModelViewSet):
         'articles__text_blocks',
     ).all()
     serializer_class = serializers.ChapterKnowledgeBaseSerializer
+    cache_models = (ChapterKnowledgeBase, Article)
+    query_budget = {'list': 6, 'retrieve': 5}
 
 
 @extend_schema(tags=['KnowledgeBase group'])
@@ -444,7 +586,11 @@ class ChapterKnowledgeBaseViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить "Статью Базы знаний" по ID.',
     ),
 )
-class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
+class ArticleViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список "Разделов Базы знаний", или конкретный по его ID."""
 
     queryset = (
@@ -456,6 +602,13 @@ class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
         .all()
     )
     serializer_class = serializers.ArticleSerializer
+    cache_models = (
+        Article,
+        ChapterKnowledgeBase,
+        ArticleGallery,
+        ArticleTextBlock,
+    )
+    query_budget = {'list': 5, 'retrieve': 4}
 
 
 @extend_schema(tags=['UsefulLinks group'])
@@ -467,13 +620,19 @@ class ArticleViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить Раздел Полезные ссылки по ID.',
     ),
 )
-class ChapterUsefulLinksViewSet(viewsets.ReadOnlyModelViewSet):
+class ChapterUsefulLinksViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список Разделов Полезные ссылки, или конкретный по его ID."""
 
     queryset = ChapterUsefulLinks.objects.prefetch_related(
         'article_useful_links',
     ).all()
     serializer_class = serializers.ChapterUsefulLinksSerializer
+    cache_models = (ChapterUsefulLinks, ArticleUsefulLinks)
+    query_budget = {'list': 4, 'retrieve': 3}
 
 
 @extend_schema(tags=['Literature group'])
@@ -485,12 +644,17 @@ class ChapterUsefulLinksViewSet(viewsets.ReadOnlyModelViewSet):
         summary='Получить Литературу по ID.',
     ),
 )
-class LiteratureViewSet(viewsets.ReadOnlyModelViewSet):
+class LiteratureViewSet(
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
+):
     """Получить список Литературы, или конкретную по ID."""
 
     queryset = Literature.objects.all()
     pagination_class = LiteraturePageNumberPagination
     serializer_class = serializers.LiteratureSerializer
+    query_budget = {'list': 3, 'retrieve': 2}
 
 
 @extend_schema(tags=['Training and internships'])
@@ -503,7 +667,10 @@ class LiteratureViewSet(viewsets.ReadOnlyModelViewSet):
     ),
 )
 class TrainingAndInternshipsViewSet(
-    MultiSerializerViewSetMixin, viewsets.ReadOnlyModelViewSet
+    CachedResponseViewSetMixin,
+    SparseFieldsetViewSetMixin,
+    MultiSerializerViewSetMixin,
+    viewsets.ReadOnlyModelViewSet,
 ):
     """Получить список Обучений и Стажировок, или конкретную по её ID."""
 
@@ -512,3 +679,362 @@ class TrainingAndInternshipsViewSet(
         'list': serializers.TrainAndInternSerializer,
         'retrieve': serializers.TrainAndInternDetailSerializer,
     }
+    cache_models = (TrainingAndInternships, TrainingAndInternshipsPhoto)
+    query_budget = {'list': 4, 'retrieve': 3}
+
+
+@extend_schema(tags=['HomePage group'])
+@extend_schema_view(
+    list=extend_schema(
+        summary='Получить блоки главной страницы.',
+        description="""
+        Возвращает миссию, видео «О нас», новости, партнёров, отзывы,
+        благодарности, адресные сборы и проекты одним запросом.
+        """,
+        parameters=[
+            OpenApiParameter(
+                'blocks',
+                str,
+                description=(
+                    'Блоки через запятую. По умолчанию возвращаются все.'
+                ),
+            ),
+            *[
+                OpenApiParameter(
+                    f'{name}_limit',
+                    int,
+                    description=f'Количество элементов блока {name}.',
+                )
+                for name in (
+                    'news',
+                    'partners',
+                    'reviews',
+                    'gratitudes',
+                    'fundraisings',
+                    'projects',
+                )
+            ],
+            *[
+                OpenApiParameter(
+                    f'{name}_fields',
+                    str,
+                    description=f'Поля блока {name} через запятую.',
+                )
+                for name in (
+                    'mission',
+                    'about_video',
+                    'news',
+                    'partners',
+                    'reviews',
+                    'gratitudes',
+                    'fundraisings',
+                    'projects',
+                )
+            ],
+        ],
+    ),
+)
+class HomePageViewSet(viewsets.GenericViewSet):
+    """Получить все блоки главной страницы одним запросом.
+
+    Каждый блок выбирается фиксированным числом запросов к базе данных,
+    поэтому их общее количество не зависит от объёма данных. Ответ
+    кэшируется и сбрасывается при изменении любой из моделей блоков.
+    """
+
+    serializer_class = serializers.HomePageSerializer
+    pagination_class = None
+    max_block_limit = 50
+    blocks = {
+        'mission': {'model': Mission},
+        'about_video': {'model': AboutUsVideo},
+        'news': {
+            'queryset': News.objects.filter(
+                show_on_main=True
+            ).prefetch_related('directions'),
+            'limit': 6,
+        },
+        'partners': {'queryset': Partner.objects.all(), 'limit': 20},
+        'reviews': {
+            'queryset': Review.objects.filter(is_active=True),
+            'limit': 10,
+        },
+        'gratitudes': {
+            'queryset': Gratitude.objects.filter(is_active=True),
+            'limit': 10,
+        },
+        'fundraisings': {
+            'queryset': TargetedFundraising.objects.prefetch_related(
+                'photos'
+            ),
+            'limit': 6,
+        },
+        'projects': {
+            'queryset': Project.objects.select_related(
+                'source_financing', 'program'
+            ).prefetch_related('photos'),
+            'limit': 6,
+        },
+    }
+    cache_models = (
+        Mission,
+        AboutUsVideo,
+        News,
+        Direction,
+        Partner,
+        Review,
+        Gratitude,
+        TargetedFundraising,
+        FundraisingPhoto,
+        Project,
+        ProjectPhoto,
+        ProgramsProjects,
+    )
+    query_budget = {'list': 11}
+
+    def get_validator_queryset(self):
+        """Отключает агрегирующий запрос: ETag строится по версиям."""
+        return None
+
+    def get_block_names(self) -> list[str]:
+        """Возвращает запрошенные блоки в порядке их объявления."""
+        requested = self.request.query_params.get('blocks')
+        if not requested:
+            return list(self.blocks)
+        names = {name.strip() for name in requested.split(',')}
+        return [name for name in self.blocks if name in names]
+
+    def get_block_limit(self, name: str) -> int:
+        """Возвращает количество элементов блока из параметров запроса."""
+        return get_positive_int(
+            self.request.query_params,
+            f'{name}_limit',
+            self.blocks[name]['limit'],
+            cutoff=self.max_block_limit,
+        )
+
+    def get_block_fields(self, name: str) -> frozenset[str] | None:
+        """Возвращает запрошенные поля блока из параметра <блок>_fields."""
+        return parse_field_names(
+            self.request.query_params.get(f'{name}_fields')
+        )
+
+    def get_block_queryset(self, name: str, fields: frozenset | None):
+        """Возвращает queryset блока, суженный под запрошенные поля."""
+        field = self.get_serializer_class()._declared_fields[name]
+        serializer_class = field.child.__class__
+        needed = get_needed_sources(
+            serializer_class, get_kept_field_names(serializer_class, fields)
+        )
+        queryset = self.blocks[name]['queryset'].all()
+        if fields is None:
+            queryset = defer_unused_rich_text(
+                prune_relations(queryset, needed), needed
+            )
+        else:
+            queryset = prune_queryset(queryset, needed)
+        return queryset[: self.get_block_limit(name)]
+
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        """Возвращает запрошенные блоки главной страницы."""
+        data = {}
+        block_fields = {}
+        for name in self.get_block_names():
+            block = self.blocks[name]
+            block_fields[name] = self.get_block_fields(name)
+            if 'model' in block:
+                data[name] = block['model'].get_solo()
+            else:
+                data[name] = self.get_block_queryset(name, block_fields[name])
+        serializer = self.get_serializer(data)
+        for name, fields in block_fields.items():
+            if fields is not None:
+                restrict_serializer_fields(serializer.fields[name], fields)
+        return Response(serializer.data)
+
+
+@extend_schema(tags=['Search group'])
+@extend_schema_view(
+    list=extend_schema(
+        summary='Полнотекстовый поиск по контенту.',
+        description="""
+        Ищет новости, статьи базы знаний, проекты, литературу и вакансии.
+        Результаты упорядочены по релевантности и содержат фрагменты
+        текста с найденными словами в тегах <mark>.
+        """,
+        parameters=[
+            OpenApiParameter(
+                'q',
+                str,
+                required=True,
+                description=(
+                    'Поисковый запрос. Поддерживаются фразы в кавычках, '
+                    'OR и исключение слов через -.'
+                ),
+            ),
+            OpenApiParameter(
+                'type',
+                str,
+                description=(
+                    'Типы результатов через запятую: '
+                    f'{", ".join(SEARCH_MODELS)}. По умолчанию все.'
+                ),
+            ),
+        ],
+    ),
+)
+class SearchViewSet(viewsets.GenericViewSet):
+    """Полнотекстовый поиск по контенту.
+
+    Результаты всех типов выбираются одним запросом по GIN-индексам
+    поисковых векторов, а заголовки и фрагменты вычисляются только
+    для объектов страницы (см. content.search).
+    """
+
+    serializer_class = serializers.SearchResultSerializer
+    pagination_class = SearchPagination
+    max_query_length = 200
+    cache_models = (
+        *(config['model'] for config in SEARCH_MODELS.values()),
+        ArticleTextBlock,
+    )
+    query_budget = {'list': 2 + len(SEARCH_MODELS)}
+
+    def get_validator_queryset(self):
+        """Отключает агрегирующий запрос: ETag строится по версиям."""
+        return None
+
+    def get_search_text(self) -> str:
+        """Возвращает текст поискового запроса из параметра q."""
+        text = self.request.query_params.get('q', '').strip()
+        if not text:
+            raise ValidationError({'q': 'Не задан поисковый запрос.'})
+        if len(text) > self.max_query_length:
+            raise ValidationError(
+                {
+                    'q': (
+                        'Поисковый запрос длиннее '
+                        f'{self.max_query_length} символов.'
+                    )
+                }
+            )
+        return text
+
+    def get_search_types(self) -> list[str] | None:
+        """Возвращает типы результатов из параметра type."""
+        requested = self.request.query_params.get('type')
+        if not requested:
+            return None
+        types = {name.strip() for name in requested.split(',')}
+        unknown = types - set(SEARCH_MODELS)
+        if unknown:
+            raise ValidationError(
+                {'type': f'Неизвестные типы: {", ".join(sorted(unknown))}.'}
+            )
+        return list(types)
+
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        """Возвращает страницу результатов поиска."""
+        text = self.get_search_text()
+        page = self.paginate_queryset(search(text, self.get_search_types()))
+        serializer = self.get_serializer(
+            get_search_hits(page, text), many=True
+        )
+        return self.get_paginated_response(serializer.data)
+
+
+@extend_schema(tags=['Search group'])
+@extend_schema_view(
+    list=extend_schema(
+        summary='Подсказки автодополнения.',
+        description="""
+        Возвращает лучшие совпадения запроса с заголовками новостей,
+        именами сотрудников, названиями партнёров, литературой (название
+        и автор) и направлениями. Совпадения с начала названия идут
+        первыми, опечатки учитываются по похожести слов.
+        """,
+        parameters=[
+            OpenApiParameter(
+                'q',
+                str,
+                required=True,
+                description=(
+                    f'Начало или часть названия, не короче {MIN_QUERY_LENGTH} '
+                    'символов.'
+                ),
+            ),
+            OpenApiParameter(
+                'type',
+                str,
+                description=(
+                    'Типы подсказок через запятую: '
+                    f'{", ".join(SUGGEST_MODELS)}. По умолчанию все.'
+                ),
+            ),
+            OpenApiParameter(
+                'limit', int, description='Количество подсказок.'
+            ),
+        ],
+    ),
+)
+class SuggestViewSet(viewsets.GenericViewSet):
+    """Подсказки автодополнения по названиям и именам.
+
+    Подсказки выбираются по триграммным индексам и кэшируются
+    по нормализованному запросу (см. content.suggest).
+    """
+
+    serializer_class = serializers.SuggestionSerializer
+    pagination_class = None
+    default_limit = 10
+    max_limit = 20
+    max_query_length = 100
+    query_budget = {'list': len(SUGGEST_MODELS)}
+
+    def get_suggest_text(self) -> str:
+        """Возвращает текст запроса из параметра q."""
+        text = self.request.query_params.get('q', '').strip()
+        if not MIN_QUERY_LENGTH <= len(text) <= self.max_query_length:
+            raise ValidationError(
+                {
+                    'q': (
+                        f'Запрос должен содержать от {MIN_QUERY_LENGTH} '
+                        f'до {self.max_query_length} символов.'
+                    )
+                }
+            )
+        return text
+
+    def get_suggest_types(self) -> list[str] | None:
+        """Возвращает типы подсказок из параметра type."""
+        requested = self.request.query_params.get('type')
+        if not requested:
+            return None
+        types = {name.strip() for name in requested.split(',')}
+        unknown = types - set(SUGGEST_MODELS)
+        if unknown:
+            raise ValidationError(
+                {'type': f'Неизвестные типы: {", ".join(sorted(unknown))}.'}
+            )
+        return sorted(types)
+
+    def get_limit(self) -> int:
+        """Возвращает количество подсказок из параметра limit."""
+        return get_positive_int(
+            self.request.query_params,
+            'limit',
+            self.default_limit,
+            cutoff=self.max_limit,
+        )
+
+    def list(self, request, *args, **kwargs):
+        """Возвращает подсказки для запроса."""
+        suggestions = get_suggestions(
+            self.get_suggest_text(),
+            self.get_suggest_types(),
+            self.get_limit(),
+        )
+        serializer = self.get_serializer(suggestions, many=True)
+        return Response(serializer.data)
@@ -0,0 +1,113 @@
+"""Кодирование изображений в строку BlurHash.
+
+Этот модуль содержит:
+- encode_blurhash: строка BlurHash для изображения Pillow.
+
+BlurHash (https://blurha.sh) - компактное (20-30 символов)
+представление размытого изображения через коэффициенты косинусного
+преобразования. Фронтенд декодирует его в заглушку того же размера,
+пока загружается оригинал. Реализация следует эталонному алгоритму
+и не требует дополнительных зависимостей: изображение заранее
+уменьшается до SAMPLE_SIZE, поэтому вычисление занимает миллисекунды.
+"""
+
+import math
+
+BASE83_ALPHABET = (
+    '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+    'abcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+)
+"""Алфавит кодирования base83."""
+
+SAMPLE_SIZE = 32
+"""Максимальная сторона изображения, по которому считается BlurHash."""
+
+
+def _base83(value: int, length: int) -> str:
+    """Кодирует число в base83 строку заданной длины."""
+    return ''.join(
+        BASE83_ALPHABET[value // 83 ** (length - i) % 83]
+        for i in range(1, length + 1)
+    )
+
+
+def _srgb_to_linear(value: int) -> float:
+    """Переводит компоненту sRGB (0-255) в линейное пространство."""
+    value = value / 255
+    if value <= 0.04045:
+        return value / 12.92
+    return ((value + 0.055) / 1.055) ** 2.4
+
+
+def _linear_to_srgb(value: float) -> int:
+    """Переводит линейную компоненту в sRGB (0-255)."""
+    value = max(0.0, min(1.0, value))
+    if value <= 0.0031308:
+        return int(value * 12.92 * 255 + 0.5)
+    return int((1.055 * value ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def _sign_pow(value: float, exponent: float) -> float:
+    """Возводит модуль в степень, сохраняя знак."""
+    return math.copysign(abs(value) ** exponent, value)
+
+
+def encode_blurhash(image, x_components: int = 4, y_components: int = 3):
+    """Возвращает строку BlurHash изображения Pillow.
+
+    Args:
+        image: Изображение Pillow.
+        x_components: Число компонент по горизонтали (1-9).
+        y_components: Число компонент по вертикали (1-9).
+    """
+    image = image.convert('RGB')
+    image.thumbnail((SAMPLE_SIZE, SAMPLE_SIZE))
+    width, height = image.size
+    linear = [
+        tuple(_srgb_to_linear(channel) for channel in pixel)
+        for pixel in image.getdata()
+    ]
+    cos_x = [
+        [math.cos(math.pi * i * x / width) for x in range(width)]
+        for i in range(x_components)
+    ]
+    cos_y = [
+        [math.cos(math.pi * j * y / height) for y in range(height)]
+        for j in range(y_components)
+    ]
+    factors = []
+    for j in range(y_components):
+        for i in range(x_components):
+            normalisation = 1 if i == j == 0 else 2
+            red = green = blue = 0.0
+            for y in range(height):
+                row = y * width
+                basis_y = normalisation * cos_y[j][y]
+                for x in range(width):
+                    basis = basis_y * cos_x[i][x]
+                    pixel = linear[row + x]
+                    red += basis * pixel[0]
+                    green += basis * pixel[1]
+                    blue += basis * pixel[2]
+            scale = 1 / (width * height)
+            factors.append((red * scale, green * scale, blue * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = _base83((x_components - 1) + (y_components - 1) * 9, 1)
+    if ac:
+        actual_max = max(abs(value) for factor in ac for value in factor)
+        quantised_max = max(0, min(82, int(actual_max * 166 - 0.5)))
+        maximum = (quantised_max + 1) / 166
+        result += _base83(quantised_max, 1)
+    else:
+        maximum = 1
+        result += _base83(0, 1)
+    red, green, blue = (_linear_to_srgb(value) for value in dc)
+    result += _base83((red << 16) + (green << 8) + blue, 4)
+    for factor in ac:
+        red, green, blue = (
+            max(0, min(18, int(_sign_pow(value / maximum, 0.5) * 9 + 9.5)))
+            for value in factor
+        )
+        result += _base83(red * 19 * 19 + green * 19 + blue, 2)
+    return result
@@ -0,0 +1,216 @@
+"""Модуль кэширования ответов API приложения content.
+
+Этот модуль содержит:
+- get_content_versions: получение версий контента для набора моделей.
+- bump_content_version: увеличение версии контента модели.
+- get_view_cache_models: модели, от которых зависит ответ представления.
+- build_response_cache_key: построение ключа кэша для запроса.
+- get_response_validators: вычисление ETag и Last-Modified ответа.
+- cached_response: декоратор кэширования отрендеренных JSON-ответов.
+
+Каждая модель имеет собственную версию контента - время последнего
+изменения её записей в наносекундах, которое обновляется сигналами
+при сохранении и удалении записей. Версии всех моделей, от которых
+зависит ответ, входят в ключ кэша, поэтому после изменения контента
+старые записи кэша просто перестают использоваться и вытесняются
+по таймауту. Наибольшая из версий служит Last-Modified ответа.
+"""
+
+import hashlib
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db.models import Count
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import status
+
+from rassvet.metrics import record_cache_result, track_serialization
+
+VERSION_KEY_PREFIX = 'content:version:'
+"""Префикс ключей версий контента моделей."""
+
+RESPONSE_KEY_PREFIX = 'content:response:'
+"""Префикс ключей закэшированных ответов API."""
+
+
+def get_version_key(model) -> str:
+    """Возвращает ключ кэша, в котором хранится версия контента модели."""
+    return f'{VERSION_KEY_PREFIX}{model._meta.label_lower}'
+
+
+def get_content_versions(models) -> dict[str, int]:
+    """Возвращает версии контента для переданных моделей.
+
+    Отсутствующие в кэше версии инициализируются текущим временем
+    в наносекундах, чтобы после вытеснения ключа версия не совпала
+    с одной из ранее выданных.
+    """
+    keys = sorted({get_version_key(model) for model in models})
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            versions[key] = cache.get_or_set(
+                key, time.time_ns(), timeout=None
+            )
+    return versions
+
+
+def bump_content_version(model):
+    """Увеличивает версию контента модели до текущего времени.
+
+    Версия всегда растёт, даже если часы отстали от прошлой версии.
+    """
+    key = get_version_key(model)
+    version = cache.get(key, 0)
+    cache.set(key, max(time.time_ns(), version + 1), timeout=None)
+
+
+def get_view_cache_models(view) -> tuple:
+    """Возвращает модели, от изменения которых зависит ответ представления."""
+    cache_models = getattr(view, 'cache_models', None)
+    if cache_models:
+        return tuple(cache_models)
+    return (view.get_serializer_class().Meta.model,)
+
+
+def build_response_cache_key(request, versions: dict[str, int]) -> str:
+    """Строит ключ кэша по адресу запроса и версиям контента.
+
+    Параметры запроса сортируются, чтобы одинаковые запросы
+    с разным порядком параметров попадали в одну запись кэша.
+    """
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, values in request.query_params.lists()
+            for value in values
+        )
+    )
+    version_part = ','.join(
+        f'{key}={value}' for key, value in sorted(versions.items())
+    )
+    raw_key = '|'.join(
+        (
+            request.build_absolute_uri(request.path),
+            query,
+            request.accepted_media_type,
+            version_part,
+        )
+    )
+    digest = hashlib.md5(raw_key.encode()).hexdigest()
+    return f'{RESPONSE_KEY_PREFIX}{digest}'
+
+
+def get_validator_queryset(view):
+    """Возвращает queryset, по которому вычисляются валидаторы ответа.
+
+    Для list используется отфильтрованный queryset представления,
+    для retrieve - queryset, ограниченный запрошенным объектом.
+    Представление может переопределить выбор, объявив метод
+    get_validator_queryset(); None отключает агрегирующий запрос.
+    """
+    if hasattr(view, 'get_validator_queryset'):
+        return view.get_validator_queryset()
+    queryset = view.get_queryset()
+    if view.action == 'retrieve':
+        lookup_url_kwarg = view.lookup_url_kwarg or view.lookup_field
+        try:
+            return queryset.filter(
+                **{view.lookup_field: view.kwargs[lookup_url_kwarg]}
+            )
+        except (TypeError, ValueError, ValidationError):
+            # Некорректный ключ: 404 вернёт get_object() представления.
+            return None
+    return view.filter_queryset(queryset)
+
+
+def get_response_validators(
+    view, key: str, versions: dict[str, int]
+) -> tuple[str, int]:
+    """Вычисляет сильный ETag и Last-Modified для ответа представления.
+
+    Last-Modified - время последнего изменения любой из моделей ответа
+    по их версиям контента, поэтому учитывает изменения связанных
+    моделей и удаление записей. ETag учитывает ключ кэша и результат
+    одного агрегирующего запроса COUNT.
+    """
+    last_modified = max(versions.values()) // 10**9
+    aggregates = {}
+    queryset = get_validator_queryset(view)
+    if queryset is not None:
+        aggregates = queryset.order_by().aggregate(count=Count('pk'))
+    raw_etag = f'{key}|{aggregates.get("count")}|{last_modified}'
+    etag = quote_etag(hashlib.md5(raw_etag.encode()).hexdigest())
+    return etag, last_modified
+
+
+def set_validator_headers(response, etag: str, last_modified: int | None):
+    """Устанавливает заголовки ETag и Last-Modified в ответ."""
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def cached_response(view_method):
+    """Декоратор кэширования JSON-ответов действий ViewSet.
+
+    Кэшируются только успешные GET-ответы, отрендеренные JSONRenderer.
+    Модели, от которых зависит ответ, берутся из атрибута cache_models
+    представления, по умолчанию - модель сериализатора.
+
+    Ответы содержат заголовки ETag и Last-Modified. Условный запрос
+    с совпадающим валидатором получает 304 без сериализации данных:
+    из записи кэша, а при её отсутствии - после одного агрегирующего
+    запроса к базе данных.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        renderer = request.accepted_renderer
+        if request.method != 'GET' or renderer.format != 'json':
+            return view_method(self, request, *args, **kwargs)
+        versions = get_content_versions(get_view_cache_models(self))
+        key = build_response_cache_key(request, versions)
+        entry = cache.get(key)
+        record_cache_result(request, hit=entry is not None)
+        if entry is None:
+            etag, last_modified = get_response_validators(
+                self, key, versions
+            )
+            headers = set_validator_headers(
+                HttpResponse(), etag, last_modified
+            )
+            not_modified = get_conditional_response(
+                request, etag, last_modified, headers
+            )
+            if not_modified is not headers:
+                return not_modified
+            with track_serialization(request):
+                response = view_method(self, request, *args, **kwargs)
+                if response.status_code != status.HTTP_200_OK:
+                    return response
+                content = renderer.render(
+                    response.data,
+                    request.accepted_media_type,
+                    self.get_renderer_context(),
+                )
+            entry = (content, etag, last_modified)
+            cache.set(key, entry, settings.RESPONSE_CACHE_TIMEOUT)
+        content, etag, last_modified = entry
+        response = set_validator_headers(
+            HttpResponse(content, content_type=renderer.media_type),
+            etag,
+            last_modified,
+        )
+        return get_conditional_response(
+            request, etag, last_modified, response
+        )
+
+    return wrapper
@@ -1,7 +1,9 @@
 """Модуль фильтров для API."""
 
-import django_filters
+from datetime import date
 
+import django_filters
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from .models import Supervisor, News
@@ -13,21 +15,27 @@ def get_max_year():
 
 
 class NewsFilter(django_filters.FilterSet):
-    """Фильтр новостей по диапазону годов и направлениям деятельности."""
+    """Фильтр новостей по диапазону годов и направлениям деятельности.
+
+    Границы годов переводятся в диапазон дат (date >= 1 января года
+    year_from, date < 1 января года после year_to), который выбирается
+    по индексам новостей на (..., -date). Направления проверяются
+    подзапросом EXISTS по таблице связей, поэтому новость с несколькими
+    выбранными направлениями попадает в выборку один раз, без JOIN
+    и DISTINCT.
+    """
 
     direction_slugs = django_filters.BaseInFilter(
-        field_name='directions__slug', lookup_expr='in'
+        method='filter_direction_slugs'
     )
 
     year_from = django_filters.NumberFilter(
-        field_name='date',
-        lookup_expr='year__gte',
+        method='filter_year_from',
         min_value=1900,
         max_value=get_max_year,
     )
     year_to = django_filters.NumberFilter(
-        field_name='date',
-        lookup_expr='year__lte',
+        method='filter_year_to',
         min_value=1900,
         max_value=get_max_year,
     )
@@ -38,6 +46,21 @@ class NewsFilter(django_filters.FilterSet):
         model = News
         fields = ('year_from', 'year_to', 'project', 'direction_slugs')
 
+    def filter_year_from(self, queryset, name, value):
+        """Оставляет новости начиная с 1 января года value."""
+        return queryset.filter(date__gte=date(int(value), 1, 1))
+
+    def filter_year_to(self, queryset, name, value):
+        """Оставляет новости до конца года value включительно."""
+        return queryset.filter(date__lt=date(int(value) + 1, 1, 1))
+
+    def filter_direction_slugs(self, queryset, name, value):
+        """Оставляет новости хотя бы одного из направлений value."""
+        links = News.directions.through.objects.filter(
+            news=OuterRef('pk'), direction__slug__in=value
+        )
+        return queryset.filter(Exists(links))
+
 
 class SupervisorFilter(django_filters.FilterSet):
     """Фильтр супервизоров по направлениям деятельности."""
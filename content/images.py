@@ -0,0 +1,249 @@
+"""Производные изображений (уменьшенные копии и современные форматы).
+
+Этот модуль содержит:
+- IMAGE_FIELDS: модели и их поля изображений с производными.
+- IMAGE_VARIANTS: размеры производных по ширине.
+- get_dominant_color: преобладающий цвет изображения.
+- generate_derivatives: создание производных и заглушек изображения.
+- delete_derivatives: удаление файлов производных.
+- has_outdated_images: проверка актуальности производных объекта.
+- process_image_field: обновление производных поля изображения.
+- process_instance_images: обновление производных всех полей объекта.
+
+Производные сохраняются рядом с оригиналом в подкаталоге derivatives
+в форматах AVIF (если Pillow поддерживает его), WebP и формате
+оригинала. Имена файлов, размеры оригинала, преобладающий цвет и
+строка BlurHash записываются в JSON поле <поле>_meta модели, из
+которого сериализаторы строят srcset и заглушки для ленивой загрузки.
+"""
+
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+from content.blurhash import encode_blurhash
+from content.cache import bump_content_version
+from content.media import update_references
+from content.models import (
+    ArticleGallery,
+    ArticleTextBlock,
+    CoachingPhoto,
+    Employee,
+    FundraisingPhoto,
+    GalleryImage,
+    Gratitude,
+    Literature,
+    News,
+    Partner,
+    Project,
+    ProjectPhoto,
+    Supervisor,
+    TrainingAndInternshipsPhoto,
+    Vacancy,
+)
+
+IMAGE_FIELDS = {
+    News: ('photo',),
+    Employee: ('image',),
+    Partner: ('logo',),
+    Supervisor: ('image',),
+    GalleryImage: ('image',),
+    ProjectPhoto: ('image',),
+    CoachingPhoto: ('image',),
+    FundraisingPhoto: ('image',),
+    ArticleGallery: ('foto',),
+    ArticleTextBlock: ('foto',),
+    Vacancy: ('photo',),
+    Literature: ('cover',),
+    Project: ('logo',),
+    Gratitude: ('file',),
+    TrainingAndInternshipsPhoto: ('image',),
+}
+"""Модели и поля изображений, для которых создаются производные."""
+
+IMAGE_VARIANTS = {
+    'thumbnail': 320,
+    'card': 640,
+    'full': 1280,
+}
+"""Названия производных и их максимальная ширина в пикселях."""
+
+DERIVATIVES_DIR = 'derivatives'
+"""Подкаталог производных рядом с оригиналом."""
+
+IMAGE_META_VERSION = 2
+"""Версия формата метаданных; при её смене производные пересоздаются."""
+
+SAVE_OPTIONS = {
+    'AVIF': {'quality': 50},
+    'WEBP': {'quality': 80, 'method': 4},
+    'JPEG': {'quality': 82, 'optimize': True, 'progressive': True},
+    'PNG': {'optimize': True},
+}
+"""Параметры кодирования производных по форматам."""
+
+
+def get_meta_field_name(field_name: str) -> str:
+    """Возвращает имя JSON поля метаданных для поля изображения."""
+    return f'{field_name}_meta'
+
+
+def get_output_formats(source_format: str | None) -> list[str]:
+    """Возвращает форматы производных: AVIF, WebP и формат оригинала."""
+    Image.init()
+    formats = [name for name in ('AVIF', 'WEBP') if name in Image.SAVE]
+    fallback = source_format if source_format in SAVE_OPTIONS else 'JPEG'
+    if fallback not in formats:
+        formats.append(fallback)
+    return formats
+
+
+def _encode(image, image_format: str) -> bytes:
+    """Кодирует изображение в заданный формат."""
+    if image_format == 'JPEG' and image.mode != 'RGB':
+        image = image.convert('RGB')
+    elif image.mode not in ('RGB', 'RGBA', 'L', 'LA'):
+        image = image.convert('RGBA')
+    buffer = BytesIO()
+    image.save(buffer, image_format, **SAVE_OPTIONS[image_format])
+    return buffer.getvalue()
+
+
+def get_dominant_color(image) -> str:
+    """Возвращает преобладающий цвет изображения в виде '#rrggbb'.
+
+    Цвет выбирается как самый частый из палитры в 8 цветов,
+    построенной по уменьшенной копии изображения.
+    """
+    sample = image.convert('RGB')
+    sample.thumbnail((64, 64))
+    palette_image = sample.quantize(colors=8)
+    _, index = max(palette_image.getcolors())
+    red, green, blue = palette_image.getpalette()[index * 3:index * 3 + 3]
+    return f'#{red:02x}{green:02x}{blue:02x}'
+
+
+def generate_derivatives(field_file) -> dict:
+    """Создаёт производные изображения и возвращает их метаданные.
+
+    Изображение не увеличивается: производные шире оригинала
+    совпадают с ним по размеру и создаются один раз. Кроме файлов
+    в метаданные входят размеры оригинала, преобладающий цвет
+    и строка BlurHash.
+    """
+    storage = field_file.storage
+    directory, filename = posixpath.split(field_file.name)
+    stem = posixpath.splitext(filename)[0]
+    with field_file.open('rb') as file, Image.open(file) as source:
+        source_format = source.format
+        image = ImageOps.exif_transpose(source)
+        image.load()
+    formats = get_output_formats(source_format)
+    width, height = image.size
+    rendered = {}
+    variants = {}
+    for name, max_width in IMAGE_VARIANTS.items():
+        variant_width = min(max_width, width)
+        size = (variant_width, round(height * variant_width / width))
+        if size not in rendered:
+            resized = image.resize(size, Image.Resampling.LANCZOS)
+            files = {}
+            for image_format in formats:
+                extension = image_format.lower().replace('jpeg', 'jpg')
+                files[image_format.lower()] = storage.save(
+                    posixpath.join(
+                        directory,
+                        DERIVATIVES_DIR,
+                        f'{stem}_{size[0]}w.{extension}',
+                    ),
+                    ContentFile(_encode(resized, image_format)),
+                )
+            rendered[size] = {
+                'width': size[0],
+                'height': size[1],
+                'files': files,
+            }
+        variants[name] = rendered[size]
+    return {
+        'version': IMAGE_META_VERSION,
+        'source': field_file.name,
+        'width': width,
+        'height': height,
+        'dominant_color': get_dominant_color(image),
+        'blurhash': encode_blurhash(image),
+        'variants': variants,
+    }
+
+
+def delete_derivatives(storage, meta: dict):
+    """Удаляет файлы производных, перечисленные в метаданных."""
+    names = {
+        name
+        for variant in meta.get('variants', {}).values()
+        for name in variant['files'].values()
+    }
+    for name in names:
+        storage.delete(name)
+
+
+def is_outdated(instance, field_name: str) -> bool:
+    """Проверяет, что метаданные поля не соответствуют текущему файлу.
+
+    Метаданные устаревших версий (IMAGE_META_VERSION) тоже считаются
+    неактуальными.
+    """
+    field_file = getattr(instance, field_name)
+    meta = getattr(instance, get_meta_field_name(field_name)) or {}
+    if not field_file:
+        return bool(meta)
+    return (
+        meta.get('source') != field_file.name
+        or meta.get('version') != IMAGE_META_VERSION
+    )
+
+
+def has_outdated_images(instance) -> bool:
+    """Проверяет, нужно ли обновить производные изображений объекта."""
+    return any(
+        is_outdated(instance, field_name)
+        for field_name in IMAGE_FIELDS[type(instance)]
+    )
+
+
+def process_image_field(instance, field_name: str) -> bool:
+    """Обновляет производные поля изображения, если оригинал изменился.
+
+    Метаданные сохраняются через queryset.update(), который не вызывает
+    сигналов, поэтому версия контента модели и ссылки на файлы
+    производных обновляются явно.
+    Возвращает True, если метаданные изменились.
+    """
+    if not is_outdated(instance, field_name):
+        return False
+    field_file = getattr(instance, field_name)
+    meta_field_name = get_meta_field_name(field_name)
+    meta = getattr(instance, meta_field_name) or {}
+    if meta:
+        delete_derivatives(field_file.storage, meta)
+    new_meta = generate_derivatives(field_file) if field_file else {}
+    model = type(instance)
+    model.objects.filter(pk=instance.pk).update(
+        **{meta_field_name: new_meta}
+    )
+    setattr(instance, meta_field_name, new_meta)
+    update_references(model, [instance])
+    bump_content_version(model)
+    return True
+
+
+def process_instance_images(model, pk) -> bool:
+    """Обновляет производные всех полей изображений объекта модели."""
+    instance = model.objects.filter(pk=pk).first()
+    if instance is None:
+        return False
+    changed = False
+    for field_name in IMAGE_FIELDS[model]:
+        changed = process_image_field(instance, field_name) or changed
+    return changed
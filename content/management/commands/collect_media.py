@@ -0,0 +1,65 @@
+"""Django command для удаления неиспользуемых медиафайлов.
+
+Команда пересоздаёт ссылки объектов на файлы хранилища изображений
+по хэшу содержимого (content.media) и удаляет файлы каталога cas,
+на которые не ссылается ни один объект. Файлы моложе --grace-hours
+не удаляются, так как могут принадлежать ещё не сохранённым объектам.
+
+Использование:
+    python manage.py collect_media
+    python manage.py collect_media --dry-run
+    python manage.py collect_media --grace-hours 0
+"""
+
+from collections import Counter
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.media import GC_GRACE_SECONDS, collect_garbage
+from content.models import FileReference
+from content.storage import ContentAddressedStorage, get_image_storage
+
+
+class Command(BaseCommand):
+    """Команда удаления неиспользуемых медиафайлов."""
+
+    help = 'Удаляет файлы хранилища, на которые не ссылаются объекты'
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Только вывести файлы, которые будут удалены',
+        )
+        parser.add_argument(
+            '--grace-hours',
+            type=float,
+            default=GC_GRACE_SECONDS / 3600,
+            help='Не удалять файлы моложе указанного числа часов',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Запускает команду."""
+        storage = get_image_storage()
+        if not isinstance(storage, ContentAddressedStorage):
+            raise CommandError(
+                'Хранилище изображений не адресует файлы по содержимому'
+            )
+        deleted = collect_garbage(
+            storage,
+            grace_seconds=int(kwargs['grace_hours'] * 3600),
+            dry_run=kwargs['dry_run'],
+        )
+        references = Counter(
+            FileReference.objects.values_list('model', flat=True)
+        )
+        for model, count in sorted(references.items()):
+            self.stdout.write(f'{model}: ссылок {count}')
+        if kwargs['verbosity'] > 1:
+            for name in deleted:
+                self.stdout.write(name)
+        action = 'Будет удалено' if kwargs['dry_run'] else 'Удалено'
+        self.stdout.write(
+            self.style.SUCCESS(f'{action} файлов: {len(deleted)}')
+        )
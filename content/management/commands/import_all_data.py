@@ -1,26 +1,102 @@
 """Django command для автоматизированного запуска всех команд импорта.
 
-Эта команда последовательно запускает заданный список команд импорта,
-обрабатывает исключения и выводит информацию о результатах выполнения каждой.
-Используется для упрощения процесса импорта данных в систему.
+Команды импорта запускаются по графу зависимостей IMPORT_GRAPH:
+независимые команды выполняются параллельно в отдельных процессах
+(у каждого своё соединение с базой), а зависимые - после успешного
+завершения всех своих зависимостей. По окончании выводится сводная
+таблица со статусом, числом записей и временем каждой команды.
 
 Использование:
     python manage.py import_all_data
+    python manage.py import_all_data --jobs 4
 
 Команда запускает следующие импорты:
+- import_directions: Импорт направлений
 - import_employees: Импорт данных о сотрудниках
 - import_fundraisings: Импорт данных о сборах
 - import_video: Импорт видео 'О нас'
 - import_gratitudes: Импорт благодарностей
 - import_partners: Импорт данных о партнерах
 - import_reviews: Импорт отзывов
+- import_projects: Импорт проектов (после партнеров)
+- import_news: Импорт новостей (после проектов и направлений)
 
 В случае возникновения ошибки при выполнении какой-либо команды,
-будет выведено сообщение об ошибке, но выполнение остальных команд продолжится.
+будет выведено сообщение об ошибке, зависящие от неё команды будут
+пропущены, но выполнение остальных команд продолжится.
 """
 
+import io
+import multiprocessing
+import os
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+
+import django
+from django.apps import apps
 from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+IMPORT_GRAPH = {
+    'import_directions': {'depends_on': (), 'model': 'content.Direction'},
+    'import_employees': {'depends_on': (), 'model': 'content.Employee'},
+    'import_fundraisings': {
+        'depends_on': (),
+        'model': 'content.TargetedFundraising',
+    },
+    'import_video': {'depends_on': (), 'model': 'content.AboutUsVideo'},
+    'import_gratitudes': {'depends_on': (), 'model': 'content.Gratitude'},
+    'import_partners': {'depends_on': (), 'model': 'content.Partner'},
+    'import_reviews': {'depends_on': (), 'model': 'content.Review'},
+    'import_projects': {
+        'depends_on': ('import_partners',),
+        'model': 'content.Project',
+    },
+    'import_news': {
+        'depends_on': ('import_projects', 'import_directions'),
+        'model': 'content.News',
+    },
+}
+"""Команды импорта, их зависимости и модель для подсчёта записей."""
+
+STATUS_SUCCESS = 'успешно'
+STATUS_ERROR = 'ошибка'
+STATUS_SKIPPED = 'пропущена'
+
+
+def setup_worker():
+    """Инициализирует Django в дочернем процессе."""
+    django.setup()
+
+
+def run_import(command: str) -> dict:
+    """Выполняет команду импорта и возвращает её результат.
+
+    Вывод команды перехватывается и возвращается вместе со статусом,
+    числом записей модели после импорта и временем выполнения.
+    """
+    output = io.StringIO()
+    start = time.perf_counter()
+    result = {'command': command, 'rows': None, 'error': ''}
+    try:
+        call_command(command, stdout=output)
+        model = apps.get_model(IMPORT_GRAPH[command]['model'])
+        result['rows'] = model.objects.count()
+        result['status'] = STATUS_SUCCESS
+    except Exception as e:
+        result['status'] = STATUS_ERROR
+        result['error'] = str(e)
+    finally:
+        connections.close_all()
+    result['seconds'] = time.perf_counter() - start
+    result['output'] = output.getvalue()
+    return result
 
 
 class Command(BaseCommand):
@@ -28,28 +104,123 @@ class Command(BaseCommand):
 
     help = 'Запускает все команды импорта данных'
 
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--jobs',
+            type=int,
+            default=min(os.cpu_count() or 1, 4),
+            help=(
+                'Число параллельных процессов импорта '
+                '(1 - последовательно в текущем процессе)'
+            ),
+        )
+
     def handle(self, *args, **kwargs):
         """Запускает команду."""
         self.stdout.write('Начинаем выполнение всех команд импорта...')
-        commands = [
-            'import_employees',
-            'import_fundraisings',
-            'import_video',
-            'import_gratitudes',
-            'import_partners',
-            'import_reviews',
-        ]
-        for command in commands:
-            self.stdout.write(f'Запуск команды: {command}')
-            try:
-                call_command(command)
+        self.verbosity = kwargs['verbosity']
+        self.results = {}
+        if kwargs['jobs'] > 1:
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=kwargs['jobs'],
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=setup_worker,
+            ) as executor:
+                self.run_graph(executor.submit)
+        else:
+            self.run_graph(self.run_inline)
+        self.write_summary()
+        self.stdout.write(self.style.SUCCESS('Все команды импорта выполнены.'))
+
+    def run_inline(self, func, *args):
+        """Выполняет функцию сразу и возвращает завершённый Future."""
+        future = Future()
+        future.set_result(func(*args))
+        return future
+
+    def get_ready_commands(self, pending: set[str]) -> list[str]:
+        """Возвращает команды, все зависимости которых выполнены."""
+        ready = []
+        for command in sorted(pending):
+            statuses = [
+                self.results[dependency]['status']
+                if dependency in self.results
+                else None
+                for dependency in IMPORT_GRAPH[command]['depends_on']
+            ]
+            if all(status == STATUS_SUCCESS for status in statuses):
+                ready.append(command)
+            elif any(
+                status in (STATUS_ERROR, STATUS_SKIPPED) for status in statuses
+            ):
+                self.results[command] = {
+                    'command': command,
+                    'status': STATUS_SKIPPED,
+                    'rows': None,
+                    'seconds': 0.0,
+                    'error': 'не выполнены зависимости',
+                }
                 self.stdout.write(
-                    self.style.SUCCESS(f'Команда {command} выполнена успешно.')
+                    self.style.WARNING(
+                        f'Команда {command} пропущена: '
+                        'не выполнены зависимости.'
+                    )
                 )
-            except Exception as e:
-                self.stdout.write(
-                    self.style.ERROR(
-                        f'Ошибка при выполнении команды {command}: {str(e)}'
+        return ready
+
+    def run_graph(self, submit):
+        """Запускает команды по мере выполнения их зависимостей."""
+        pending = set(IMPORT_GRAPH)
+        running = {}
+        while pending or running:
+            for command in self.get_ready_commands(pending):
+                pending.discard(command)
+                self.stdout.write(f'Запуск команды: {command}')
+                running[submit(run_import, command)] = command
+            pending -= set(self.results)
+            if not running:
+                if pending:
+                    raise CommandError(
+                        'Циклические зависимости команд: '
+                        f'{", ".join(sorted(pending))}'
                     )
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                self.report(future.result())
+
+    def report(self, result: dict):
+        """Выводит результат выполнения команды."""
+        command = result['command']
+        self.results[command] = result
+        if self.verbosity > 1 and result['output']:
+            self.stdout.write(result['output'])
+        if result['status'] == STATUS_SUCCESS:
+            self.stdout.write(
+                self.style.SUCCESS(f'Команда {command} выполнена успешно.')
+            )
+        else:
+            self.stdout.write(
+                self.style.ERROR(
+                    f'Ошибка при выполнении команды {command}: '
+                    f'{result["error"]}'
                 )
-        self.stdout.write(self.style.SUCCESS('Все команды импорта выполнены.'))
+            )
+
+    def write_summary(self):
+        """Выводит сводную таблицу по всем командам."""
+        width = max(map(len, IMPORT_GRAPH))
+        self.stdout.write(
+            f'{"Команда":<{width}}  {"Статус":<9}  {"Записей":>7}  '
+            f'{"Время, с":>8}'
+        )
+        for command in IMPORT_GRAPH:
+            result = self.results[command]
+            rows = '-' if result['rows'] is None else result['rows']
+            self.stdout.write(
+                f'{command:<{width}}  {result["status"]:<9}  {rows:>7}  '
+                f'{result["seconds"]:>8.2f}'
+            )
@@ -18,6 +18,7 @@ class Command(ImporterBase):
     model_class = Employee
     file_path = 'employees.txt'
     use_transaction = True
+    supports_sync = False
     model_config: Any = MODEL_CONFIG[model_class]
     employees_cache: dict[str, Employee] = {}
 
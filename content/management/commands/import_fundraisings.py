@@ -18,6 +18,7 @@ class Command(ImporterBase):
     model_class = TargetedFundraising
     file_path = 'fundraisings.txt'
     model_config: Any = MODEL_CONFIG[model_class]
+    media_columns = ('photo1', 'photo2', 'photo3')
 
     def post_process_instance(self, instance, row, row_num):
         """Выполняет дополнительную обработку после создания целевого сбора."""
@@ -25,6 +26,11 @@ class Command(ImporterBase):
         self._process_text_blocks(instance, row)
         return True
 
+    def clear_related(self, instance):
+        """Удаляет фотографии и текстовые блоки обновляемого сбора."""
+        FundraisingPhoto.objects.filter(fundraising=instance).delete()
+        FundraisingTextBlock.objects.filter(fundraising=instance).delete()
+
     def _process_photos(self, instance, row):
         """Обрабатывает фотографии для целевого сбора."""
         for i in range(1, 4):
@@ -14,6 +14,7 @@ class Command(ImporterBase):
     model_class = Gratitude
     file_path = 'gratitudes.txt'
     model_config: Any = MODEL_CONFIG[model_class]
+    media_columns = ('file',)
 
     def post_process_instance(self, instance, row, row_num):
         """Выполняет дополнительную обработку после создания благодарности."""
@@ -1,20 +1,72 @@
-"""Django management команда для импорта новостей из дампа SQL."""
+"""Django management команда для импорта новостей из дампа SQL.
 
+Изображения галерей по ссылкам скачиваются заранее, до создания
+новостей, в несколько потоков (GalleryDownloader) в кэш на диске
+media_data/.download_cache. Повторный запуск берёт уже скачанные
+файлы из кэша. Одинаковые по содержимому изображения сохраняются
+в хранилище один раз. Запись в базу выполняется в основном потоке
+в одной транзакции: при ошибке или прерывании импорта база остаётся
+в прежнем состоянии, в том числе не удаляются существующие новости.
+
+С флагом --sync новости не удаляются перед импортом: строки дампа
+сопоставляются с новостями по заголовку и дате (см.
+content.management.sync), пересоздаются только изменившиеся,
+а фото и изображения галереи с прежним содержимым не копируются.
+Содержимое локальных файлов фото и галереи входит в хэш строки,
+поэтому файл, заменённый под тем же путём, обновляет новость.
+"""
+
+import hashlib
+import io
+import json
 import os
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO
+
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.core.files import File
 from django.core.files.base import ContentFile
+from django.db import transaction
 from django.utils.dateparse import parse_date
 
+from content.cache import bump_content_version
 from content.management.config import DIRECTION_MAP
+from content.management.sync import (
+    STATUS_UNCHANGED,
+    DuplicateKeyError,
+    ImportSync,
+    get_file_hash,
+    get_row_hash,
+)
 from content.models import Direction, News, Project, GalleryImage
 
 SKIP_DIRECTIONS = ('10', '17', '20')
 EXPECTED_FIELDS = {'news': 15, 'projects': 4}
+CHUNK_SIZE = 1024 * 1024
+HEADER_MAX_LENGTH = 64 * 1024
+DIRECTION_LINKS_BATCH_SIZE = 1000
+URL_PREFIXES = ('http://', 'https://')
+DOWNLOAD_CACHE_DIR = '.download_cache'
+DOWNLOAD_WORKERS = 8
+DOWNLOAD_TIMEOUT = 10
+NEWS_NATURAL_KEY = ('title', 'date')
+NEWS_SYNC_FIELDS = (
+    'title',
+    'date',
+    'summary',
+    'full_text',
+    'detail_page_type',
+    'detail_page_link',
+    'video_url',
+    'project',
+    'show_on_main',
+)
 
 
 class SQLParser:
@@ -52,88 +104,274 @@ class SQLParser:
 
     def extract_table_data(self, sql: str, table_name: str) -> List[List[str]]:
         """Извлекает данные таблицы из SQL."""
-        pattern = (
+        return list(self.iter_table_data(io.StringIO(sql), table_name))
+
+    def iter_table_data(
+        self, file: TextIO, table_name: str
+    ) -> Iterator[List[str]]:
+        """Построчно отдаёт кортежи таблицы из файла SQL дампа.
+
+        Файл читается блоками, поэтому дамп не загружается в память
+        целиком. Кортежи с числом полей, отличным от ожидаемого
+        для таблицы, пропускаются.
+        """
+        pattern = re.compile(
             rf'INSERT\s+INTO\s+[`\"]?{table_name}'
-            r'[`\"]?\s*\([^)]+\)\s*VALUES\s*'
+            r'[`\"]?\s*\([^)]+\)\s*VALUES\s*',
+            re.IGNORECASE,
         )
-        all_tuples = []
         expected_fields = EXPECTED_FIELDS.get(table_name, 15)
-        for match in re.finditer(pattern, sql, re.IGNORECASE):
-            values_block = self._extract_values_block(sql, match.end())
-            tuples = self._parse_values_block(values_block, expected_fields)
-            all_tuples.extend(tuples)
-        return all_tuples
-
-    def _extract_values_block(self, sql: str, start: int) -> str:
-        """Извлекает блок VALUES из SQL."""
-        in_string = False
-        escape = False
-        paren_level = 0
-        for i, char in enumerate(sql[start:], start):
-            if escape:
-                escape = False
-                continue
+        reader = SQLDumpReader(file)
+        while reader.seek(pattern):
+            for fields in reader.iter_tuples():
+                if len(fields) == expected_fields:
+                    yield fields
+
+
+class SQLDumpReader:
+    """Потоковый разбор инструкций INSERT из SQL дампа.
+
+    Файл читается блоками по CHUNK_SIZE символов. Специальные символы
+    (кавычки, скобки, запятые, экранирование) ищутся регулярными
+    выражениями, а значения полей вырезаются срезами буфера. При
+    дочитывании из буфера удаляется всё до начала текущего поля
+    (позиция mark), поэтому память ограничена размером блока
+    и самого длинного значения.
+    """
+
+    BETWEEN_TUPLES = re.compile(r'[(;]')
+    IN_TUPLE = re.compile(r"[\\'(),]")
+    IN_STRING = re.compile(r"[\\']")
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        """Инициализация чтения дампа из текстового файла."""
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.mark = 0
+
+    def read_more(self) -> bool:
+        """Дочитывает блок файла, отбрасывая буфер до позиции mark."""
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.mark:] + chunk
+        self.pos -= self.mark
+        self.mark = 0
+        return True
+
+    def find(self, pattern: re.Pattern) -> Optional[re.Match]:
+        """Ищет шаблон начиная с позиции pos, дочитывая файл."""
+        while True:
+            match = pattern.search(self.buffer, self.pos)
+            if match or not self.read_more():
+                return match
+
+    def seek(self, pattern: re.Pattern) -> bool:
+        """Переходит к началу VALUES следующей подходящей инструкции."""
+        while True:
+            match = pattern.search(self.buffer, self.pos)
+            if match:
+                self.pos = self.mark = match.end()
+                return True
+            self.pos = self.mark = max(
+                self.pos, len(self.buffer) - HEADER_MAX_LENGTH
+            )
+            if not self.read_more():
+                return False
+
+    def iter_tuples(self) -> Iterator[List[str]]:
+        """Отдаёт кортежи VALUES текущей инструкции до ';'."""
+        while True:
+            match = self.find(self.BETWEEN_TUPLES)
+            if match is None:
+                return
+            self.pos = self.mark = match.end()
+            if match.group() == ';':
+                return
+            fields = self._parse_tuple()
+            if fields is None:
+                return
+            yield fields
+
+    def _skip_string(self) -> bool:
+        """Пропускает строковый литерал до закрывающей кавычки."""
+        while True:
+            match = self.find(self.IN_STRING)
+            if match is None:
+                return False
+            if match.group() == "'":
+                self.pos = match.end()
+                return True
+            self.pos = match.end() + 1
+
+    def _parse_tuple(self) -> Optional[List[str]]:
+        """Разбирает поля кортежа после открывающей скобки."""
+        fields = []
+        paren_level = 1
+        while True:
+            match = self.find(self.IN_TUPLE)
+            if match is None:
+                return None
+            char = match.group()
+            self.pos = match.end()
             if char == '\\':
-                escape = True
-                continue
-            if char == "'":
-                in_string = not in_string
-            if not in_string:
-                if char == '(':
-                    paren_level += 1
-                elif char == ')':
-                    paren_level -= 1
-                elif char == ';' and paren_level == 0:
-                    return sql[start:i]
-        return sql[start:]
-
-    def _parse_values_block(
-        self, values_block: str, expected_fields: int = 15
-    ) -> List[List[str]]:
-        """Парсит блок VALUES."""
-        result = []
-        current = []
-        field = ''
-        in_string = False
-        escape = False
-        paren_level = 0
-        for char in values_block:
-            if escape:
-                field += char
-                escape = False
-            elif char == '\\':
-                field += char
-                escape = True
+                self.pos += 1
             elif char == "'":
-                in_string = not in_string
-                field += char
-            elif char == ',' and not in_string and paren_level == 1:
-                current.append(field.strip())
-                field = ''
-            elif char == '(' and not in_string:
+                if not self._skip_string():
+                    return None
+            elif char == '(':
                 paren_level += 1
-                if paren_level == 1:
-                    field = ''
-                    current = []
-            elif char == ')' and not in_string:
+            elif char == ')' and paren_level > 1:
                 paren_level -= 1
-                current.append(field.strip())
-                field = ''
-                if paren_level == 0 and len(current) == expected_fields:
-                    result.append(current)
-            else:
-                field += char
-        return result
+            elif char == ')' or paren_level == 1:
+                fields.append(self.buffer[self.mark:match.start()].strip())
+                self.mark = self.pos
+                if char == ')':
+                    return fields
+
+
+class GalleryDownloader:
+    """Параллельная загрузка изображений с кэшем на диске.
+
+    Файлы скачиваются пулом потоков через общую requests.Session,
+    которая переиспользует соединения. Содержимое хранится в cache_dir
+    под именем своего SHA-256, а соответствие ссылок и файлов
+    дописывается в index.jsonl после записи файла, поэтому прерванную
+    загрузку можно продолжить: уже скачанные ссылки пропускаются.
+    Неудачные загрузки в кэш не попадают и повторяются при следующем
+    запуске.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_workers: int = DOWNLOAD_WORKERS,
+        timeout: float = DOWNLOAD_TIMEOUT,
+    ):
+        """Инициализация загрузчика и чтение индекса кэша."""
+        self.cache_dir = cache_dir
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.index_path = os.path.join(cache_dir, 'index.jsonl')
+        self.lock = threading.Lock()
+        self.errors = {}
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=max_workers, pool_maxsize=max_workers
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.index = self._load_index()
+
+    def get_cache_path(self, sha256: str) -> str:
+        """Возвращает путь к файлу кэша по хэшу содержимого."""
+        return os.path.join(self.cache_dir, sha256)
+
+    def _load_index(self) -> Dict[str, dict]:
+        """Читает индекс кэша, пропуская записи без файла."""
+        index = {}
+        if not os.path.isfile(self.index_path):
+            return index
+        with open(self.index_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if os.path.isfile(self.get_cache_path(entry['sha256'])):
+                    index[entry['url']] = entry
+        return index
+
+    def prefetch(self, urls: Iterable[str]) -> int:
+        """Скачивает в кэш ссылки, которых в нём ещё нет.
+
+        Возвращает число успешно скачанных файлов.
+        """
+        pending = [url for url in dict.fromkeys(urls) if url not in self.index]
+        if not pending:
+            return 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with ThreadPoolExecutor(self.max_workers) as executor:
+            results = list(executor.map(self._fetch, pending))
+        for url, error in zip(pending, results):
+            if error:
+                self.errors[url] = error
+        return results.count(None)
+
+    def _fetch(self, url: str) -> Optional[str]:
+        """Скачивает файл в кэш и возвращает текст ошибки при неудаче."""
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            if response.status_code != 200:
+                return (
+                    f'Не удалось скачать {url} '
+                    f'(статус {response.status_code})'
+                )
+            content = response.content
+            sha256 = hashlib.sha256(content).hexdigest()
+            path = self.get_cache_path(sha256)
+            if not os.path.isfile(path):
+                tmp_path = f'{path}.{threading.get_ident()}.tmp'
+                with open(tmp_path, 'wb') as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            entry = {
+                'url': url,
+                'sha256': sha256,
+                'filename': os.path.basename(url.split('?')[0]),
+            }
+            with self.lock:
+                with open(self.index_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                self.index[url] = entry
+        except Exception as e:
+            return f'Ошибка скачивания {url}: {e}'
+        return None
+
+    def get(self, url: str) -> Optional[dict]:
+        """Возвращает запись кэша для ссылки, скачивая её при отсутствии."""
+        if url not in self.index and url not in self.errors:
+            self.prefetch([url])
+        return self.index.get(url)
 
 
 class NewsProcessor:
     """Обработчик создания новостей."""
 
-    def __init__(self, images_dir: str, stdout):
+    def __init__(
+        self,
+        images_dir: str,
+        stdout,
+        download_workers: int = DOWNLOAD_WORKERS,
+    ):
         """Инициализация обработчика создания новостей."""
         self.images_dir = images_dir
         self.stdout = stdout
         self.parser = SQLParser()
+        self.downloader = GalleryDownloader(
+            os.path.join(images_dir, DOWNLOAD_CACHE_DIR),
+            max_workers=download_workers,
+        )
+        self.stored_images = {}
+        self.current_gallery = {}
+        self.sync = None
+        self.projects = self._load_lookup(Project, 'title')
+        self.directions = self._load_lookup(Direction, 'name')
+        self.direction_links = []
+
+    @staticmethod
+    def _load_lookup(model, field_name: str) -> Dict[str, object]:
+        """Загружает словарь объектов модели по значению поля.
+
+        При совпадающих значениях сохраняется первый объект в порядке
+        сортировки модели, как при filter(...).first().
+        """
+        lookup = {}
+        for instance in model.objects.all():
+            lookup.setdefault(getattr(instance, field_name), instance)
+        return lookup
 
     def process_news(
         self, news_data: List[str], project_map: Dict[str, str]
@@ -171,10 +409,54 @@ class NewsProcessor:
             project=self._get_project(project_id, project_map),
             show_on_main=True,
         )
-        self._set_photo(news, img_url)
+        if self.sync is None:
+            self._set_photo(news, img_url)
+            news.save()
+            self._set_directions(news, ntype)
+            self._create_gallery(news, gallery)
+            return news
+        return self._sync_news(news, news_data, img_url, ntype, gallery)
+
+    def _sync_news(
+        self,
+        news: News,
+        news_data: List[str],
+        img_url: str,
+        ntype: str,
+        gallery: str,
+    ) -> Optional[News]:
+        """Создаёт или обновляет новость в режиме --sync.
+
+        Неизменённые строки пропускаются. У изменённой новости
+        пересоздаются связи с направлениями и галерея, при этом файлы
+        галереи с прежним содержимым используются повторно. Новость
+        с повторяющимся естественным ключом пропускается с ошибкой.
+        """
+        content_hash = get_row_hash(
+            news_data, self._get_media_paths(img_url, gallery)
+        )
+        try:
+            status, existing = self.sync.lookup(news, content_hash)
+        except DuplicateKeyError as e:
+            self.stdout.write(f'Новость "{news.title}" пропущена: {e}')
+            return None
+        if status == STATUS_UNCHANGED:
+            return None
+        media = self.sync.get_media_hashes(news)
+        if existing is not None:
+            for field_name in NEWS_SYNC_FIELDS:
+                setattr(existing, field_name, getattr(news, field_name))
+            news = existing
+            news.directions.clear()
+            news.gallery_images.all().delete()
+            self.stored_images.update(media.get('gallery', {}))
+        self._set_photo(news, img_url, media)
         news.save()
         self._set_directions(news, ntype)
+        self.current_gallery = {}
         self._create_gallery(news, gallery)
+        media['gallery'] = self.current_gallery
+        self.sync.save_record(news, content_hash, media)
         return news
 
     def _get_detail_page_type(
@@ -195,75 +477,150 @@ class NewsProcessor:
         """Получает проект по ID."""
         old_pid = self.parser.safe_str(project_id)
         if old_pid in project_map:
-            return Project.objects.filter(title=project_map[old_pid]).first()
+            return self.projects.get(project_map[old_pid])
         return None
 
-    def _set_photo(self, news: News, img_url: str):
-        """Устанавливает фото для новости."""
+    def _get_media_paths(self, img_url: str, gallery: str) -> List[str]:
+        """Возвращает пути к локальным файлам фото и галереи новости.
+
+        Изображения галереи по ссылкам берутся из кэша загрузчика
+        по ссылке и в хэш строки не входят.
+        """
+        paths = [
+            os.path.join(self.images_dir, img_path)
+            for img_path in self._iter_gallery_paths(gallery)
+            if not img_path.startswith(URL_PREFIXES)
+        ]
+        img = self.parser.safe_str(img_url).lstrip('/')
+        if img:
+            paths.insert(0, os.path.join(self.images_dir, img))
+        return paths
+
+    def _set_photo(
+        self, news: News, img_url: str, media: Optional[dict] = None
+    ):
+        """Устанавливает фото для новости.
+
+        Если переданы хэши файлов прошлого импорта и содержимое фото
+        не изменилось, файл не копируется повторно. Если строка больше
+        не ссылается на фото, оно удаляется из новости.
+        """
         img = self.parser.safe_str(img_url).lstrip('/')
         if not img:
+            if media is not None:
+                news.photo = None
+                media.pop('photo', None)
             return
         photo_path = os.path.join(self.images_dir, img)
         if os.path.isfile(photo_path):
+            if media is not None:
+                photo_hash = get_file_hash(photo_path)
+                if media.get('photo') == photo_hash and news.photo:
+                    return
+                media['photo'] = photo_hash
             with open(photo_path, 'rb') as f:
                 news.photo.save(os.path.basename(img), File(f), save=False)
 
     def _set_directions(self, news: News, ntype: str):
-        """Устанавливает направления для новости."""
+        """Запоминает направления новости для записи в save_directions."""
         directions_value = self.parser.safe_str(ntype)
         if not directions_value:
             return
-        directions = []
+        direction_ids = set()
         for direction_index in directions_value.split(','):
             direction_index = direction_index.strip()
             if direction_index and direction_index in DIRECTION_MAP:
-                direction = Direction.objects.filter(
-                    name=DIRECTION_MAP[direction_index]
-                ).first()
+                direction = self.directions.get(DIRECTION_MAP[direction_index])
                 if direction:
-                    directions.append(direction)
-        if directions:
-            news.directions.set(directions)
+                    direction_ids.add(direction.pk)
+        self.direction_links.extend(
+            News.directions.through(news_id=news.pk, direction_id=pk)
+            for pk in direction_ids
+        )
 
-    def _create_gallery(self, news: News, gallery: str):
-        """Создает галерею для новости."""
+    def save_directions(self) -> int:
+        """Записывает связи новостей с направлениями одним bulk_create.
+
+        bulk_create не отправляет m2m_changed, поэтому версии контента
+        News и Direction увеличиваются явно после фиксации транзакции.
+        """
+        links = self.direction_links
+        News.directions.through.objects.bulk_create(
+            links, batch_size=DIRECTION_LINKS_BATCH_SIZE
+        )
+        self.direction_links = []
+        if links:
+            transaction.on_commit(partial(bump_content_version, News))
+            transaction.on_commit(partial(bump_content_version, Direction))
+        return len(links)
+
+    def _iter_gallery_paths(self, gallery: str) -> Iterator[str]:
+        """Отдаёт пути и ссылки изображений галереи новости."""
         gal = self.parser.safe_str(gallery)
         if not gal:
             return
         for img_path in re.split(r'[;,]', gal):
             img_path = img_path.replace(r'\r\n', '').strip().lstrip('/')
-            if not img_path:
-                continue
-            if img_path.startswith(('http://', 'https://')):
+            if img_path:
+                yield img_path
+
+    def prefetch_gallery(self, news_rows: Iterable[List[str]]) -> int:
+        """Заранее скачивает изображения галерей по ссылкам."""
+        urls = [
+            img_path
+            for news_data in news_rows
+            if self.parser.safe_str(news_data[1]) not in SKIP_DIRECTIONS
+            for img_path in self._iter_gallery_paths(news_data[7])
+            if img_path.startswith(URL_PREFIXES)
+        ]
+        return self.downloader.prefetch(urls)
+
+    def _create_gallery(self, news: News, gallery: str):
+        """Создает галерею для новости."""
+        for img_path in self._iter_gallery_paths(gallery):
+            if img_path.startswith(URL_PREFIXES):
                 self._download_gallery_image(news, img_path)
             else:
                 self._load_local_gallery_image(news, img_path)
 
+    def _save_gallery_image(
+        self, news: News, img_filename: str, content: bytes, sha256: str
+    ):
+        """Создаёт изображение галереи, не дублируя одинаковые файлы."""
+        gal_img = GalleryImage(news=news, name=img_filename)
+        if sha256 in self.stored_images:
+            gal_img.image.name = self.stored_images[sha256]
+            gal_img.save()
+        else:
+            gal_img.image.save(img_filename, ContentFile(content), save=True)
+            self.stored_images[sha256] = gal_img.image.name
+        self.current_gallery[sha256] = gal_img.image.name
+
     def _download_gallery_image(self, news: News, img_url: str):
-        """Скачивает изображение из интернета."""
-        try:
-            resp = requests.get(img_url, timeout=10)
-            if resp.status_code == 200:
-                img_filename = os.path.basename(img_url.split('?')[0])
-                gal_img = GalleryImage(news=news, name=img_filename)
-                gal_img.image.save(
-                    img_filename, ContentFile(resp.content), save=True
-                )
-            else:
-                self.stdout.write(
-                    f'Не удалось скачать {img_url} (статус {resp.status_code})'
-                )
-        except Exception as e:
-            self.stdout.write(f'Ошибка скачивания {img_url}: {e}')
+        """Создаёт изображение галереи из кэша скачанных файлов."""
+        entry = self.downloader.get(img_url)
+        if entry is None:
+            self.stdout.write(self.downloader.errors[img_url])
+            return
+        path = self.downloader.get_cache_path(entry['sha256'])
+        with open(path, 'rb') as f:
+            content = f.read()
+        self._save_gallery_image(
+            news, entry['filename'], content, entry['sha256']
+        )
 
     def _load_local_gallery_image(self, news: News, img_path: str):
         """Загружает локальное изображение."""
         full_path = os.path.join(self.images_dir, img_path)
         if os.path.isfile(full_path):
             with open(full_path, 'rb') as f:
-                img_filename = os.path.basename(img_path)
-                gal_img = GalleryImage(news=news, name=img_filename)
-                gal_img.image.save(img_filename, File(f), save=True)
+                content = f.read()
+            self._save_gallery_image(
+                news,
+                os.path.basename(img_path),
+                content,
+                hashlib.sha256(content).hexdigest(),
+            )
         else:
             self.stdout.write(f'Файл галереи {img_path} не найден')
 
@@ -273,34 +630,100 @@ class Command(BaseCommand):
 
     help = 'Импортирует новости из SQL-дампа'
 
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--download-workers',
+            type=int,
+            default=DOWNLOAD_WORKERS,
+            help='Число потоков загрузки изображений галерей',
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help=(
+                'Инкрементальный импорт: обновить изменённые новости '
+                'и добавить новые без удаления существующих'
+            ),
+        )
+        parser.add_argument(
+            '--delete-missing',
+            action='store_true',
+            help='При --sync удалить новости, которых нет в дампе',
+        )
+
     def handle(self, *args, **options):
         """Основной метод выполнения команды."""
+        if options['delete_missing'] and not options['sync']:
+            raise CommandError('--delete-missing используется только с --sync')
         sql_path = 'data/dump.sql'
         images_dir = 'media_data/'
-        with open(sql_path, encoding='utf-8') as f:
-            sql = f.read()
         parser = SQLParser()
-        processor = NewsProcessor(images_dir, self.stdout)
-        project_map = self._load_projects(parser, sql)
-        GalleryImage.objects.all().delete()
-        News.objects.all().delete()
-        count = 0
-        news_data_list = parser.extract_table_data(sql, 'news')
-        for news_data in news_data_list:
-            news = processor.process_news(news_data, project_map)
-            if news:
-                self.stdout.write(
-                    self.style.SUCCESS(f'Новость "{news.title}" импортирована')
-                )
-                count += 1
+        processor = NewsProcessor(
+            images_dir,
+            self.stdout,
+            download_workers=options['download_workers'],
+        )
+        with open(sql_path, encoding='utf-8') as f:
+            project_map = self._load_projects(parser, f)
+        with open(sql_path, encoding='utf-8') as f:
+            downloaded = processor.prefetch_gallery(
+                parser.iter_table_data(f, 'news')
+            )
+        self.stdout.write(f'Скачано изображений галерей: {downloaded}')
+        with transaction.atomic():
+            count = self.import_news(
+                processor, parser, sql_path, project_map, options
+            )
         self.stdout.write(
             self.style.SUCCESS(f'Импорт завершён. Всего новостей: {count}')
         )
 
-    def _load_projects(self, parser: SQLParser, sql: str) -> Dict[str, str]:
+    def import_news(
+        self,
+        processor: NewsProcessor,
+        parser: SQLParser,
+        sql_path: str,
+        project_map: Dict[str, str],
+        options: dict,
+    ) -> int:
+        """Записывает новости дампа и их связи с направлениями.
+
+        Вызывается в транзакции, поэтому очистка таблиц без --sync
+        фиксируется только вместе с импортированными новостями.
+        """
+        if options['sync']:
+            processor.sync = ImportSync(News, NEWS_NATURAL_KEY)
+        else:
+            GalleryImage.objects.all().delete()
+            News.objects.all().delete()
+        count = 0
+        with open(sql_path, encoding='utf-8') as f:
+            for news_data in parser.iter_table_data(f, 'news'):
+                news = processor.process_news(news_data, project_map)
+                if news:
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f'Новость "{news.title}" импортирована'
+                        )
+                    )
+                    count += 1
+        links_count = processor.save_directions()
+        self.stdout.write(f'Создано связей с направлениями: {links_count}')
+        if processor.sync is not None:
+            if options['delete_missing']:
+                processor.sync.delete_missing()
+            self.stdout.write(
+                f'Синхронизация: {processor.sync.get_summary()}'
+            )
+        return count
+
+    def _load_projects(
+        self, parser: SQLParser, file: TextIO
+    ) -> Dict[str, str]:
         """Загружает карту проектов."""
         project_map = {}
-        projects_data = parser.extract_table_data(sql, 'projects')
+        projects_data = parser.iter_table_data(file, 'projects')
         for pid, sort, name, description in projects_data:
             project_map[parser.safe_str(pid)] = parser.safe_str(name)
         return project_map
@@ -14,6 +14,7 @@ class Command(ImporterBase):
     model_class = Partner
     file_path = 'partners.txt'
     model_config: Any = MODEL_CONFIG[model_class]
+    media_columns = ('logo',)
 
     def post_process_instance(self, instance, row, row_num):
         """Выполняет дополнительную обработку после создания партнера."""
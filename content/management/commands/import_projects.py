@@ -1,13 +1,46 @@
-"""Django management команда для импорта проектов из projects.xlsx."""
+"""Django management команда для импорта проектов из projects.xlsx.
+
+С флагом --sync проекты не удаляются перед импортом: строки таблицы
+сопоставляются с проектами по названию (см. content.management.sync),
+обновляются только изменившиеся, а логотипы и фотографии с прежним
+содержимым не копируются повторно. Содержимое файлов логотипа
+и фотографий входит в хэш строки, поэтому файл, заменённый под тем же
+путём, обновляет проект.
+"""
 
 import os
 import pandas as pd
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.core.files import File
 
+from content.management.config import MODEL_CONFIG
+from content.management.sync import (
+    STATUS_UNCHANGED,
+    DuplicateKeyError,
+    ImportSync,
+    get_file_hash,
+    get_row_hash,
+)
 from content.models import Project, ProgramsProjects, Partner, ProjectPhoto
 
+STATUS_MAP = {
+    'действующий': 'active',
+    'завершен': 'completed',
+}
+PROJECT_SYNC_FIELDS = (
+    'title',
+    'status',
+    'project_start',
+    'project_end',
+    'source_financing',
+    'program',
+    'project_goal',
+    'project_tasks',
+    'project_description',
+    'achieved_results',
+)
+
 
 def safe_date(value):
     """Преобразует значение в объект даты."""
@@ -30,126 +63,225 @@ class Command(BaseCommand):
 
     help = 'Импортирует проекты из Excel в базу данных'
 
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help=(
+                'Инкрементальный импорт: обновить изменённые проекты '
+                'и добавить новые без удаления существующих'
+            ),
+        )
+        parser.add_argument(
+            '--delete-missing',
+            action='store_true',
+            help='При --sync удалить проекты, которых нет в файле',
+        )
+
     def handle(self, *args, **options):
         """Основной метод для выполнения команды импорта."""
+        if options['delete_missing'] and not options['sync']:
+            raise CommandError('--delete-missing используется только с --sync')
         excel_path = 'data/projects.xlsx'
-        images_dir = 'media_data/'
-        self.stdout.write(
-            self.style.WARNING('Удаляем все проекты и связанные фотографии...')
-        )
-        ProjectPhoto.objects.all().delete()
-        Project.objects.all().delete()
-        self.stdout.write(
-            self.style.SUCCESS('Все проекты и фотографии удалены.')
-        )
-        STATUS_MAP = {
-            'действующий': 'active',
-            'завершен': 'completed',
-        }
+        self.images_dir = 'media_data/'
+        self.stored_images = {}
+        sync = None
+        if options['sync']:
+            sync = ImportSync(Project, MODEL_CONFIG[Project]['natural_key'])
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    'Удаляем все проекты и связанные фотографии...'
+                )
+            )
+            ProjectPhoto.objects.all().delete()
+            Project.objects.all().delete()
+            self.stdout.write(
+                self.style.SUCCESS('Все проекты и фотографии удалены.')
+            )
         data_frame = pd.read_excel(excel_path)
         for index, row in data_frame.iterrows():
             row_num = index + 2
             if pd.isna(row['title']):
                 continue
-            program_title = (
-                row['program'] if pd.notna(row['program']) else None
-            )
-            program = None
-            if program_title:
-                program, created = ProgramsProjects.objects.get_or_create(
-                    title=program_title.strip()
+            project = self.build_project(row, row_num)
+            media = None
+            if sync is not None:
+                content_hash = get_row_hash(
+                    row.to_dict(), self.get_media_paths(row)
                 )
-                if created:
+                try:
+                    status, existing = sync.lookup(project, content_hash)
+                except DuplicateKeyError as e:
                     self.stdout.write(
-                        self.style.SUCCESS(
-                            f"[{row_num}] Программа '{program_title}' "
-                            'была создана.'
-                        )
-                    )
-            partner_title = (
-                row['source_financing']
-                if pd.notna(row['source_financing'])
-                else None
-            )
-            partner = None
-            if partner_title:
-                partner = Partner.objects.filter(
-                    name=partner_title.strip()
-                ).first()
-                if not partner:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f'[{row_num}] Партнёр '
-                            f"'{partner_title}' не найден. "
-                            'Проект будет добавлен без него.'
-                        )
+                        self.style.ERROR(f'Ошибка в строке {row_num}: {e}')
                     )
-            status = STATUS_MAP.get(
-                str(row['status']).strip().lower(), 'active'
-            )
-            logo_file = None
-            if pd.notna(row['logo']) and row['logo'].strip():
-                logo_path = os.path.join(
-                    images_dir, row['logo'].strip().lstrip('/')
-                )
-                if os.path.isfile(logo_path):
-                    logo_file = File(open(logo_path, 'rb'))
-                else:
-                    self.stdout.write(
-                        self.style.WARNING(
-                            f"[{row_num}] Логотип '{logo_path}' не найден. "
-                            'Проект будет без логотипа.'
+                    continue
+                if status == STATUS_UNCHANGED:
+                    continue
+                media = sync.get_media_hashes(project)
+                if existing is not None:
+                    for field_name in PROJECT_SYNC_FIELDS:
+                        setattr(
+                            existing, field_name, getattr(project, field_name)
                         )
-                    )
-            project = Project(
-                title=row['title'],
-                status=status,
-                project_start=safe_date(row.get('project_start'))
-                if pd.notna(row['project_start'])
-                else None,
-                project_end=safe_date(row.get('project_end'))
-                if pd.notna(row['project_end'])
-                else None,
-                source_financing=partner,
-                program=program,
-                project_goal=safe_str(row.get('project_goal')),
-                project_tasks=safe_str(row.get('project_tasks')),
-                project_description=safe_str(row.get('project_description')),
-                achieved_results=safe_str(row.get('achieved_results')),
-            )
-            if logo_file:
-                project.logo.save(
-                    os.path.basename(row['logo'].strip()),
-                    logo_file,
-                    save=False,
-                )
+                    project = existing
+                    project.photos.all().delete()
+                    self.stored_images.update(media.get('photos', {}))
+            self.save_logo(project, row, row_num, media)
             project.save()
             self.stdout.write(
                 self.style.SUCCESS(
                     f"[{row_num}] Проект '{project.title}' добавлен."
                 )
             )
-            if pd.notna(row.get('photo')):
-                for img_path in str(row['photo']).split('\n'):
-                    img_path = img_path.strip().lstrip('/')
-                    if not img_path:
-                        continue
-                    photo_path = os.path.join(images_dir, img_path)
-                    if os.path.isfile(photo_path):
-                        with open(photo_path, 'rb') as img_f:
-                            photo_file = File(img_f)
-                            photo_obj = ProjectPhoto(project=project)
-                            photo_obj.image.save(
-                                os.path.basename(img_path),
-                                photo_file,
-                                save=True,
-                            )
-                            self.stdout.write(f'Фото: {photo_obj.image.url}')
-                    else:
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Фото '{photo_path}' не найдено. "
-                                'Пропущено.'
-                            )
-                        )
+            photos = self.save_photos(project, row)
+            if sync is not None:
+                media['photos'] = photos
+                sync.save_record(project, content_hash, media)
+        if sync is not None:
+            if options['delete_missing']:
+                sync.delete_missing()
+            self.stdout.write(f'Синхронизация: {sync.get_summary()}')
         self.stdout.write(self.style.SUCCESS('Импорт завершён!'))
+
+    def build_project(self, row, row_num: int) -> Project:
+        """Собирает несохранённый проект из строки таблицы."""
+        program_title = row['program'] if pd.notna(row['program']) else None
+        program = None
+        if program_title:
+            program, created = ProgramsProjects.objects.get_or_create(
+                title=program_title.strip()
+            )
+            if created:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"[{row_num}] Программа '{program_title}' "
+                        'была создана.'
+                    )
+                )
+        partner_title = (
+            row['source_financing']
+            if pd.notna(row['source_financing'])
+            else None
+        )
+        partner = None
+        if partner_title:
+            partner = Partner.objects.filter(
+                name=partner_title.strip()
+            ).first()
+            if not partner:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f'[{row_num}] Партнёр '
+                        f"'{partner_title}' не найден. "
+                        'Проект будет добавлен без него.'
+                    )
+                )
+        status = STATUS_MAP.get(str(row['status']).strip().lower(), 'active')
+        return Project(
+            title=row['title'],
+            status=status,
+            project_start=safe_date(row.get('project_start'))
+            if pd.notna(row['project_start'])
+            else None,
+            project_end=safe_date(row.get('project_end'))
+            if pd.notna(row['project_end'])
+            else None,
+            source_financing=partner,
+            program=program,
+            project_goal=safe_str(row.get('project_goal')),
+            project_tasks=safe_str(row.get('project_tasks')),
+            project_description=safe_str(row.get('project_description')),
+            achieved_results=safe_str(row.get('achieved_results')),
+        )
+
+    def get_media_paths(self, row) -> list[str]:
+        """Возвращает пути к файлам логотипа и фотографий строки."""
+        paths = []
+        if pd.notna(row['logo']) and row['logo'].strip():
+            paths.append(
+                os.path.join(self.images_dir, row['logo'].strip().lstrip('/'))
+            )
+        if pd.notna(row.get('photo')):
+            for img_path in str(row['photo']).split('\n'):
+                img_path = img_path.strip().lstrip('/')
+                if img_path:
+                    paths.append(os.path.join(self.images_dir, img_path))
+        return paths
+
+    def save_logo(
+        self, project: Project, row, row_num: int, media: dict | None
+    ):
+        """Загружает логотип проекта без сохранения проекта.
+
+        Если переданы хэши файлов прошлого импорта и содержимое
+        логотипа не изменилось, файл не копируется повторно. Если строка
+        больше не ссылается на логотип, он удаляется из проекта.
+        """
+        if not (pd.notna(row['logo']) and row['logo'].strip()):
+            if media is not None:
+                project.logo = None
+                media.pop('logo', None)
+            return
+        logo_path = os.path.join(
+            self.images_dir, row['logo'].strip().lstrip('/')
+        )
+        if not os.path.isfile(logo_path):
+            self.stdout.write(
+                self.style.WARNING(
+                    f"[{row_num}] Логотип '{logo_path}' не найден. "
+                    'Проект будет без логотипа.'
+                )
+            )
+            return
+        if media is not None:
+            logo_hash = get_file_hash(logo_path)
+            if media.get('logo') == logo_hash and project.logo:
+                return
+            media['logo'] = logo_hash
+        with open(logo_path, 'rb') as logo_file:
+            project.logo.save(
+                os.path.basename(row['logo'].strip()),
+                File(logo_file),
+                save=False,
+            )
+
+    def save_photos(self, project: Project, row) -> dict:
+        """Создаёт фотографии проекта и возвращает хэши их файлов.
+
+        Фотографии с содержимым, уже сохранённым ранее, ссылаются на
+        существующий файл вместо повторного копирования.
+        """
+        photos = {}
+        if not pd.notna(row.get('photo')):
+            return photos
+        for img_path in str(row['photo']).split('\n'):
+            img_path = img_path.strip().lstrip('/')
+            if not img_path:
+                continue
+            photo_path = os.path.join(self.images_dir, img_path)
+            if not os.path.isfile(photo_path):
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Фото '{photo_path}' не найдено. Пропущено."
+                    )
+                )
+                continue
+            photo_hash = get_file_hash(photo_path)
+            photo_obj = ProjectPhoto(project=project)
+            if photo_hash in self.stored_images:
+                photo_obj.image.name = self.stored_images[photo_hash]
+                photo_obj.save()
+            else:
+                with open(photo_path, 'rb') as img_f:
+                    photo_obj.image.save(
+                        os.path.basename(img_path),
+                        File(img_f),
+                        save=True,
+                    )
+                self.stored_images[photo_hash] = photo_obj.image.name
+            photos[photo_hash] = photo_obj.image.name
+            self.stdout.write(f'Фото: {photo_obj.image.url}')
+        return photos
@@ -0,0 +1,61 @@
+"""Django command для обновления производных изображений.
+
+Команда находит объекты, метаданные изображений которых не
+соответствуют текущему файлу или устаревшей версии формата
+(content.images.IMAGE_META_VERSION), и ставит их обработку в очередь
+фоновых задач. С флагом --now обработка выполняется сразу.
+
+Использование:
+    python manage.py process_images
+    python manage.py process_images --now
+"""
+
+from django.core.management.base import BaseCommand
+
+from content.images import (
+    IMAGE_FIELDS,
+    get_meta_field_name,
+    has_outdated_images,
+    process_instance_images,
+)
+from jobs.queue import enqueue
+
+
+class Command(BaseCommand):
+    """Команда обновления производных изображений."""
+
+    help = 'Создаёт производные и заглушки изображений без метаданных'
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--now',
+            action='store_true',
+            help='Обработать изображения сразу, без очереди задач',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Запускает команду."""
+        for model, field_names in IMAGE_FIELDS.items():
+            fields = [
+                name
+                for field_name in field_names
+                for name in (field_name, get_meta_field_name(field_name))
+            ]
+            count = 0
+            for instance in model.objects.only('pk', *fields).iterator():
+                if not has_outdated_images(instance):
+                    continue
+                if kwargs['now']:
+                    process_instance_images(model, instance.pk)
+                else:
+                    enqueue(
+                        'content.process_images',
+                        model._meta.label,
+                        instance.pk,
+                    )
+                count += 1
+            self.stdout.write(f'{model.__name__}: обработано {count}')
+        self.stdout.write(
+            self.style.SUCCESS('Обновление изображений завершено')
+        )
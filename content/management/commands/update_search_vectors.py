@@ -0,0 +1,45 @@
+"""Django command для пересчёта поисковых векторов.
+
+Команда заново строит поисковые векторы (content.search) всех объектов
+моделей поиска. Запускается после применения миграции, добавившей
+векторы, и после изменения полей или весов SEARCH_MODELS.
+
+Использование:
+    python manage.py update_search_vectors
+    python manage.py update_search_vectors --type news
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from content.search import (
+    SEARCH_MODELS,
+    is_search_supported,
+    update_search_vectors,
+)
+
+
+class Command(BaseCommand):
+    """Команда пересчёта поисковых векторов."""
+
+    help = 'Пересчитывает поисковые векторы объектов контента'
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--type',
+            action='append',
+            choices=list(SEARCH_MODELS),
+            dest='types',
+            help='Тип результатов поиска (можно указать несколько раз)',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Запускает команду."""
+        if not is_search_supported():
+            raise CommandError(
+                'Полнотекстовый поиск доступен только в PostgreSQL'
+            )
+        for name in kwargs['types'] or SEARCH_MODELS:
+            count = update_search_vectors(SEARCH_MODELS[name]['model'])
+            self.stdout.write(f'{name}: обновлено {count}')
+        self.stdout.write(self.style.SUCCESS('Поисковые векторы обновлены'))
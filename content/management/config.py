@@ -17,6 +17,8 @@
         - required (bool, optional): признак обязательности поля(Employee).
     - required_fields (list[str], optional): список обязательных колонок
       в исходных данных для успешной загрузки строки.
+    - natural_key (list[str], optional): поля модели, по которым строка
+      сопоставляется с существующим объектом при импорте с --sync.
 
 Этот конфиг используется в скриптах импорта для унификации логики
 обработки и валидации данных перед их сохранением в базу данных.
@@ -49,6 +51,7 @@ MODEL_CONFIG = {
             'is_active': {'default': True},
         },
         'required_fields': ['file'],
+        'natural_key': ['title'],
     },
     Direction: {
         'fields': {
@@ -59,6 +62,7 @@ MODEL_CONFIG = {
                 'source': 'slug',
             },
         },
+        'natural_key': ['slug'],
     },
     Review: {
         'fields': {
@@ -78,6 +82,7 @@ MODEL_CONFIG = {
                 in ['1', 'true', 'да'],
             },
         },
+        'natural_key': ['author_name', 'content'],
     },
     Partner: {
         'fields': {
@@ -91,6 +96,7 @@ MODEL_CONFIG = {
             },
         },
         'required_fields': ['logo'],
+        'natural_key': ['name'],
     },
     TargetedFundraising: {
         'fields': {
@@ -111,6 +117,7 @@ MODEL_CONFIG = {
             },
         },
         'required_fields': ['title', 'short_description'],
+        'natural_key': ['title'],
     },
     Employee: {
         'fields': {
@@ -166,6 +173,7 @@ MODEL_CONFIG = {
             'achieved_results': {'default': ''},
         },
         'required_fields': ['title'],
+        'natural_key': ['title'],
     },
 }
 
@@ -0,0 +1,215 @@
+"""Инкрементальный импорт (режим --sync).
+
+Этот модуль содержит:
+- get_content_hash: хэш содержимого строки источника.
+- get_file_hash: хэш содержимого файла.
+- get_row_hash: хэш строки вместе с файлами, на которые она ссылается.
+- DuplicateKeyError: повтор естественного ключа в источнике.
+- ImportSync: сопоставление строк источника с объектами модели.
+
+Вместо удаления и повторной загрузки всех записей каждая строка
+источника сопоставляется с объектом по естественному ключу (набору
+полей модели) через модель ImportedRecord. Строки с неизменным хэшем
+пропускаются, изменённые обновляют существующий объект с сохранением
+первичного ключа, новые создаются. В хэш строки входит содержимое
+локальных файлов, на которые она ссылается, поэтому файл, заменённый
+под тем же путём, тоже обновляет объект. Хэши файлов хранятся в записи,
+поэтому файл с тем же содержимым повторно не копируется. Объекты,
+которых больше нет в источнике, удаляются по флагу --delete-missing.
+Для объектов, загруженных до появления режима, запись ImportedRecord
+отсутствует, и объект ищется по полям естественного ключа.
+Строка с естественным ключом, уже встречавшимся в источнике, не
+сопоставляется с объектом предыдущей строки, а считается ошибкой.
+"""
+
+import hashlib
+import json
+import os
+from collections import Counter
+
+from django.db import models
+
+from content.models import ImportedRecord
+
+STATUS_NEW = 'new'
+STATUS_CHANGED = 'changed'
+STATUS_UNCHANGED = 'unchanged'
+NATURAL_KEY_MAX_LENGTH = ImportedRecord._meta.get_field(
+    'natural_key'
+).max_length
+
+
+def get_content_hash(data) -> str:
+    """Возвращает SHA-256 данных строки, сериализованных в JSON."""
+    content = json.dumps(
+        data, sort_keys=True, ensure_ascii=False, default=str
+    ).encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_file_hash(path: str) -> str:
+    """Возвращает SHA-256 содержимого файла."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+def get_row_hash(data, paths) -> str:
+    """Возвращает хэш данных строки и содержимого её файлов.
+
+    Args:
+        data: Данные строки источника.
+        paths: Пути к локальным файлам, на которые ссылается строка.
+            Отсутствующие файлы не учитываются.
+
+    Returns:
+        SHA-256 данных строки, если строка не ссылается на файлы,
+        иначе SHA-256 данных вместе с хэшами файлов.
+    """
+    file_hashes = {
+        path: get_file_hash(path) for path in paths if os.path.isfile(path)
+    }
+    if not file_hashes:
+        return get_content_hash(data)
+    return get_content_hash([data, file_hashes])
+
+
+class DuplicateKeyError(ValueError):
+    """Естественный ключ строки уже встречался в источнике."""
+
+
+class ImportSync:
+    """Состояние инкрементального импорта одной модели.
+
+    Args:
+        model: Класс импортируемой модели.
+        key_fields: Поля модели, образующие естественный ключ.
+    """
+
+    def __init__(self, model: type[models.Model], key_fields):
+        """Загружает записи ImportedRecord модели."""
+        self.model = model
+        self.label = model._meta.label
+        self.key_fields = tuple(key_fields)
+        self.records = {
+            record.natural_key: record
+            for record in ImportedRecord.objects.filter(model=self.label)
+        }
+        self.seen = set()
+        self.statuses = {}
+        self.stats = Counter()
+
+    def get_key(self, instance: models.Model) -> str:
+        """Возвращает естественный ключ объекта.
+
+        Ключи длиннее поля ImportedRecord.natural_key заменяются
+        их хэшем.
+        """
+        key = json.dumps(
+            [str(getattr(instance, field)) for field in self.key_fields],
+            ensure_ascii=False,
+        )
+        if len(key) > NATURAL_KEY_MAX_LENGTH:
+            return f'sha256:{hashlib.sha256(key.encode()).hexdigest()}'
+        return key
+
+    def lookup(
+        self, instance: models.Model, content_hash: str
+    ) -> tuple[str, models.Model | None]:
+        """Находит объект для строки и определяет, изменилась ли она.
+
+        Новые и изменённые строки попадают в сводку только после
+        сохранения записи (save_record), чтобы строки с ошибкой
+        не учитывались.
+
+        Args:
+            instance: Несохранённый объект, собранный из строки.
+            content_hash: Хэш содержимого строки.
+
+        Returns:
+            Статус строки (new, changed, unchanged) и существующий объект.
+
+        Raises:
+            DuplicateKeyError: Ключ строки уже встречался в источнике.
+        """
+        key = self.get_key(instance)
+        if key in self.seen:
+            self.stats['duplicate'] += 1
+            raise DuplicateKeyError(
+                f'естественный ключ {key} повторяется в источнике'
+            )
+        self.seen.add(key)
+        record = self.records.get(key)
+        if record is not None:
+            existing = self.model.objects.filter(pk=record.object_id).first()
+        else:
+            existing = self.model.objects.filter(
+                **{
+                    field: getattr(instance, field)
+                    for field in self.key_fields
+                }
+            ).first()
+        if existing is None:
+            status = STATUS_NEW
+        elif record is not None and record.content_hash == content_hash:
+            status = STATUS_UNCHANGED
+        else:
+            status = STATUS_CHANGED
+        if status == STATUS_UNCHANGED:
+            self.stats[status] += 1
+        else:
+            self.statuses[key] = status
+        return status, existing
+
+    def get_media_hashes(self, instance: models.Model) -> dict:
+        """Возвращает копию сохранённых хэшей файлов объекта."""
+        record = self.records.get(self.get_key(instance))
+        return dict(record.media_hashes) if record is not None else {}
+
+    def save_record(
+        self,
+        instance: models.Model,
+        content_hash: str,
+        media_hashes: dict | None = None,
+    ):
+        """Сохраняет запись о загруженном объекте."""
+        key = self.get_key(instance)
+        record = self.records.get(key) or ImportedRecord(
+            model=self.label, natural_key=key
+        )
+        record.object_id = instance.pk
+        record.content_hash = content_hash
+        if media_hashes is not None:
+            record.media_hashes = media_hashes
+        record.save()
+        self.records[key] = record
+        self.stats[self.statuses.pop(key, STATUS_CHANGED)] += 1
+
+    def delete_missing(self) -> int:
+        """Удаляет объекты, строк которых больше нет в источнике."""
+        missing = [
+            record
+            for key, record in self.records.items()
+            if key not in self.seen
+        ]
+        if not missing:
+            return 0
+        self.model.objects.filter(
+            pk__in=[record.object_id for record in missing]
+        ).delete()
+        ImportedRecord.objects.filter(
+            pk__in=[record.pk for record in missing]
+        ).delete()
+        for record in missing:
+            del self.records[record.natural_key]
+        self.stats['deleted'] += len(missing)
+        return len(missing)
+
+    def get_summary(self) -> str:
+        """Возвращает сводку по статусам строк."""
+        return (
+            f'новых: {self.stats[STATUS_NEW]}, '
+            f'изменено: {self.stats[STATUS_CHANGED]}, '
+            f'без изменений: {self.stats[STATUS_UNCHANGED]}, '
+            f'удалено: {self.stats["deleted"]}, '
+            f'повторов ключа: {self.stats["duplicate"]}'
+        )
@@ -9,19 +9,54 @@
     delimiter: Разделитель полей в файле.
     clear_before_import: Флаг очистки существующих записей перед импортом.
     model_config: Конфигурация полей модели для импорта.
+    batch_size: Размер пакета bulk_create (0 - построчный импорт).
+    supports_sync: Поддержка инкрементального импорта (--sync).
+    media_columns: Колонки строки с путями к файлам медиа.
 
 Media файлы считываются из папки MEDIA_PATH, данные из папки DATA_PATH.
+
+По умолчанию строки записываются пакетами через bulk_create в одной
+транзакции. Если пакет не удаётся записать целиком, его строки
+записываются по одной в точках сохранения, и ошибки выводятся
+по номерам строк. Поля файлов, сохранённые save_file_to_model во время
+пакетного импорта, записываются через bulk_update. Так как bulk_create
+и bulk_update не отправляют сигналов, версии контента, ссылки на файлы,
+обработка изображений и поисковые векторы обновляются явно.
+
+С флагом --sync таблица не очищается: строки сопоставляются
+с объектами по естественному ключу model_config['natural_key'] (см.
+content.management.sync), обновляются только изменившиеся строки,
+а файлы с неизменным содержимым не копируются повторно. Содержимое
+файлов колонок media_columns входит в хэш строки, поэтому файл,
+заменённый под тем же путём, обновляет объект.
 """
 
 import csv
 import os
+from functools import partial
+from itertools import islice
 
 from django.core.files import File
-from django.core.management.base import BaseCommand
-from django.db import models
+from django.core.management.base import BaseCommand, CommandError
+from django.db import models, transaction
+from ordered_model.models import OrderedModelBase, OrderedModelQuerySet
+
+from content.cache import bump_content_version
+from content.images import IMAGE_FIELDS, has_outdated_images
+from content.media import update_references
+from content.search import SEARCH_TYPES, update_search_vectors
+from content.management.sync import (
+    STATUS_NEW,
+    STATUS_UNCHANGED,
+    ImportSync,
+    get_file_hash,
+    get_row_hash,
+)
+from jobs.queue import enqueue
 
 MEDIA_PATH = 'media_data'
 DATA_PATH = 'data'
+BATCH_SIZE = 500
 
 
 class ImporterBase(BaseCommand):
@@ -32,6 +67,14 @@ class ImporterBase(BaseCommand):
     delimiter = '\t'
     clear_before_import = True
     model_config: dict = {}
+    batch_size = BATCH_SIZE
+    supports_sync = True
+    media_columns: tuple[str, ...] = ()
+    sync = False
+    delete_missing = False
+    _deferred_files: list | None = None
+    _sync_instance: models.Model | None = None
+    _sync_media: dict | None = None
 
     def add_arguments(self, parser):
         """Добавляет аргументы для команды."""
@@ -40,6 +83,27 @@ class ImporterBase(BaseCommand):
             action='store_true',
             help='Не удалять существующие записи перед импортом',
         )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            help=(
+                'Размер пакета при записи через bulk_create '
+                f'(по умолчанию {BATCH_SIZE}, 0 - построчный импорт)'
+            ),
+        )
+        parser.add_argument(
+            '--sync',
+            action='store_true',
+            help=(
+                'Инкрементальный импорт: обновить изменённые записи '
+                'и добавить новые без очистки таблицы'
+            ),
+        )
+        parser.add_argument(
+            '--delete-missing',
+            action='store_true',
+            help='При --sync удалить записи, которых нет в источнике',
+        )
 
     def handle(self, *args, **kwargs):
         """Основной метод команды.
@@ -47,8 +111,20 @@ class ImporterBase(BaseCommand):
         Выполняет валидацию, опциональную очистку данных,
         импорт записей и выводит результат.
         """
+        if kwargs.get('batch_size') is not None:
+            self.batch_size = kwargs['batch_size']
+        self.sync = kwargs.get('sync', False)
+        self.delete_missing = kwargs.get('delete_missing', False)
         self.validate_importer()
-        if self.clear_before_import and not kwargs.get('no_clear'):
+        if self.sync and not self.supports_sync:
+            raise CommandError('Команда не поддерживает режим --sync')
+        if self.delete_missing and not self.sync:
+            raise CommandError('--delete-missing используется только с --sync')
+        if (
+            self.clear_before_import
+            and not kwargs.get('no_clear')
+            and not self.sync
+        ):
             self._clear_existing_data()
         success_count = self.import_data(*args, **kwargs)
         self.stdout.write(
@@ -65,6 +141,8 @@ class ImporterBase(BaseCommand):
             raise ValueError('Не задан путь к файлу')
         if not self.model_config:
             raise ValueError('Не определена конфигурация модели')
+        if self.sync and not self.model_config.get('natural_key'):
+            raise ValueError('Не задан естественный ключ модели')
 
     def import_data(self, *args, **kwargs) -> int:
         """Импортирует данные из CSV/TSV-файла."""
@@ -76,18 +154,224 @@ class ImporterBase(BaseCommand):
         success_count = 0
         with open(data_path, 'r', encoding='utf-8-sig') as f:
             reader = csv.DictReader(f, delimiter=self.delimiter)
-            for row_num, row in enumerate(reader, 1):
-                if self._validate_row(row_num, row):
-                    try:
-                        instance = self.create_instance(row, row_num)
+            rows = (
+                (row_num, row)
+                for row_num, row in enumerate(reader, 1)
+                if self._validate_row(row_num, row)
+            )
+            if self.sync:
+                return self._process_sync(rows)
+            if self.batch_size > 0:
+                return self._process_batches(rows)
+            for row_num, row in rows:
+                try:
+                    instance = self.create_instance(row, row_num)
+                    if self.post_process_instance(instance, row, row_num):
+                        success_count += 1
+                except Exception as e:
+                    self.handle_error(f'Ошибка в строке {row_num}: {str(e)}')
+        return success_count
+
+    def _process_sync(self, rows) -> int:
+        """Инкрементально импортирует строки в одной транзакции."""
+        sync = ImportSync(self.model_class, self.model_config['natural_key'])
+        success_count = 0
+        with transaction.atomic():
+            for row_num, row in rows:
+                try:
+                    with transaction.atomic():
+                        if self.sync_row(sync, row, row_num):
+                            success_count += 1
+                except Exception as e:
+                    self.handle_error(f'Ошибка в строке {row_num}: {str(e)}')
+            if self.delete_missing:
+                sync.delete_missing()
+            transaction.on_commit(
+                partial(bump_content_version, self.model_class)
+            )
+        self.stdout.write(f'Синхронизация: {sync.get_summary()}')
+        return success_count
+
+    def sync_row(self, sync: ImportSync, row: dict, row_num: int) -> bool:
+        """Создаёт или обновляет объект по строке в режиме --sync."""
+        built = self.build_instance(row, row_num)
+        content_hash = get_row_hash(
+            row,
+            [
+                self.get_media_path(row.get(column) or '')
+                for column in self.media_columns
+            ],
+        )
+        status, instance = sync.lookup(built, content_hash)
+        if status == STATUS_UNCHANGED:
+            return True
+        if status == STATUS_NEW:
+            instance = built
+            instance.save(force_insert=True)
+        else:
+            self.update_instance(instance, built)
+            self.clear_related(instance)
+        self._sync_instance = instance
+        self._sync_media = sync.get_media_hashes(instance)
+        try:
+            result = self.post_process_instance(instance, row, row_num)
+            sync.save_record(instance, content_hash, self._sync_media)
+        finally:
+            self._sync_instance = self._sync_media = None
+        return result
+
+    def update_instance(self, instance: models.Model, built: models.Model):
+        """Переносит значения полей из строки в существующий объект.
+
+        Поля файлов заполняются в post_process_instance, а пустой
+        порядок OrderedModel не сбрасывает текущее место объекта.
+        """
+        order_field_name = getattr(self.model_class, 'order_field_name', None)
+        for field_name in self.model_config['fields']:
+            field = self.model_class._meta.get_field(field_name)
+            value = getattr(built, field.attname)
+            if isinstance(field, models.FileField) or (
+                value is None and field_name == order_field_name
+            ):
+                continue
+            setattr(instance, field.attname, value)
+        instance.save()
+
+    def clear_related(self, instance: models.Model):
+        """Удаляет связанные объекты перед повторной пост-обработкой.
+
+        Предназначен для переопределения в подклассах, которые создают
+        связанные объекты в post_process_instance.
+        """
+
+    def _process_batches(self, rows) -> int:
+        """Импортирует строки пакетами по batch_size в одной транзакции."""
+        success_count = 0
+        with transaction.atomic():
+            while chunk := list(islice(rows, self.batch_size)):
+                success_count += self._process_chunk(chunk)
+            if self.model_class in SEARCH_TYPES:
+                update_search_vectors(self.model_class)
+            transaction.on_commit(
+                partial(bump_content_version, self.model_class)
+            )
+        return success_count
+
+    def _process_chunk(self, chunk: list[tuple[int, dict]]) -> int:
+        """Записывает пакет строк и выполняет их пост-обработку."""
+        prepared = []
+        for row_num, row in chunk:
+            try:
+                instance = self.build_instance(row, row_num)
+            except Exception as e:
+                self.handle_error(f'Ошибка в строке {row_num}: {str(e)}')
+                continue
+            prepared.append((row_num, row, instance))
+        created = self.bulk_insert(prepared)
+        if (
+            type(self).post_process_instance
+            is ImporterBase.post_process_instance
+        ):
+            return len(created)
+        success_count = 0
+        self._deferred_files = []
+        try:
+            for row_num, row, instance in created:
+                try:
+                    with transaction.atomic():
                         if self.post_process_instance(instance, row, row_num):
                             success_count += 1
-                    except Exception as e:
-                        self.handle_error(
-                            f'Ошибка в строке {row_num}: {str(e)}'
-                        )
+                except Exception as e:
+                    self.handle_error(
+                        f'Ошибка в строке {row_num}: {str(e)}'
+                    )
+            self._save_deferred_files()
+        finally:
+            self._deferred_files = None
         return success_count
 
+    def bulk_insert(
+        self, prepared: list[tuple[int, dict, models.Model]]
+    ) -> list[tuple[int, dict, models.Model]]:
+        """Записывает пакет объектов и возвращает записанные строки.
+
+        Пакет записывается одним bulk_create. При ошибке строки
+        записываются по одной, а ошибочные пропускаются.
+        """
+        instances = [instance for *_, instance in prepared]
+        self.assign_order_values(instances)
+        queryset = self.model_class._default_manager.all()
+        try:
+            with transaction.atomic():
+                if isinstance(queryset, OrderedModelQuerySet):
+                    # OrderedModelQuerySet.bulk_create перезаписывает
+                    # порядок всех объектов, в том числе заданный в файле.
+                    models.QuerySet.bulk_create(queryset, instances)
+                else:
+                    queryset.bulk_create(instances)
+            return prepared
+        except Exception as e:
+            self.stdout.write(
+                self.style.WARNING(
+                    f'Пакет не записан ({str(e)}), строки записываются '
+                    'по одной'
+                )
+            )
+        created = []
+        for row_num, row, instance in prepared:
+            try:
+                with transaction.atomic():
+                    instance.save(force_insert=True)
+            except Exception as e:
+                self.handle_error(str(e), row_num)
+                continue
+            created.append((row_num, row, instance))
+        return created
+
+    def assign_order_values(self, instances: list[models.Model]):
+        """Назначает порядок объектам OrderedModel без явного значения.
+
+        Максимальный порядок запрашивается один раз на группу
+        order_with_respect_to, а не для каждого объекта, как при save().
+        """
+        if not issubclass(self.model_class, OrderedModelBase):
+            return
+        order_field_name = self.model_class.order_field_name
+        next_orders = {}
+        for instance in instances:
+            if getattr(instance, order_field_name) not in (None, ''):
+                continue
+            group = tuple(instance._wrt_map().items())
+            if group not in next_orders:
+                next_orders[group] = (
+                    instance.get_ordering_queryset().get_next_order()
+                )
+            setattr(instance, order_field_name, next_orders[group])
+            next_orders[group] += 1
+
+    def _save_deferred_files(self):
+        """Записывает поля файлов, отложенные при пакетном импорте."""
+        groups = {}
+        for instance, field_name in self._deferred_files:
+            field_names, instances = groups.setdefault(
+                type(instance), (set(), {})
+            )
+            field_names.add(field_name)
+            instances[instance.pk] = instance
+        for model, (field_names, instances) in groups.items():
+            model.objects.bulk_update(instances.values(), field_names)
+            update_references(model, instances.values())
+            transaction.on_commit(partial(bump_content_version, model))
+            if model not in IMAGE_FIELDS:
+                continue
+            for instance in instances.values():
+                if has_outdated_images(instance):
+                    enqueue(
+                        'content.process_images',
+                        model._meta.label,
+                        instance.pk,
+                    )
+
     def handle_error(self, message: str, row_num: int | None = None):
         """Унифицированная обработка ошибок при импорте."""
         error_msg = (
@@ -97,6 +381,12 @@ class ImporterBase(BaseCommand):
 
     def create_instance(self, row: dict, row_num: int) -> models.Model:
         """Создает экземпляр модели на основе строки данных."""
+        instance = self.build_instance(row, row_num)
+        instance.save(force_insert=True)
+        return instance
+
+    def build_instance(self, row: dict, row_num: int) -> models.Model:
+        """Собирает несохранённый экземпляр модели из строки данных."""
         config = self.model_config
         model_fields = {}
         for field, mapping in config['fields'].items():
@@ -115,7 +405,7 @@ class ImporterBase(BaseCommand):
                     )
                     value = default
             model_fields[field] = value
-        return self.model_class.objects.create(**model_fields)
+        return self.model_class(**model_fields)
 
     def post_process_instance(
         self, instance: models.Model, row: dict, row_num: int
@@ -172,7 +462,13 @@ class ImporterBase(BaseCommand):
         field_name: str = 'file',
         filename: str | None = None,
     ) -> bool:
-        """Сохраняет файл в поле модели."""
+        """Сохраняет файл в поле модели.
+
+        Во время пакетного импорта поле записывается в базу позже,
+        одним bulk_update на пакет. В режиме --sync файл с тем же
+        содержимым, что при прошлом импорте, не копируется. Производные
+        изображений создаются воркером фоновых задач (команда run_jobs).
+        """
         if not file_path:
             return False
         abs_path = self.get_media_path(file_path)
@@ -182,14 +478,25 @@ class ImporterBase(BaseCommand):
                     self.style.ERROR(f'Файл не найден: {abs_path}')
                 )
                 return False
+            if instance is self._sync_instance:
+                file_hash = get_file_hash(abs_path)
+                if (
+                    self._sync_media.get(field_name) == file_hash
+                    and getattr(instance, field_name)
+                ):
+                    return True
+                self._sync_media[field_name] = file_hash
             if not filename:
                 filename = os.path.basename(abs_path)
+            deferred = self._deferred_files is not None
             with open(abs_path, 'rb') as file_obj:
                 getattr(instance, field_name).save(
                     filename,
                     File(file_obj),
-                    save=True,
+                    save=not deferred,
                 )
+            if deferred:
+                self._deferred_files.append((instance, field_name))
             self.stdout.write(
                 f"Файл '{filename}' сохранен в поле {field_name}"
             )
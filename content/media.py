@@ -0,0 +1,170 @@
+"""Учёт ссылок на медиафайлы и удаление неиспользуемых файлов.
+
+Этот модуль содержит:
+- get_file_fields: поля файлов модели.
+- get_instance_files: файлы хранилища, на которые ссылается объект.
+- update_references: обновление ссылок объектов.
+- delete_references: удаление ссылок удалённого объекта.
+- rebuild_references: пересоздание всех ссылок по объектам моделей.
+- collect_garbage: удаление файлов без ссылок.
+
+Учитываются только файлы, адресуемые по содержимому (content.storage):
+значения полей файлов и производные из JSON полей <поле>_meta
+(content.images). Ссылки обновляются сигналами и явными вызовами там,
+где объекты записываются без сигналов (bulk_update, update()).
+Так как эти пути не исчерпывают все способы изменения данных,
+collect_garbage перед удалением пересоздаёт ссылки по всем объектам.
+"""
+
+import os
+import posixpath
+import time
+from functools import cache
+
+from django.apps import apps
+from django.db import models, transaction
+
+from content.models import FileReference
+from content.storage import CAS_DIR, is_content_addressed
+
+GC_GRACE_SECONDS = 24 * 60 * 60
+"""Минимальный возраст файла без ссылок для удаления.
+
+Защищает файлы, сохранённые в хранилище, но ещё не записанные в поле
+объекта (например, во время загрузки или незавершённой транзакции).
+"""
+
+REFERENCES_BATCH_SIZE = 1000
+"""Размер пакета bulk_create при пересоздании ссылок."""
+
+
+@cache
+def get_file_fields(model) -> tuple[models.FileField, ...]:
+    """Возвращает поля файлов модели."""
+    return tuple(
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.FileField)
+    )
+
+
+def get_instance_files(instance) -> set[tuple[str, str]]:
+    """Возвращает пары (поле, файл) для файлов объекта в хранилище.
+
+    Для поля изображения учитываются и файлы производных, перечисленные
+    в JSON поле <поле>_meta.
+    """
+    files = set()
+    for field in get_file_fields(type(instance)):
+        name = getattr(instance, field.attname).name
+        if is_content_addressed(name):
+            files.add((field.name, name))
+        meta = getattr(instance, f'{field.name}_meta', None)
+        if not isinstance(meta, dict):
+            continue
+        for variant in meta.get('variants', {}).values():
+            for variant_name in variant['files'].values():
+                if is_content_addressed(variant_name):
+                    files.add((f'{field.name}_meta', variant_name))
+    return files
+
+
+def build_references(instance) -> list[FileReference]:
+    """Возвращает несохранённые ссылки объекта на файлы."""
+    return [
+        FileReference(
+            name=name,
+            model=instance._meta.label,
+            object_id=str(instance.pk),
+            field_name=field_name,
+        )
+        for field_name, name in sorted(get_instance_files(instance))
+    ]
+
+
+def update_references(model, instances):
+    """Заменяет ссылки объектов модели на их текущие файлы."""
+    instances = [instance for instance in instances if instance.pk]
+    if not instances or not get_file_fields(model):
+        return
+    with transaction.atomic():
+        FileReference.objects.filter(
+            model=model._meta.label,
+            object_id__in=[str(instance.pk) for instance in instances],
+        ).delete()
+        FileReference.objects.bulk_create(
+            [
+                reference
+                for instance in instances
+                for reference in build_references(instance)
+            ],
+            ignore_conflicts=True,
+        )
+
+
+def delete_references(instance):
+    """Удаляет ссылки удалённого объекта."""
+    FileReference.objects.filter(
+        model=instance._meta.label, object_id=str(instance.pk)
+    ).delete()
+
+
+def rebuild_references() -> int:
+    """Пересоздаёт ссылки по всем объектам моделей с полями файлов.
+
+    Возвращает число созданных ссылок.
+    """
+    count = 0
+    with transaction.atomic():
+        FileReference.objects.all().delete()
+        references = []
+        for model in apps.get_models():
+            file_fields = get_file_fields(model)
+            if not file_fields:
+                continue
+            field_names = [
+                name
+                for field in file_fields
+                for name in (field.name, f'{field.name}_meta')
+                if name == field.name or hasattr(model, name)
+            ]
+            queryset = model._default_manager.only('pk', *field_names)
+            for instance in queryset.iterator():
+                references.extend(build_references(instance))
+                if len(references) >= REFERENCES_BATCH_SIZE:
+                    FileReference.objects.bulk_create(references)
+                    count += len(references)
+                    references = []
+        FileReference.objects.bulk_create(references)
+        count += len(references)
+    return count
+
+
+def collect_garbage(
+    storage, grace_seconds: int = GC_GRACE_SECONDS, dry_run: bool = False
+) -> list[str]:
+    """Удаляет файлы хранилища без ссылок и возвращает их имена.
+
+    Ссылки предварительно пересоздаются (rebuild_references). Файлы
+    моложе grace_seconds не удаляются. Хранилище обновляет время
+    изменения файла при повторном сохранении того же содержимого,
+    поэтому файл, снова используемый ещё не сохранённым объектом,
+    тоже считается молодым.
+    """
+    rebuild_references()
+    referenced = set(
+        FileReference.objects.values_list('name', flat=True).distinct()
+    )
+    deadline = time.time() - grace_seconds
+    deleted = []
+    for directory, _, filenames in os.walk(storage.path(CAS_DIR)):
+        relative_dir = os.path.relpath(directory, storage.location)
+        for filename in filenames:
+            name = posixpath.join(*relative_dir.split(os.sep), filename)
+            path = os.path.join(directory, filename)
+            if name in referenced or os.path.getmtime(path) > deadline:
+                continue
+            if not dry_run:
+                os.remove(path)
+            deleted.append(name)
+    return deleted
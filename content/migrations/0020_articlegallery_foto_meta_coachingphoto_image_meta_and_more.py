@@ -0,0 +1,58 @@
+# Generated by Django 4.2 on 2026-10-18 14:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0019_news_news_main_date_idx_news_news_project_date_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articlegallery',
+            name='foto_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='coachingphoto',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='employee',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='fundraisingphoto',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='galleryimage',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='news',
+            name='photo_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='partner',
+            name='logo_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='projectphoto',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='supervisor',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2 on 2026-10-18 14:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0020_articlegallery_foto_meta_coachingphoto_image_meta_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImportedRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model', models.CharField(max_length=100, verbose_name='Модель')),
+                ('natural_key', models.CharField(max_length=255, verbose_name='Естественный ключ')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='ID объекта')),
+                ('content_hash', models.CharField(max_length=64, verbose_name='Хэш содержимого')),
+                ('media_hashes', models.JSONField(blank=True, default=dict, verbose_name='Хэши файлов')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Дата обновления')),
+            ],
+            options={
+                'verbose_name': 'Импортированная запись',
+                'verbose_name_plural': 'Импортированные записи',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='importedrecord',
+            constraint=models.UniqueConstraint(fields=('model', 'natural_key'), name='content_importedrecord_unique_key'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2 on 2026-10-18 14:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0021_importedrecord'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(db_index=True, max_length=255, verbose_name='Файл')),
+                ('model', models.CharField(max_length=100, verbose_name='Модель')),
+                ('object_id', models.CharField(max_length=64, verbose_name='ID объекта')),
+                ('field_name', models.CharField(max_length=100, verbose_name='Поле')),
+            ],
+            options={
+                'verbose_name': 'Ссылка на файл',
+                'verbose_name_plural': 'Ссылки на файлы',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='filereference',
+            constraint=models.UniqueConstraint(fields=('model', 'object_id', 'field_name', 'name'), name='content_filereference_unique_reference'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2 on 2026-10-18 14:45
+
+import content.utils
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0023_search_vectors'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='direction',
+            index=content.utils.TrigramIndex(django.db.models.functions.text.Upper('name'), name='direction_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='employee',
+            index=content.utils.TrigramIndex(django.db.models.functions.text.Upper('name'), name='employee_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='literature',
+            index=content.utils.TrigramIndex(django.db.models.functions.text.Upper('title'), name='literature_title_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='literature',
+            index=content.utils.TrigramIndex(django.db.models.functions.text.Upper('author'), name='literature_author_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='news',
+            index=content.utils.TrigramIndex(django.db.models.functions.text.Upper('title'), name='news_title_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='partner',
+            index=content.utils.TrigramIndex(django.db.models.functions.text.Upper('name'), name='partner_name_trgm_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 4.2 on 2026-10-18 15:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0024_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='articletextblock',
+            name='foto_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='gratitude',
+            name='file_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='literature',
+            name='cover_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='logo_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='trainingandinternshipsphoto',
+            name='image_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+        migrations.AddField(
+            model_name='vacancy',
+            name='photo_meta',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Метаданные изображения'),
+        ),
+    ]
@@ -0,0 +1,99 @@
+# Generated by Django 4.2 on 2026-10-18 15:27
+
+import content.models.employees
+import content.models.knowledge_base
+import content.models.news
+import content.models.targeted_fundraisings
+import content.storage
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0025_image_meta_all'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='articlegallery',
+            name='foto',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to=content.models.knowledge_base.upload_file, validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+        migrations.AlterField(
+            model_name='articletextblock',
+            name='foto',
+            field=models.ImageField(blank=True, storage=content.storage.get_image_storage, upload_to=content.models.knowledge_base.upload_file, validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+        migrations.AlterField(
+            model_name='coachingphoto',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='coaching/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+        migrations.AlterField(
+            model_name='document',
+            name='file',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to=content.models.employees.upload_file, validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Файл документа'),
+        ),
+        migrations.AlterField(
+            model_name='employee',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='team', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фото'),
+        ),
+        migrations.AlterField(
+            model_name='fundraisingphoto',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to=content.models.targeted_fundraisings.upload_file, validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+        migrations.AlterField(
+            model_name='galleryimage',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to=content.models.news.upload_file, validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фото'),
+        ),
+        migrations.AlterField(
+            model_name='gratitude',
+            name='file',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='gratitudes/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Файл благодарности'),
+        ),
+        migrations.AlterField(
+            model_name='literature',
+            name='cover',
+            field=models.ImageField(blank=True, storage=content.storage.get_image_storage, upload_to='', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Обложка'),
+        ),
+        migrations.AlterField(
+            model_name='news',
+            name='photo',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='news_photos/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фото'),
+        ),
+        migrations.AlterField(
+            model_name='partner',
+            name='logo',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='partners/logos/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Логотип партнера'),
+        ),
+        migrations.AlterField(
+            model_name='project',
+            name='logo',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='projects/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Логотип'),
+        ),
+        migrations.AlterField(
+            model_name='projectphoto',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='projects/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+        migrations.AlterField(
+            model_name='supervisor',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='supervisors/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фото'),
+        ),
+        migrations.AlterField(
+            model_name='trainingandinternshipsphoto',
+            name='image',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='training/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+        migrations.AlterField(
+            model_name='vacancy',
+            name='photo',
+            field=models.ImageField(storage=content.storage.get_image_storage, upload_to='vacancies/photos/', validators=[django.core.validators.FileExtensionValidator(['jpg', 'jpeg', 'png', 'webp'])], verbose_name='Фотография'),
+        ),
+    ]
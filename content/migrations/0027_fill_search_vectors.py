@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+def fill_search_vectors(apps, schema_editor):
+    """Заполняет поисковые векторы объектов, созданных до их появления.
+
+    Выражение вектора (поля с весами, очистка HTML) определено
+    в content.search, поэтому используются текущие модели. В базах
+    без полнотекстового поиска векторы не строятся.
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    from content.search import SEARCH_TYPES, update_search_vectors
+
+    for model in SEARCH_TYPES:
+        update_search_vectors(model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0026_image_storage'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+    ]
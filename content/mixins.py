@@ -6,6 +6,16 @@ from django.db import models
 
 from rest_framework.serializers import Serializer
 
+from .api.fieldsets import (
+    defer_unused_rich_text,
+    get_kept_field_names,
+    get_needed_sources,
+    get_sparse_fieldset,
+    prune_queryset,
+    prune_relations,
+    restrict_serializer_fields,
+)
+from .cache import cached_response
 from .constants import ORDER_DEFAULT, TITLE_LENGTH
 
 
@@ -84,3 +94,64 @@ class MultiSerializerViewSetMixin:
             return self.serializer_classes[self.action]
         except (KeyError, TypeError):
             return super().get_serializer_class()
+
+
+class CachedResponseViewSetMixin:
+    """Миксин кэширования ответов list и retrieve в ReadOnly ViewSet.
+
+    Атрибут `cache_models` перечисляет модели, изменение которых
+    должно сбрасывать закэшированные ответы представления.
+    """
+
+    cache_models: tuple[Type[models.Model], ...] = ()
+
+    @cached_response
+    def list(self, request, *args, **kwargs):
+        """Возвращает список объектов, используя кэш ответов."""
+        return super().list(request, *args, **kwargs)
+
+    @cached_response
+    def retrieve(self, request, *args, **kwargs):
+        """Возвращает объект по идентификатору, используя кэш ответов."""
+        return super().retrieve(request, *args, **kwargs)
+
+
+class SparseFieldsetSerializerMixin:
+    """Миксин сериализатора для выбора полей через ?fields= и ?omit=.
+
+    Параметры читаются из запроса в контексте сериализатора, поэтому
+    миксин подключается только к сериализаторам верхнего уровня.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Удаляет поля, не запрошенные в параметрах запроса."""
+        super().__init__(*args, **kwargs)
+        fields, omit = get_sparse_fieldset(self.context.get('request'))
+        if fields is not None or omit:
+            restrict_serializer_fields(self, fields, omit)
+
+
+class SparseFieldsetViewSetMixin:
+    """Миксин ViewSet, сужающий queryset под поля сериализатора.
+
+    Из выборки исключаются колонки и связи, которые нужны только
+    незапрошенным через ?fields= и ?omit= полям сериализатора. Без этих
+    параметров отбрасываются связи и откладывается загрузка HTML-полей
+    CKEditor, которые не выводит сериализатор текущего действия
+    (см. content.api.fieldsets).
+    """
+
+    def filter_queryset(self, queryset):
+        """Фильтрует queryset и сужает его под поля сериализатора."""
+        queryset = super().filter_queryset(queryset)
+        fields, omit = get_sparse_fieldset(self.request)
+        serializer_class = self.get_serializer_class()
+        needed = get_needed_sources(
+            serializer_class,
+            get_kept_field_names(serializer_class, fields, omit),
+        )
+        if fields is None and not omit:
+            return defer_unused_rich_text(
+                prune_relations(queryset, needed), needed
+            )
+        return prune_queryset(queryset, needed)
@@ -10,6 +10,8 @@
 - Проекты
 - Новости
 - Литература
+- Учёт импортированных записей
+- Учёт ссылок на медиафайлы
 
 Все модели регистрируются здесь для обеспечения корректного импорта и миграций.
 """
@@ -18,6 +20,7 @@ from .about_us_video import AboutUsVideo
 from .coaching import Coaching, CoachingPhoto
 from .employees import Document, Employee, TypeDocument
 from .gratitudes import Gratitude
+from .imports import ImportedRecord
 from .knowledge_base import (
     Article,
     ArticleGallery,
@@ -25,6 +28,7 @@ from .knowledge_base import (
     ChapterKnowledgeBase,
 )
 from .literatures import Literature
+from .media import FileReference
 from .mission import Mission
 from .news import Direction, GalleryImage, News
 from .partners import Partner
@@ -60,10 +64,12 @@ __all__ = [
     'Direction',
     'Document',
     'Employee',
+    'FileReference',
     'FundraisingPhoto',
     'FundraisingTextBlock',
     'GalleryImage',
     'Gratitude',
+    'ImportedRecord',
     'Literature',
     'Mission',
     'News',
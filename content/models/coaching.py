@@ -14,6 +14,8 @@ from ordered_model.models import OrderedModel
 
 from content.constants import CHAR_FIELD_LENGTH, IMAGE_CONTENT_TYPES
 from content.mixins import TitleMixin
+from content.storage import get_image_storage
+from content.utils import image_meta_function
 
 
 class Coaching(TitleMixin, OrderedModel):
@@ -99,10 +101,12 @@ class CoachingPhoto(models.Model):
         verbose_name='Консультации и обучение',
     )
     image = models.ImageField(
+        storage=get_image_storage,
         upload_to='coaching/',
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
 
     class Meta:
         """Класс Meta для CoachingPhoto, содержащий мета-данные."""
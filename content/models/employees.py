@@ -16,6 +16,8 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import TimestampMixin
+from content.storage import get_image_storage
+from content.utils import image_meta_function, trigram_index_function
 from content.validators import validate_not_empty_html
 
 
@@ -29,10 +31,12 @@ class Employee(TimestampMixin, OrderedModel):
 
     name = models.CharField(max_length=100, verbose_name='ФИО')
     image = models.ImageField(
+        storage=get_image_storage,
         upload_to='team',
         verbose_name='Фото',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
     main_specialities = models.TextField(
         verbose_name='Специальности на общей странице',
     )
@@ -73,7 +77,10 @@ class Employee(TimestampMixin, OrderedModel):
         ordering = [
             'order',
         ]
-        indexes = [models.Index(fields=['order'])]
+        indexes = [
+            models.Index(fields=['order']),
+            trigram_index_function('name', 'employee_name_trgm_idx'),
+        ]
 
     def __str__(self):
         """Возвращает строковое представление объекта сотрудника."""
@@ -124,6 +131,7 @@ class Document(models.Model):
 
     name = models.CharField(max_length=255, verbose_name='Название документа')
     file = models.ImageField(
+        storage=get_image_storage,
         upload_to=upload_file,
         verbose_name='Файл документа',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
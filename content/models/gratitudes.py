@@ -14,6 +14,8 @@ from content.constants import (
     TITLE_LENGTH,
 )
 from content.mixins import TimestampMixin
+from content.storage import get_image_storage
+from content.utils import image_meta_function
 
 
 class Gratitude(TimestampMixin, OrderedModel):
@@ -27,10 +29,12 @@ class Gratitude(TimestampMixin, OrderedModel):
         null=True,
     )
     file = models.ImageField(
+        storage=get_image_storage,
         verbose_name='Файл благодарности',
         upload_to='gratitudes/',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    file_meta = image_meta_function()
     is_active = models.BooleanField('Видимость в ленте', default=True)
 
     class Meta(OrderedModel.Meta):
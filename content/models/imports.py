@@ -0,0 +1,46 @@
+"""Модуль содержит модель учёта импортированных записей.
+
+Модели:
+    1. ImportedRecord: связь строки источника импорта с объектом модели.
+"""
+
+from django.db import models
+
+
+class ImportedRecord(models.Model):
+    """Модель учёта импортированных записей.
+
+    Хранит естественный ключ строки источника, первичный ключ
+    созданного по ней объекта, хэш содержимого строки и хэши
+    сохранённых файлов. Используется инкрементальным импортом
+    (--sync), чтобы обновлять только изменившиеся записи.
+    """
+
+    model = models.CharField(max_length=100, verbose_name='Модель')
+    natural_key = models.CharField(
+        max_length=255, verbose_name='Естественный ключ'
+    )
+    object_id = models.PositiveBigIntegerField(verbose_name='ID объекта')
+    content_hash = models.CharField(
+        max_length=64, verbose_name='Хэш содержимого'
+    )
+    media_hashes = models.JSONField(
+        default=dict, blank=True, verbose_name='Хэши файлов'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name='Дата обновления'
+    )
+
+    class Meta:
+        verbose_name = 'Импортированная запись'
+        verbose_name_plural = 'Импортированные записи'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['model', 'natural_key'],
+                name='content_importedrecord_unique_key',
+            )
+        ]
+
+    def __str__(self):
+        """Возвращает строковое представление записи."""
+        return f'{self.model}: {self.natural_key}'
@@ -7,13 +7,19 @@
     4. ArticleGallery: Галерея фото статьи Базы знаний
 """
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.db import models
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import TitleMixin
-from content.utils import ckeditor_function
+from content.storage import get_image_storage
+from content.utils import (
+    ckeditor_function,
+    image_meta_function,
+    search_vector_function,
+)
 
 
 def upload_file(instance, filename):
@@ -64,6 +70,7 @@ class Article(TitleMixin, models.Model):
         verbose_name='Ссылка на видео',
         blank=True,
     )
+    search_vector = search_vector_function()
 
     class Meta:
         """Класс Meta для Article, содержащий мета-данные."""
@@ -71,6 +78,9 @@ class Article(TitleMixin, models.Model):
         verbose_name = 'Статья'
         verbose_name_plural = 'База знаний - статьи'
         ordering = ('title',)
+        indexes = [
+            GinIndex(fields=['search_vector'], name='article_search_idx')
+        ]
 
     def __str__(self):
         """Возвращает строковое представление Article."""
@@ -93,11 +103,13 @@ class ArticleTextBlock(models.Model):
     )
     text = ckeditor_function(verbose_name='текст статьи')
     foto = models.ImageField(
+        storage=get_image_storage,
         upload_to=upload_file,
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
         blank=True,
     )
+    foto_meta = image_meta_function()
 
     class Meta:
         """Класс Meta для ArticleTextBlock, содержащий мета-данные."""
@@ -120,10 +132,12 @@ class ArticleGallery(models.Model):
         verbose_name='статья',
     )
     foto = models.ImageField(
+        storage=get_image_storage,
         upload_to=upload_file,
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    foto_meta = image_meta_function()
 
     class Meta:
         """Класс Meta для ArticleTextBlock, содержащий мета-данные."""
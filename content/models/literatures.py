@@ -4,6 +4,7 @@
     1. Literature: Модель литературы
 """
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.db import models
@@ -12,6 +13,12 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES, LITERATURE_CONTENT_TYPES
 from content.mixins import TitleMixin
+from content.storage import get_image_storage
+from content.utils import (
+    image_meta_function,
+    search_vector_function,
+    trigram_index_function,
+)
 
 
 class Literature(TitleMixin, OrderedModel):
@@ -27,10 +34,12 @@ class Literature(TitleMixin, OrderedModel):
         verbose_name='Год издания',
     )
     cover = models.ImageField(
+        storage=get_image_storage,
         blank=True,
         verbose_name='Обложка',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    cover_meta = image_meta_function()
     description = models.TextField(
         blank=True, max_length=2000, verbose_name='Описание'
     )
@@ -49,12 +58,18 @@ class Literature(TitleMixin, OrderedModel):
         blank=True,
         verbose_name='Ссылка на литературу',
     )
+    search_vector = search_vector_function()
 
     class Meta(OrderedModel.Meta):
         verbose_name = 'Литература'
         verbose_name_plural = 'Литература'
         ordering = ['order']
-        indexes = [models.Index(fields=['order'])]
+        indexes = [
+            models.Index(fields=['order']),
+            GinIndex(fields=['search_vector'], name='literature_search_idx'),
+            trigram_index_function('title', 'literature_title_trgm_idx'),
+            trigram_index_function('author', 'literature_author_trgm_idx'),
+        ]
 
     def __str__(self):
         """Возвращает строковое представление литературы."""
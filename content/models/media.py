@@ -0,0 +1,37 @@
+"""Модуль содержит модель учёта ссылок на медиафайлы.
+
+Модели:
+    1. FileReference: ссылка объекта модели на файл хранилища.
+"""
+
+from django.db import models
+
+
+class FileReference(models.Model):
+    """Модель ссылки объекта на файл, адресуемый по содержимому.
+
+    Один файл (content.storage) может использоваться несколькими
+    объектами и полями. Число ссылок на файл - число записей с его
+    именем; файлы без ссылок удаляет команда collect_media.
+    """
+
+    name = models.CharField(
+        max_length=255, db_index=True, verbose_name='Файл'
+    )
+    model = models.CharField(max_length=100, verbose_name='Модель')
+    object_id = models.CharField(max_length=64, verbose_name='ID объекта')
+    field_name = models.CharField(max_length=100, verbose_name='Поле')
+
+    class Meta:
+        verbose_name = 'Ссылка на файл'
+        verbose_name_plural = 'Ссылки на файлы'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['model', 'object_id', 'field_name', 'name'],
+                name='content_filereference_unique_reference',
+            )
+        ]
+
+    def __str__(self):
+        """Возвращает строковое представление ссылки."""
+        return f'{self.model}[{self.object_id}].{self.field_name}: {self.name}'
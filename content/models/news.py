@@ -6,6 +6,7 @@
     - GalleryImage: Хранит изображения для подробных страниц новостей
 """
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.db import models
@@ -19,7 +20,13 @@ from content.mixins import (
     TitleMixin,
 )
 from content.validators import validate_not_empty_html
-from content.utils import ckeditor_function
+from content.storage import get_image_storage
+from content.utils import (
+    ckeditor_function,
+    image_meta_function,
+    search_vector_function,
+    trigram_index_function,
+)
 from .projects import Project
 
 
@@ -38,6 +45,7 @@ class Direction(TimestampMixin, models.Model):
         """Мета-настройки модели Direction."""
 
         ordering = ['name']
+        indexes = [trigram_index_function('name', 'direction_name_trgm_idx')]
         verbose_name = 'Направление деятельности'
         verbose_name_plural = 'Направления деятельности'
 
@@ -57,10 +65,12 @@ class News(TimestampMixin, TitleMixin, CleanEmptyHTMLMixin, models.Model):
         NONE = 'none', 'Не создавать страницу'
 
     photo = models.ImageField(
+        storage=get_image_storage,
         verbose_name='Фото',
         upload_to='news_photos/',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    photo_meta = image_meta_function()
     date = models.DateField('Дата новости', default=timezone.now)
     course_start = models.DateField('Старт курса', null=True, blank=True)
     summary = models.TextField(
@@ -100,6 +110,7 @@ class News(TimestampMixin, TitleMixin, CleanEmptyHTMLMixin, models.Model):
         validators=[],
     )
     video_url = models.URLField('Ссылка на видео', blank=True, null=True)
+    search_vector = search_vector_function()
     clean_html_fields = ('full_text', 'summary')
 
     class Meta:
@@ -114,6 +125,8 @@ class News(TimestampMixin, TitleMixin, CleanEmptyHTMLMixin, models.Model):
                 fields=['project', '-date'], name='news_project_date_idx'
             ),
             models.Index(fields=['-date', 'id'], name='news_date_id_idx'),
+            GinIndex(fields=['search_vector'], name='news_search_idx'),
+            trigram_index_function('title', 'news_title_trgm_idx'),
         ]
         verbose_name = 'Новость'
         verbose_name_plural = 'Новости'
@@ -149,10 +162,12 @@ class GalleryImage(TimestampMixin, OrderedModel):
         verbose_name='Новость',
     )
     image = models.ImageField(
+        storage=get_image_storage,
         verbose_name='Фото',
         upload_to=upload_file,
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
     name = models.CharField('Название', max_length=100, default=image.name)
     order_with_respect_to = 'news'
 
@@ -10,6 +10,8 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import TimestampMixin
+from content.storage import get_image_storage
+from content.utils import image_meta_function, trigram_index_function
 
 
 class Partner(TimestampMixin, OrderedModel):
@@ -20,10 +22,12 @@ class Partner(TimestampMixin, OrderedModel):
         verbose_name='Название партнера',
     )
     logo = models.ImageField(
+        storage=get_image_storage,
         upload_to='partners/logos/',
         verbose_name='Логотип партнера',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    logo_meta = image_meta_function()
     description = models.TextField(
         verbose_name='Описание',
     )
@@ -34,7 +38,10 @@ class Partner(TimestampMixin, OrderedModel):
         verbose_name = 'Партнер'
         verbose_name_plural = 'Партнеры'
         ordering = ['order']
-        indexes = [models.Index(fields=['order'])]
+        indexes = [
+            models.Index(fields=['order']),
+            trigram_index_function('name', 'partner_name_trgm_idx'),
+        ]
 
     def __str__(self):
         """Возвращает строковое представление партнёра."""
@@ -8,6 +8,7 @@
     3. Project: Модель для хранения информации о проекте
 """
 
+from django.contrib.postgres.indexes import GinIndex
 from django.core.validators import FileExtensionValidator
 from django.db import models
 from django.db.models import CheckConstraint, F, Q
@@ -15,7 +16,12 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import TitleMixin
-from content.utils import ckeditor_function
+from content.storage import get_image_storage
+from content.utils import (
+    ckeditor_function,
+    image_meta_function,
+    search_vector_function,
+)
 
 from .partners import Partner
 
@@ -45,10 +51,12 @@ class Project(TitleMixin, OrderedModel):
     """Модель Проекта."""
 
     logo = models.ImageField(
+        storage=get_image_storage,
         upload_to='projects/',
         verbose_name='Логотип',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    logo_meta = image_meta_function()
     status = models.CharField(
         max_length=max(len(value) for value, _ in ProjectsStatus.choices),
         choices=ProjectsStatus.choices,
@@ -91,6 +99,7 @@ class Project(TitleMixin, OrderedModel):
         null=True,
         validators=[],
     )
+    search_vector = search_vector_function()
 
     class Meta(OrderedModel.Meta):
         """Класс Meta для Project, содержащий мета-данные."""
@@ -98,7 +107,10 @@ class Project(TitleMixin, OrderedModel):
         verbose_name = 'Проект'
         verbose_name_plural = 'Проекты'
         ordering = ['order']
-        indexes = [models.Index(fields=['order'])]
+        indexes = [
+            models.Index(fields=['order']),
+            GinIndex(fields=['search_vector'], name='project_search_idx'),
+        ]
         constraints = [
             CheckConstraint(
                 check=Q(project_end__gt=F('project_start')),
@@ -131,10 +143,12 @@ class ProjectPhoto(models.Model):
         verbose_name='Проект',
     )
     image = models.ImageField(
+        storage=get_image_storage,
         upload_to='projects/',
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
 
     class Meta:
         """Класс Meta для ProjectPhoto, содержащий мета-данные."""
@@ -5,6 +5,8 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import TimestampMixin
+from content.storage import get_image_storage
+from content.utils import image_meta_function
 
 from . import Direction
 
@@ -14,10 +16,12 @@ class Supervisor(TimestampMixin, OrderedModel):
 
     name = models.CharField(max_length=255, verbose_name='ФИО')
     image = models.ImageField(
+        storage=get_image_storage,
         upload_to='supervisors/',
         verbose_name='Фото',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
     position = models.CharField(max_length=255, verbose_name='Должность')
     directions = models.ManyToManyField(
         Direction,
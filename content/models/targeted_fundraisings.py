@@ -20,6 +20,8 @@ from django_ckeditor_5.fields import CKEditor5Field
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import OrderMixin, TimestampMixin, TitleMixin
+from content.storage import get_image_storage
+from content.utils import image_meta_function
 from content.validators import validate_not_empty_html
 
 
@@ -71,10 +73,12 @@ class FundraisingPhoto(TitleMixin, models.Model):
         verbose_name='Адресный сбор',
     )
     image = models.ImageField(
+        storage=get_image_storage,
         upload_to=upload_file,
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
     position = models.PositiveSmallIntegerField(
         default=1,
         validators=[MinValueValidator(1), MaxValueValidator(3)],
@@ -14,7 +14,8 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import CleanEmptyHTMLMixin, TitleMixin
-from content.utils import ckeditor_function
+from content.storage import get_image_storage
+from content.utils import ckeditor_function, image_meta_function
 from content.validators import validate_not_empty_html
 
 
@@ -123,10 +124,12 @@ class TrainingAndInternshipsPhoto(models.Model):
         verbose_name='Обучение и стажировка',
     )
     image = models.ImageField(
+        storage=get_image_storage,
         upload_to='training/',
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    image_meta = image_meta_function()
     on_main = models.BooleanField(
         default=False,
         verbose_name='На главной странице',
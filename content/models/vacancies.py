@@ -6,6 +6,7 @@
 Модели:
     1. Vacancy: содержит информацию о вакансиях.
 """
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
@@ -14,7 +15,13 @@ from ordered_model.models import OrderedModel
 
 from content.constants import IMAGE_CONTENT_TYPES
 from content.mixins import TimestampMixin
-from content.utils import ckeditor_function, html_cleaner
+from content.storage import get_image_storage
+from content.utils import (
+    ckeditor_function,
+    html_cleaner,
+    image_meta_function,
+    search_vector_function,
+)
 from content.validators import validate_not_empty_html
 
 
@@ -27,10 +34,12 @@ class Vacancy(TimestampMixin, OrderedModel):
 
     profession = models.CharField(max_length=200, verbose_name='Профессия')
     photo = models.ImageField(
+        storage=get_image_storage,
         upload_to='vacancies/photos/',
         verbose_name='Фотография',
         validators=[FileExtensionValidator(IMAGE_CONTENT_TYPES)],
     )
+    photo_meta = image_meta_function()
     salary = models.CharField(max_length=200, verbose_name='Зарплата')
     short_description = models.TextField(
         max_length=500, verbose_name='Краткий текст'
@@ -59,12 +68,16 @@ class Vacancy(TimestampMixin, OrderedModel):
     external_link = models.URLField(
         blank=True, null=True, verbose_name='Ссылка на внешнюю платформу'
     )
+    search_vector = search_vector_function()
 
     class Meta(OrderedModel.Meta):
         verbose_name = 'Вакансия'
         verbose_name_plural = 'Вакансии'
         ordering = ['order']
-        indexes = [models.Index(fields=['order'])]
+        indexes = [
+            models.Index(fields=['order']),
+            GinIndex(fields=['search_vector'], name='vacancy_search_idx'),
+        ]
 
     def __str__(self):
         """Возвращает строковое представление вакансии."""
@@ -1,10 +1,40 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
 from collections import OrderedDict
+from urllib import parse
 
+from django.utils.dateparse import parse_date
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import (
+    BasePagination,
     LimitOffsetPagination,
     PageNumberPagination,
 )
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def get_positive_int(
+    params, name: str, default: int, cutoff: int | None = None
+) -> int:
+    """Возвращает положительное целое число из параметров запроса.
+
+    Args:
+        params: Параметры запроса (request.query_params).
+        name: Имя параметра.
+        default: Значение, если параметр не передан, не является целым
+            числом или не больше нуля.
+        cutoff: Наибольшее допустимое значение.
+
+    Returns:
+        Значение параметра, ограниченное cutoff, или default.
+    """
+    try:
+        value = int(params[name])
+    except (KeyError, ValueError):
+        return default
+    if value <= 0:
+        return default
+    return min(value, cutoff) if cutoff else value
 
 
 class NewsLimitOffsetPagination(LimitOffsetPagination):
@@ -13,6 +43,207 @@ class NewsLimitOffsetPagination(LimitOffsetPagination):
     default_limit = 6
 
 
+class NewsKeysetPagination(BasePagination):
+    """Курсорная (keyset) пагинация новостей по паре (date, id).
+
+    Порядок выдачи совпадает с индексом news_date_id_idx (-date, id),
+    поэтому любая страница выбирается диапазонным сканированием индекса
+    без OFFSET. Курсор кодирует дату и id крайней новости страницы
+    и направление перехода. Общее количество новостей возвращается,
+    пока клиент не передаст count=false.
+    """
+
+    cursor_query_param = 'cursor'
+    limit_query_param = 'limit'
+    count_query_param = 'count'
+    default_limit = 6
+    max_limit = 100
+    invalid_cursor_message = 'Неверный курсор.'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Возвращает страницу новостей после позиции курсора."""
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.count = None
+        if self.get_with_count(request):
+            self.count = queryset.count()
+        cursor = self.decode_cursor(request)
+        reverse = cursor is not None and cursor[0]
+        if cursor is None:
+            queryset = queryset.order_by('-date', 'id')
+        elif reverse:
+            _, date, pk = cursor
+            queryset = (
+                queryset.filter(date__gte=date)
+                .exclude(date=date, id__gte=pk)
+                .order_by('date', '-id')
+            )
+        else:
+            _, date, pk = cursor
+            queryset = (
+                queryset.filter(date__lte=date)
+                .exclude(date=date, id__lte=pk)
+                .order_by('-date', 'id')
+            )
+        results = list(queryset[: self.limit + 1])
+        has_more = len(results) > self.limit
+        results = results[: self.limit]
+        if reverse:
+            results.reverse()
+            self.has_previous, self.has_next = has_more, True
+        else:
+            self.has_previous, self.has_next = cursor is not None, has_more
+        self.page = results
+        return results
+
+    def get_limit(self, request) -> int:
+        """Возвращает размер страницы из параметров запроса."""
+        return get_positive_int(
+            request.query_params,
+            self.limit_query_param,
+            self.default_limit,
+            cutoff=self.max_limit,
+        )
+
+    def get_with_count(self, request) -> bool:
+        """Проверяет, нужно ли считать общее количество новостей."""
+        value = request.query_params.get(self.count_query_param, 'true')
+        return value.lower() not in ('0', 'false', 'no')
+
+    def decode_cursor(self, request):
+        """Декодирует курсор в кортеж (reverse, date, id)."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            querystring = urlsafe_b64decode(encoded.encode('ascii'))
+            tokens = parse.parse_qs(querystring.decode('ascii'))
+            reverse = bool(int(tokens.get('r', ['0'])[0]))
+            date = parse_date(tokens['d'][0])
+            pk = int(tokens['i'][0])
+        except (KeyError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if date is None:
+            raise NotFound(self.invalid_cursor_message)
+        return reverse, date, pk
+
+    def encode_cursor(self, instance, reverse: bool) -> str:
+        """Возвращает ссылку на страницу рядом с переданной новостью."""
+        tokens = {'d': instance.date.isoformat(), 'i': instance.pk}
+        if reverse:
+            tokens['r'] = '1'
+        querystring = parse.urlencode(tokens)
+        encoded = urlsafe_b64encode(querystring.encode('ascii'))
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            encoded.decode('ascii'),
+        )
+
+    def get_next_link(self):
+        """Возвращает ссылку на следующую страницу."""
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        """Возвращает ссылку на предыдущую страницу."""
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+    def get_paginated_response(self, data):
+        """Генерирует ответ с курсорами соседних страниц."""
+        return Response(
+            OrderedDict(
+                [
+                    ('count', self.count),
+                    ('next', self.get_next_link()),
+                    ('previous', self.get_previous_link()),
+                    ('results', data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        """Возвращает схему ответа для документации API."""
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'count': {'type': 'integer', 'nullable': True},
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {
+                    'type': 'string',
+                    'nullable': True,
+                    'format': 'uri',
+                },
+                'results': schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        """Возвращает параметры запроса для документации API."""
+        return [
+            {
+                'name': self.cursor_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    'Курсор страницы. Пустое значение включает курсорную '
+                    'пагинацию с первой страницы.'
+                ),
+                'schema': {'type': 'string'},
+            },
+            {
+                'name': self.count_query_param,
+                'required': False,
+                'in': 'query',
+                'description': (
+                    'false - не считать общее количество новостей '
+                    '(только для курсорной пагинации).'
+                ),
+                'schema': {'type': 'boolean'},
+            },
+        ]
+
+
+class NewsPagination(BasePagination):
+    """Пагинация новостей с выбором режима по параметрам запроса.
+
+    Если в запросе есть параметр cursor (в том числе пустой),
+    используется NewsKeysetPagination, иначе - NewsLimitOffsetPagination.
+    """
+
+    def __init__(self):
+        """Создаёт пагинаторы обоих режимов."""
+        self.limit_offset = NewsLimitOffsetPagination()
+        self.keyset = NewsKeysetPagination()
+        self.paginator = self.limit_offset
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Выбирает режим пагинации и возвращает страницу."""
+        if self.keyset.cursor_query_param in request.query_params:
+            self.paginator = self.keyset
+        else:
+            self.paginator = self.limit_offset
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        """Генерирует ответ выбранного режима пагинации."""
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        """Возвращает схему ответа для документации API."""
+        return self.keyset.get_paginated_response_schema(schema)
+
+    def get_schema_operation_parameters(self, view):
+        """Возвращает параметры запроса обоих режимов пагинации."""
+        return self.limit_offset.get_schema_operation_parameters(
+            view
+        ) + self.keyset.get_schema_operation_parameters(view)
+
+
 class LiteraturePageNumberPagination(PageNumberPagination):
     """Пагинация для литературы."""
 
@@ -35,3 +266,10 @@ class LiteraturePageNumberPagination(PageNumberPagination):
                 ]
             )
         )
+
+
+class SearchPagination(LimitOffsetPagination):
+    """Пагинация результатов поиска."""
+
+    default_limit = 10
+    max_limit = 50
@@ -0,0 +1,296 @@
+"""Полнотекстовый поиск по контенту.
+
+Этот модуль содержит:
+- SEARCH_MODELS: типы результатов поиска, модели и их поля с весами.
+- is_search_supported: проверка поддержки полнотекстового поиска.
+- update_search_vectors: пересчёт поисковых векторов объектов.
+- search: ранжированная выборка результатов всех типов.
+- get_search_hits: заголовки и фрагменты с подсветкой для страницы.
+
+У моделей поиска есть колонка search_vector (tsvector) с GIN-индексом.
+Вектор строится в базе данных из полей модели с весами A-D
+в конфигурации 'russian', HTML-теги CKEditor перед этим удаляются.
+Колонка пересчитывается одним UPDATE после сохранения объекта
+(content.signals), для статей - и после изменения текстовых блоков.
+Поиск выбирает по индексу только тип, id и ранг результатов, а
+заголовки и фрагменты (ts_headline) вычисляются для одной страницы.
+
+Полнотекстовый поиск доступен только в PostgreSQL. В других базах
+(например, SQLite при локальной разработке) векторы не строятся,
+а поиск выполняется через icontains без ранжирования и подсветки.
+"""
+
+from functools import reduce
+from operator import or_
+
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+)
+from django.db import connection
+from django.db.models import (
+    F,
+    FloatField,
+    Func,
+    OuterRef,
+    Q,
+    Subquery,
+    TextField,
+    Value,
+)
+from django.db.models.functions import Coalesce, Concat
+
+from content.models import (
+    Article,
+    ArticleTextBlock,
+    Literature,
+    News,
+    Project,
+    Vacancy,
+)
+
+SEARCH_CONFIG = 'russian'
+"""Конфигурация полнотекстового поиска PostgreSQL."""
+
+SEARCH_MODELS = {
+    'news': {
+        'model': News,
+        'title': 'title',
+        'fields': {'title': 'A', 'summary': 'B', 'full_text': 'C'},
+    },
+    'article': {
+        'model': Article,
+        'title': 'title',
+        'fields': {'title': 'A'},
+        'blocks': {
+            'model': ArticleTextBlock,
+            'field': 'text',
+            'weight': 'B',
+        },
+    },
+    'project': {
+        'model': Project,
+        'title': 'title',
+        'fields': {
+            'title': 'A',
+            'project_goal': 'B',
+            'project_tasks': 'C',
+            'project_description': 'C',
+            'achieved_results': 'C',
+        },
+    },
+    'literature': {
+        'model': Literature,
+        'title': 'title',
+        'fields': {'title': 'A', 'author': 'B', 'description': 'C'},
+    },
+    'vacancy': {
+        'model': Vacancy,
+        'title': 'profession',
+        'fields': {
+            'profession': 'A',
+            'short_description': 'B',
+            'additional_description': 'C',
+            'detailed_description': 'C',
+        },
+    },
+}
+"""Типы результатов поиска.
+
+Для каждого типа задаются модель, поле заголовка и поля вектора
+с весами. blocks - связанные текстовые блоки (ForeignKey на модель),
+текст которых входит в вектор объекта.
+"""
+
+SEARCH_TYPES = {
+    config['model']: name for name, config in SEARCH_MODELS.items()
+}
+"""Модели поиска и названия их типов."""
+
+HEADLINE_OPTIONS = {
+    'start_sel': '<mark>',
+    'stop_sel': '</mark>',
+    'max_words': 35,
+    'min_words': 15,
+    'max_fragments': 2,
+    'fragment_delimiter': ' … ',
+}
+"""Параметры ts_headline для фрагментов результатов."""
+
+
+class StripTags(Func):
+    """Удаляет HTML-теги из текста (regexp_replace)."""
+
+    function = 'regexp_replace'
+    template = "%(function)s(%(expressions)s, '<[^>]+>', ' ', 'g')"
+    output_field = TextField()
+
+
+def is_search_supported() -> bool:
+    """Проверяет, поддерживает ли база данных полнотекстовый поиск."""
+    return connection.vendor == 'postgresql'
+
+
+def get_text_expressions(config: dict) -> list[tuple[str, object, str]]:
+    """Возвращает источники текста объекта, их выражения и веса.
+
+    Источник - имя поля модели или 'blocks' для связанных текстовых
+    блоков.
+    """
+    expressions = [
+        (field_name, StripTags(F(field_name)), weight)
+        for field_name, weight in config['fields'].items()
+    ]
+    blocks = config.get('blocks')
+    if blocks is not None:
+        block_model = blocks['model']
+        foreign_key = next(
+            field.name
+            for field in block_model._meta.concrete_fields
+            if field.related_model is config['model']
+        )
+        texts = (
+            block_model.objects.filter(**{foreign_key: OuterRef('pk')})
+            .order_by()
+            .values(foreign_key)
+            .annotate(text=StringAgg(blocks['field'], ' '))
+            .values('text')
+        )
+        expressions.append(
+            (
+                'blocks',
+                StripTags(Subquery(texts, output_field=TextField())),
+                blocks['weight'],
+            )
+        )
+    return expressions
+
+
+def get_headline_document(config: dict) -> Concat:
+    """Возвращает текст объекта без заголовка для фрагментов поиска."""
+    parts = []
+    for source, expression, _ in get_text_expressions(config):
+        if source != config['title']:
+            parts.extend((Coalesce(expression, Value('')), Value(' ')))
+    return Concat(*parts, Value(''), output_field=TextField())
+
+
+def get_search_vector(config: dict) -> SearchVector:
+    """Возвращает выражение поискового вектора объекта."""
+    return reduce(
+        lambda left, right: left + right,
+        (
+            SearchVector(expression, weight=weight, config=SEARCH_CONFIG)
+            for _, expression, weight in get_text_expressions(config)
+        ),
+    )
+
+
+def update_search_vectors(model, pks=None) -> int:
+    """Пересчитывает поисковые векторы объектов модели.
+
+    Args:
+        model: Модель из SEARCH_MODELS.
+        pks: Первичные ключи объектов, по умолчанию - все объекты.
+
+    Returns:
+        Число обновлённых объектов.
+    """
+    if not is_search_supported():
+        return 0
+    queryset = model._default_manager.all()
+    if pks is not None:
+        queryset = queryset.filter(pk__in=pks)
+    config = SEARCH_MODELS[SEARCH_TYPES[model]]
+    return queryset.update(search_vector=get_search_vector(config))
+
+
+def get_search_query(text: str) -> SearchQuery:
+    """Возвращает поисковый запрос в синтаксисе веб-поиска."""
+    return SearchQuery(text, config=SEARCH_CONFIG, search_type='websearch')
+
+
+def search_type(name: str, text: str):
+    """Возвращает выборку (тип, id, ранг) результатов одного типа."""
+    config = SEARCH_MODELS[name]
+    queryset = config['model']._default_manager.order_by()
+    if is_search_supported():
+        query = get_search_query(text)
+        queryset = queryset.filter(search_vector=query).annotate(
+            rank=SearchRank(F('search_vector'), query)
+        )
+    else:
+        queryset = queryset.filter(
+            reduce(
+                or_,
+                (
+                    Q(**{f'{field_name}__icontains': text})
+                    for field_name in config['fields']
+                ),
+            )
+        ).annotate(rank=Value(0.0, output_field=FloatField()))
+    return queryset.annotate(
+        result_type=Value(name, output_field=TextField()),
+        result_id=F('pk'),
+    ).values('result_type', 'result_id', 'rank')
+
+
+def search(text: str, types=None):
+    """Возвращает результаты поиска всех типов по убыванию ранга.
+
+    Args:
+        text: Текст запроса (синтаксис websearch_to_tsquery).
+        types: Названия типов из SEARCH_MODELS, по умолчанию все.
+    """
+    names = [name for name in SEARCH_MODELS if not types or name in types]
+    querysets = [search_type(name, text) for name in names]
+    queryset = querysets[0]
+    if len(querysets) > 1:
+        queryset = queryset.union(*querysets[1:], all=True)
+    return queryset.order_by('-rank', 'result_type', 'result_id')
+
+
+def get_search_hits(page, text: str) -> list[dict]:
+    """Возвращает результаты страницы с заголовками и фрагментами.
+
+    Заголовок и фрагмент с подсветкой выбираются одним запросом
+    на каждый тип, присутствующий на странице.
+    """
+    ids = {}
+    for row in page:
+        ids.setdefault(row['result_type'], []).append(row['result_id'])
+    details = {}
+    supported = is_search_supported()
+    for name, pks in ids.items():
+        config = SEARCH_MODELS[name]
+        queryset = config['model']._default_manager.filter(pk__in=pks)
+        annotations = {'result_title': F(config['title'])}
+        if supported:
+            annotations['headline'] = SearchHeadline(
+                get_headline_document(config),
+                get_search_query(text),
+                config=SEARCH_CONFIG,
+                **HEADLINE_OPTIONS,
+            )
+        for values in queryset.annotate(**annotations).values(
+            'pk', *annotations
+        ):
+            details[name, values['pk']] = values
+    hits = []
+    for row in page:
+        values = details.get((row['result_type'], row['result_id']))
+        if values is None:
+            continue
+        hits.append(
+            {
+                'type': row['result_type'],
+                'id': row['result_id'],
+                'title': values['result_title'],
+                'headline': values.get('headline'),
+                'rank': row['rank'],
+            }
+        )
+    return hits
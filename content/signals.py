@@ -1 +1,124 @@
-"""Модуль работы с сигналами проложения."""
+"""Модуль работы с сигналами проложения.
+
+Содержит обработчики, увеличивающие версию контента моделей приложения
+после фиксации транзакции с их изменением, что сбрасывает
+закэшированные ответы API: запрос, прочитавший новую версию до
+фиксации, закэшировал бы под ней прежние данные. Также модуль содержит
+обработчики, ставящие в очередь фоновых задач (jobs) пересоздание
+снимков моделей-одиночек (content.snapshots) и производных загруженных
+изображений (content.images). Задачи записываются в той же транзакции,
+что и изменения, поэтому сохранение в админке не ждёт обработки
+изображений. Ссылки объектов на файлы хранилища (content.media)
+обновляются при сохранении и удалении объектов, а поисковые векторы
+(content.search) - при сохранении объектов и текстовых блоков статей.
+"""
+
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from content.cache import bump_content_version
+from content.images import IMAGE_FIELDS, has_outdated_images
+from content.media import (
+    delete_references,
+    get_file_fields,
+    update_references,
+)
+from content.models import Article, ArticleTextBlock
+from content.search import SEARCH_TYPES, update_search_vectors
+from content.snapshots import SNAPSHOT_SERIALIZERS, delete_snapshot
+from jobs.queue import enqueue
+
+M2M_CHANGE_ACTIONS = ('post_add', 'post_remove', 'post_clear')
+"""Действия m2m_changed, после которых изменился состав связей."""
+
+
+def is_content_model(model) -> bool:
+    """Проверяет, что модель принадлежит приложению content."""
+    return model._meta.app_label == 'content'
+
+
+@receiver(post_save, dispatch_uid='content_version_post_save')
+@receiver(post_delete, dispatch_uid='content_version_post_delete')
+def bump_version_on_change(sender, **kwargs):
+    """Увеличивает версию контента модели при сохранении или удалении."""
+    if is_content_model(sender):
+        transaction.on_commit(partial(bump_content_version, sender))
+
+
+@receiver(m2m_changed, dispatch_uid='content_version_m2m_changed')
+def bump_version_on_m2m_change(sender, instance, action, model, **kwargs):
+    """Увеличивает версии контента обеих сторон связи ManyToMany."""
+    if action not in M2M_CHANGE_ACTIONS:
+        return
+    for changed_model in (sender, instance.__class__, model):
+        if is_content_model(changed_model):
+            transaction.on_commit(
+                partial(bump_content_version, changed_model)
+            )
+
+
+@receiver(post_save, dispatch_uid='content_snapshot_post_save')
+def refresh_snapshot_on_save(sender, **kwargs):
+    """Сбрасывает снимок модели-одиночки и ставит задачу его прогрева.
+
+    До выполнения задачи снимок пересоздаётся первым запросом.
+    """
+    if sender in SNAPSHOT_SERIALIZERS:
+        transaction.on_commit(partial(delete_snapshot, sender))
+        enqueue('content.refresh_snapshot', sender._meta.label)
+
+
+@receiver(post_delete, dispatch_uid='content_snapshot_post_delete')
+def delete_snapshot_on_delete(sender, **kwargs):
+    """Удаляет снимок модели-одиночки после фиксации транзакции."""
+    if sender in SNAPSHOT_SERIALIZERS:
+        transaction.on_commit(partial(delete_snapshot, sender))
+
+
+@receiver(post_save, dispatch_uid='content_images_post_save')
+def process_images_on_save(sender, instance, **kwargs):
+    """Ставит в очередь создание производных изменённых изображений."""
+    if sender in IMAGE_FIELDS and has_outdated_images(instance):
+        enqueue('content.process_images', sender._meta.label, instance.pk)
+
+
+@receiver(post_save, dispatch_uid='content_media_post_save')
+def update_references_on_save(sender, instance, **kwargs):
+    """Обновляет ссылки сохранённого объекта на файлы хранилища."""
+    if get_file_fields(sender):
+        update_references(sender, [instance])
+
+
+@receiver(post_delete, dispatch_uid='content_media_post_delete')
+def delete_references_on_delete(sender, instance, **kwargs):
+    """Удаляет ссылки удалённого объекта на файлы хранилища."""
+    if get_file_fields(sender):
+        delete_references(instance)
+
+
+@receiver(post_save, dispatch_uid='content_search_post_save')
+def update_search_vector_on_save(sender, instance, **kwargs):
+    """Пересчитывает поисковый вектор сохранённого объекта."""
+    if sender in SEARCH_TYPES:
+        update_search_vectors(sender, [instance.pk])
+
+
+@receiver(
+    post_save,
+    sender=ArticleTextBlock,
+    dispatch_uid='content_search_block_post_save',
+)
+@receiver(
+    post_delete,
+    sender=ArticleTextBlock,
+    dispatch_uid='content_search_block_post_delete',
+)
+def update_article_vector_on_block_change(sender, instance, **kwargs):
+    """Пересчитывает поисковый вектор статьи изменённого текстового блока.
+
+    При каскадном удалении статьи обновление не затрагивает строк.
+    """
+    update_search_vectors(Article, [instance.article_id])
@@ -0,0 +1,107 @@
+"""Предварительно отрендеренные снимки ответов для моделей-одиночек.
+
+Этот модуль содержит:
+- SNAPSHOT_SERIALIZERS: модели-одиночки и сериализаторы их снимков.
+- build_snapshot: рендеринг снимка модели в JSON.
+- refresh_snapshot: пересоздание снимка в кэше.
+- delete_snapshot: удаление снимка из кэша.
+- snapshot_response: декоратор, отдающий снимок вместо сериализации.
+
+Снимок - запись кэша (content, etag, last_modified) того же вида, что
+и у content.cache.cached_response. Он хранится без таймаута и
+пересоздаётся сигналами после сохранения модели, поэтому запрос к
+Mission или AboutUsVideo обходится одним обращением к кэшу без ORM
+и сериализаторов. Ключи снимков изменяемые и не должны попадать
+в локальный уровень кэша (LOCAL_KEY_PREFIXES).
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from rest_framework.renderers import JSONRenderer
+
+from content.api.serializers import AboutUsVideoSerializer, MissionSerializer
+from content.cache import set_validator_headers
+from content.models import AboutUsVideo, Mission
+
+SNAPSHOT_KEY_PREFIX = 'content:snapshot:'
+"""Префикс ключей снимков моделей-одиночек."""
+
+SNAPSHOT_SERIALIZERS = {
+    Mission: MissionSerializer,
+    AboutUsVideo: AboutUsVideoSerializer,
+}
+"""Модели-одиночки (с методом get_solo) и сериализаторы их снимков."""
+
+
+def get_snapshot_key(model) -> str:
+    """Возвращает ключ кэша снимка модели."""
+    return f'{SNAPSHOT_KEY_PREFIX}{model._meta.label_lower}'
+
+
+def build_snapshot(model) -> tuple[bytes, str, int]:
+    """Рендерит снимок модели-одиночки и вычисляет его валидаторы."""
+    instance = model.get_solo()
+    content = JSONRenderer().render(SNAPSHOT_SERIALIZERS[model](instance).data)
+    etag = quote_etag(hashlib.md5(content).hexdigest())
+    updated_at = getattr(instance, 'updated_at', None)
+    last_modified = int(
+        updated_at.timestamp() if updated_at is not None else time.time()
+    )
+    return content, etag, last_modified
+
+
+def refresh_snapshot(model) -> tuple[bytes, str, int]:
+    """Пересоздаёт снимок модели и сохраняет его в кэш без таймаута."""
+    entry = build_snapshot(model)
+    cache.set(get_snapshot_key(model), entry, timeout=None)
+    return entry
+
+
+def delete_snapshot(model):
+    """Удаляет снимок модели из кэша."""
+    cache.delete(get_snapshot_key(model))
+
+
+def get_snapshot(model) -> tuple[bytes, str, int]:
+    """Возвращает снимок модели, создавая его при отсутствии в кэше."""
+    entry = cache.get(get_snapshot_key(model))
+    if entry is None:
+        entry = refresh_snapshot(model)
+    return entry
+
+
+def snapshot_response(view_method):
+    """Декоратор действия list, отдающий снимок модели-одиночки.
+
+    Снимок используется для GET-запросов в формате JSON без параметров.
+    Остальные запросы (например, с ?fields=) передаются действию.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        model = self.get_serializer_class().Meta.model
+        if (
+            request.method != 'GET'
+            or request.query_params
+            or request.accepted_renderer.format != 'json'
+        ):
+            return view_method(self, request, *args, **kwargs)
+        content, etag, last_modified = get_snapshot(model)
+        response = set_validator_headers(
+            HttpResponse(
+                content, content_type=request.accepted_renderer.media_type
+            ),
+            etag,
+            last_modified,
+        )
+        return get_conditional_response(
+            request, etag, last_modified, response
+        )
+
+    return wrapper
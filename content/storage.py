@@ -0,0 +1,79 @@
+"""Хранилище медиафайлов с адресацией по содержимому.
+
+Этот модуль содержит:
+- CAS_DIR: каталог файлов, адресуемых по содержимому.
+- is_content_addressed: проверка, что файл хранится по хэшу.
+- ContentAddressedStorage: хранилище файлов по хэшу содержимого.
+- get_image_storage: хранилище полей изображений.
+
+Файл сохраняется по пути cas/ab/cd/<sha256><расширение>, где ab и cd -
+первые символы хэша, поэтому одинаковые файлы хранятся один раз
+независимо от upload_to и исходного имени, а случайные суффиксы
+при совпадении имён не появляются. Содержимое файла по такому пути
+никогда не меняется, что позволяет nginx отдавать его с неизменяемым
+кэшированием. Файл может использоваться несколькими объектами, поэтому
+delete() его не удаляет: неиспользуемые файлы удаляет команда
+collect_media по учёту ссылок (content.media).
+
+По хэшу хранятся только поля изображений (хранилище STORAGES['images']).
+Документы остаются в хранилище по умолчанию, чтобы ссылки на них
+и имена скачиваемых файлов сохраняли исходные названия.
+"""
+
+import hashlib
+import os
+import posixpath
+
+from django.core.files.storage import FileSystemStorage, storages
+
+CAS_DIR = 'cas'
+"""Каталог файлов, адресуемых по содержимому, внутри MEDIA_ROOT."""
+
+
+def is_content_addressed(name: str) -> bool:
+    """Проверяет, что файл хранится в каталоге CAS_DIR."""
+    return bool(name) and name.startswith(f'{CAS_DIR}/')
+
+
+def get_content_name(digest: str, extension: str) -> str:
+    """Возвращает путь файла по хэшу его содержимого."""
+    return posixpath.join(
+        CAS_DIR, digest[:2], digest[2:4], f'{digest}{extension.lower()}'
+    )
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """Файловое хранилище, размещающее файлы по хэшу содержимого.
+
+    Имя, сформированное upload_to, используется только для расширения
+    файла. Старые файлы вне CAS_DIR читаются и удаляются как обычно.
+    """
+
+    def _save(self, name, content):
+        """Сохраняет файл по хэшу содержимого, если его ещё нет."""
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        content_name = get_content_name(
+            digest.hexdigest(), posixpath.splitext(name)[1]
+        )
+        if self.exists(content_name):
+            # Повторно сохранённый файл не должен попасть под удаление
+            # collect_media как файл без ссылок старше льготного периода.
+            os.utime(self.path(content_name))
+            return content_name
+        saved_name = super()._save(content_name, content)
+        if saved_name != content_name:
+            # Тот же файл одновременно записан другим процессом.
+            os.remove(self.path(saved_name))
+        return content_name
+
+    def delete(self, name):
+        """Удаляет файл, кроме файлов CAS_DIR (их удаляет collect_media)."""
+        if not is_content_addressed(name):
+            super().delete(name)
+
+
+def get_image_storage() -> ContentAddressedStorage:
+    """Возвращает хранилище полей изображений (STORAGES['images'])."""
+    return storages['images']
@@ -0,0 +1,174 @@
+"""Подсказки (автодополнение) по названиям и именам.
+
+Этот модуль содержит:
+- SUGGEST_MODELS: типы подсказок, модели и поля поиска.
+- normalize_query: приведение запроса к виду ключа кэша.
+- get_suggestions: лучшие совпадения запроса среди объектов всех типов.
+
+Объект подходит, если запрос входит в одно из полей (icontains) или
+похож на слово поля (pg_trgm, оператор %>), что находит названия
+и при опечатках. Оба условия используют триграммные GIN-индексы
+по UPPER(поле) (content.utils.trigram_index_function). Первыми идут
+совпадения с начала поля, затем - по убыванию похожести.
+
+Подсказки кэшируются по нормализованному запросу и версиям контента
+моделей (content.cache), поэтому частые префиксы не обращаются к базе
+данных до изменения контента. Нормализованный запрос используется
+только в ключе кэша, поиск выполняется по исходному тексту. В базах
+без pg_trgm (SQLite при локальной разработке) подсказки выбираются
+только по вхождению запроса, которое проверяется в Python: LIKE
+в SQLite не учитывает регистр только для латиницы.
+"""
+
+import hashlib
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramWordSimilarity
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import BooleanField, Case, Q, Value, When
+from django.db.models.functions import Greatest, Upper
+
+from content.cache import get_content_versions
+from content.models import Direction, Employee, Literature, News, Partner
+
+SUGGEST_MODELS = {
+    'news': {'model': News, 'fields': ('title',)},
+    'employee': {'model': Employee, 'fields': ('name',)},
+    'partner': {'model': Partner, 'fields': ('name',)},
+    'literature': {'model': Literature, 'fields': ('title', 'author')},
+    'direction': {'model': Direction, 'fields': ('name',)},
+}
+"""Типы подсказок: модель и поля поиска, первое поле - текст подсказки."""
+
+SUGGEST_KEY_PREFIX = 'content:suggest:'
+"""Префикс ключей закэшированных подсказок."""
+
+MIN_QUERY_LENGTH = 2
+"""Минимальная длина запроса подсказок."""
+
+
+def is_trigram_supported() -> bool:
+    """Проверяет, поддерживает ли база данных триграммный поиск."""
+    return connection.vendor == 'postgresql'
+
+
+def normalize_query(text: str) -> str:
+    """Приводит запрос к нижнему регистру и схлопывает пробелы."""
+    return ' '.join(text.split()).lower()
+
+
+def suggest_type_fallback(name: str, text: str, limit: int) -> list[dict]:
+    """Возвращает совпадения запроса среди объектов одного типа без pg_trgm.
+
+    Вхождение запроса проверяется в Python после casefold(), так как
+    LIKE в SQLite не учитывает регистр только для латиницы.
+    """
+    config = SUGGEST_MODELS[name]
+    fields = config['fields']
+    query = text.casefold()
+    suggestions = []
+    rows = config['model']._default_manager.order_by().values('pk', *fields)
+    for row in rows.iterator():
+        values = [(row[field_name] or '').casefold() for field_name in fields]
+        if not any(query in value for value in values):
+            continue
+        suggestions.append(
+            {
+                'type': name,
+                'id': row['pk'],
+                'text': row[fields[0]],
+                'score': 0.0,
+                'is_prefix': any(value.startswith(query) for value in values),
+            }
+        )
+    suggestions.sort(key=lambda item: (not item['is_prefix'], item['text']))
+    return suggestions[:limit]
+
+
+def suggest_type(name: str, text: str, limit: int) -> list[dict]:
+    """Возвращает лучшие совпадения запроса среди объектов одного типа."""
+    if not is_trigram_supported():
+        return suggest_type_fallback(name, text, limit)
+    config = SUGGEST_MODELS[name]
+    fields = config['fields']
+    queryset = config['model']._default_manager.order_by()
+    condition = Q()
+    prefix = Q()
+    for field_name in fields:
+        condition |= Q(**{f'{field_name}__icontains': text})
+        prefix |= Q(**{f'{field_name}__istartswith': text})
+        queryset = queryset.alias(**{f'upper_{field_name}': Upper(field_name)})
+        condition |= Q(
+            **{f'upper_{field_name}__trigram_word_similar': text.upper()}
+        )
+    scores = [TrigramWordSimilarity(text, field_name) for field_name in fields]
+    score = scores[0] if len(scores) == 1 else Greatest(*scores)
+    rows = (
+        queryset.filter(condition)
+        .annotate(
+            is_prefix=Case(
+                When(prefix, then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField(),
+            ),
+            score=score,
+        )
+        .order_by('-is_prefix', '-score', fields[0])
+        .values('pk', fields[0], 'is_prefix', 'score')[:limit]
+    )
+    return [
+        {
+            'type': name,
+            'id': row['pk'],
+            'text': row[fields[0]],
+            'score': row['score'],
+            'is_prefix': row['is_prefix'],
+        }
+        for row in rows
+    ]
+
+
+def get_suggestions(text: str, types=None, limit: int = 10) -> list[dict]:
+    """Возвращает лучшие подсказки для запроса среди объектов всех типов.
+
+    Args:
+        text: Текст запроса.
+        types: Названия типов из SUGGEST_MODELS, по умолчанию все.
+        limit: Количество подсказок.
+
+    Returns:
+        Словари с ключами type, id, text и score.
+    """
+    text = ' '.join(text.split())
+    names = [name for name in SUGGEST_MODELS if not types or name in types]
+    versions = get_content_versions(
+        SUGGEST_MODELS[name]['model'] for name in names
+    )
+    raw_key = '|'.join(
+        (
+            normalize_query(text),
+            ','.join(names),
+            str(limit),
+            ','.join(f'{key}={value}' for key, value in versions.items()),
+        )
+    )
+    key = f'{SUGGEST_KEY_PREFIX}{hashlib.md5(raw_key.encode()).hexdigest()}'
+    suggestions = cache.get(key)
+    if suggestions is not None:
+        return suggestions
+    suggestions = []
+    for name in names:
+        suggestions.extend(suggest_type(name, text, limit))
+    suggestions.sort(
+        key=lambda item: (
+            not item['is_prefix'],
+            -item['score'],
+            item['text'].lower(),
+        )
+    )
+    suggestions = suggestions[:limit]
+    for item in suggestions:
+        del item['is_prefix']
+    cache.set(key, suggestions, settings.RESPONSE_CACHE_TIMEOUT)
+    return suggestions
@@ -0,0 +1,27 @@
+"""Фоновые задачи приложения content.
+
+Этот модуль содержит задачи очереди jobs:
+- content.process_images: создание производных изображений объекта.
+- content.refresh_snapshot: прогрев снимка модели-одиночки.
+
+Задачи принимают метку модели ('content.News'), а не класс, так как
+аргументы задач хранятся в JSON.
+"""
+
+from django.apps import apps
+
+from content.images import process_instance_images
+from content.snapshots import refresh_snapshot
+from jobs.queue import task
+
+
+@task('content.process_images')
+def process_images_task(model_label: str, pk: int) -> bool:
+    """Создаёт производные изображений объекта модели."""
+    return process_instance_images(apps.get_model(model_label), pk)
+
+
+@task('content.refresh_snapshot')
+def refresh_snapshot_task(model_label: str):
+    """Пересоздаёт снимок модели-одиночки в кэше."""
+    refresh_snapshot(apps.get_model(model_label))
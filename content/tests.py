@@ -0,0 +1,68 @@
+"""Тесты планов запросов фильтра новостей.
+
+Проверяются только в PostgreSQL: план запроса зависит от планировщика
+и индексов конкретной базы данных, в остальных базах тесты
+пропускаются.
+"""
+
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase
+
+from content.filters import NewsFilter
+from content.models import Direction, News
+
+NEWS_COUNT = 5000
+"""Количество новостей, при котором планировщик выбирает индексы."""
+
+
+@skipUnless(
+    connection.vendor == 'postgresql', 'План запроса проверяется в PostgreSQL'
+)
+class NewsFilterPlanTests(TestCase):
+    """Планы запросов списка новостей с фильтрами."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Создаёт новости за 30 лет с двумя направлениями у каждой."""
+        directions = Direction.objects.bulk_create(
+            Direction(name=f'Направление {i}', slug=f'direction-{i}')
+            for i in range(10)
+        )
+        start = date(1995, 1, 1)
+        news = News.objects.bulk_create(
+            News(
+                title=f'Новость {i}',
+                date=start + timedelta(days=i * 2),
+                summary='Краткое описание',
+            )
+            for i in range(NEWS_COUNT)
+        )
+        through = News.directions.through
+        through.objects.bulk_create(
+            through(news=item, direction=directions[(i + shift) % 10])
+            for i, item in enumerate(news)
+            for shift in (0, 1)
+        )
+        with connection.cursor() as cursor:
+            for model in (News, Direction, through):
+                cursor.execute(f'ANALYZE {model._meta.db_table}')
+
+    def get_plan(self, data: dict) -> str:
+        """Возвращает план первой страницы списка новостей с фильтрами."""
+        queryset = NewsFilter(data, queryset=News.objects.all()).qs
+        return queryset.order_by('-date', 'id')[:6].explain()
+
+    def test_years_and_directions_use_date_index_and_semi_join(self):
+        """Годы и направления: индекс news_date_id_idx и semi join."""
+        plan = self.get_plan(
+            {
+                'year_from': 2005,
+                'year_to': 2007,
+                'direction_slugs': 'direction-1,direction-2',
+            }
+        )
+        self.assertIn('news_date_id_idx', plan)
+        self.assertIn('Semi Join', plan)
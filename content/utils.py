@@ -2,8 +2,18 @@
 
 Функции:
     1. ckeditor_function: Функция создающая text поля для моделей проекта.
+    2. image_meta_function: Функция создающая поля метаданных изображений.
+    3. search_vector_function: Функция создающая поле поискового вектора.
+    4. trigram_index_function: Функция создающая триграммный индекс поля.
+
+Классы:
+    1. TrigramIndex: Триграммный GIN-индекс по выражениям.
 """
 
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models
+from django.db.models.functions import Upper
 from django_ckeditor_5.fields import CKEditor5Field
 
 from .validators import validate_not_empty_html
@@ -28,6 +38,69 @@ def ckeditor_function(
     )
 
 
+def image_meta_function(verbose_name='Метаданные изображения'):
+    """Функция создающая JSON поле производных и метаданных изображения.
+
+    Поле заполняется автоматически после сохранения изображения
+    (см. content.images) и не редактируется в админке.
+    """
+    return models.JSONField(
+        verbose_name=verbose_name,
+        default=dict,
+        blank=True,
+        editable=False,
+    )
+
+
+def search_vector_function():
+    """Функция создающая поле поискового вектора (tsvector).
+
+    Поле заполняется автоматически после сохранения объекта
+    (см. content.search) и не редактируется в админке.
+    """
+    return SearchVectorField(
+        verbose_name='Поисковый вектор',
+        null=True,
+        editable=False,
+    )
+
+
+class TrigramIndex(GinIndex):
+    """Триграммный GIN-индекс (pg_trgm) по выражениям.
+
+    В PostgreSQL выражения индексируются с классом операторов
+    gin_trgm_ops. Другие базы данных (SQLite при локальной разработке)
+    не поддерживают GIN-индексы, поэтому в них создаётся обычный индекс
+    по тем же выражениям.
+    """
+
+    opclass = 'gin_trgm_ops'
+
+    def create_sql(self, model, schema_editor, using='', **kwargs):
+        """Возвращает SQL создания индекса для базы данных."""
+        if schema_editor.connection.vendor != 'postgresql':
+            index = models.Index(*self.expressions, name=self.name)
+            return index.create_sql(model, schema_editor, **kwargs)
+        index = GinIndex(
+            *(
+                OpClass(expression, name=self.opclass)
+                for expression in self.expressions
+            ),
+            name=self.name,
+        )
+        return index.create_sql(model, schema_editor, using=using, **kwargs)
+
+
+def trigram_index_function(field_name, name):
+    """Функция создающая триграммный индекс текстового поля.
+
+    Индекс строится по UPPER(поле) - тому же выражению, что и фильтр
+    icontains, поэтому ускоряет поиск в админке и подсказки
+    (см. content.suggest). Требует расширения PostgreSQL pg_trgm.
+    """
+    return TrigramIndex(Upper(field_name), name=name)
+
+
 def html_cleaner(field, tags):
     """Используется для очистки ckeditor полей от дефолтных тегов."""
     if field == tags:
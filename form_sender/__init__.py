@@ -3,6 +3,6 @@
 Это приложение предоставляет функциональность для:
 - Обработки форм обратной связи
 - Валидации пользовательских данных
-- Отправки email уведомлений
+- Отправки email уведомлений через очередь исходящей почты
 - Применения rate limiting для защиты от спама
 """
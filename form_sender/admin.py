@@ -0,0 +1,43 @@
+"""Модуль настройки административного интерфейса для исходящих писем."""
+
+from django.contrib import admin
+from django.utils import timezone
+
+from form_sender.models import OutgoingEmail
+from form_sender.outbox import SEND_TASK
+from jobs.queue import enqueue
+
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    """Настройка административного интерфейса для модели OutgoingEmail."""
+
+    list_display = ('subject', 'status', 'attempts', 'created_at', 'sent_at')
+    list_filter = ('status',)
+    search_fields = ('subject', 'body')
+    readonly_fields = (
+        'subject',
+        'body',
+        'from_email',
+        'recipients',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'last_error',
+        'created_at',
+        'sent_at',
+    )
+    actions = ('resend_emails',)
+    list_per_page = 50
+
+    @admin.action(description='Отправить выбранные письма повторно')
+    def resend_emails(self, request, queryset):
+        """Возвращает письма с ошибкой в очередь отправки."""
+        updated = queryset.filter(status=OutgoingEmail.Status.FAILED).update(
+            status=OutgoingEmail.Status.PENDING,
+            attempts=0,
+            next_attempt_at=timezone.now(),
+        )
+        if updated:
+            enqueue(SEND_TASK)
+        self.message_user(request, f'Возвращено в очередь писем: {updated}')
@@ -8,3 +8,4 @@ class FormsConfig(AppConfig):
 
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'form_sender'
+    verbose_name = 'Формы обратной связи'
@@ -0,0 +1,42 @@
+"""Django command для отправки писем из очереди исходящей почты.
+
+Обычно письма отправляет фоновая задача form_sender.send_outbox
+(воркер run_jobs). Команда отправляет готовые письма сразу, например
+из cron или при JOBS_ALWAYS_EAGER, когда повторы не планируются.
+
+Использование:
+    python manage.py send_outbox
+    python manage.py send_outbox --batch-size 20
+"""
+
+from django.core.management.base import BaseCommand
+
+from form_sender.models import OutgoingEmail
+from form_sender.outbox import schedule_retry, send_pending
+
+
+class Command(BaseCommand):
+    """Команда отправки писем из очереди."""
+
+    help = 'Отправляет письма из очереди исходящей почты'
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='Число писем, отправляемых через одно соединение',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Запускает команду."""
+        stats = send_pending(kwargs['batch_size'])
+        schedule_retry()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Отправлено: {stats[OutgoingEmail.Status.SENT]}, '
+                f'ожидают повтора: {stats[OutgoingEmail.Status.PENDING]}, '
+                f'с ошибкой: {stats[OutgoingEmail.Status.FAILED]}'
+            )
+        )
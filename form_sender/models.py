@@ -0,0 +1,58 @@
+"""Модуль с моделями приложения form_sender.
+
+Модели:
+    1. OutgoingEmail: письмо в очереди исходящей почты.
+"""
+
+from django.db import models
+from django.utils import timezone
+
+
+class OutgoingEmail(models.Model):
+    """Модель письма в очереди исходящей почты (outbox).
+
+    Письма форм сохраняются в очередь в запросе, а отправляются
+    фоновой задачей (form_sender.outbox). Модель хранит статус
+    доставки, число попыток и время следующей попытки.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Ожидает отправки'
+        SENT = 'sent', 'Отправлено'
+        FAILED = 'failed', 'Ошибка'
+
+    subject = models.CharField(max_length=255, verbose_name='Тема')
+    body = models.TextField(verbose_name='Текст')
+    from_email = models.CharField(max_length=254, verbose_name='Отправитель')
+    recipients = models.JSONField(
+        default=list, blank=True, verbose_name='Получатели'
+    )
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Статус',
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name='Попытки'
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now, verbose_name='Следующая попытка'
+    )
+    last_error = models.TextField(blank=True, verbose_name='Последняя ошибка')
+    created_at = models.DateTimeField(
+        auto_now_add=True, verbose_name='Дата создания'
+    )
+    sent_at = models.DateTimeField(
+        blank=True, null=True, verbose_name='Дата отправки'
+    )
+
+    class Meta:
+        verbose_name = 'Исходящее письмо'
+        verbose_name_plural = 'Исходящие письма'
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['status', 'next_attempt_at'])]
+
+    def __str__(self):
+        """Возвращает строковое представление письма."""
+        return f'{self.subject} ({self.get_status_display()})'
@@ -19,8 +19,8 @@ feedback_form_schema = extend_schema_view(
     post=extend_schema(
         summary='Отправить форму обратной связи',
         description=(
-            'Отправляет форму обратной связи и уведомляет администратора по '
-            'email.\n\n'
+            'Принимает форму обратной связи и ставит email-уведомление '
+            'администратору в очередь отправки.\n\n'
             '**Лимит запросов:**\n'
             '• 30 запросов в час\n'
         ),
@@ -0,0 +1,173 @@
+"""Очередь исходящей почты (outbox).
+
+Этот модуль содержит:
+- queue_email: сохранение письма в очередь и постановка задачи отправки.
+- send_pending: отправка готовых писем пакетами.
+- schedule_retry: постановка задачи к времени ближайшего повтора.
+
+Письмо сохраняется в модель OutgoingEmail в той же транзакции, что и
+задача отправки (jobs), поэтому запрос не ждёт SMTP-сервер. Задача
+отправляет письма пакетами по EMAIL_OUTBOX['BATCH_SIZE'] через одно
+соединение почтового бэкенда. При ошибке письмо остаётся в очереди
+с экспоненциальной задержкой, после EMAIL_OUTBOX['MAX_ATTEMPTS']
+попыток получает статус ошибки. Письма захватываются через
+SELECT ... FOR UPDATE SKIP LOCKED, поэтому несколько воркеров
+не отправляют одно письмо дважды.
+"""
+
+import logging
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Min
+from django.utils import timezone
+
+from form_sender.models import OutgoingEmail
+from jobs.models import Job
+from jobs.queue import enqueue
+
+logger = logging.getLogger('rassvet.form_sender')
+
+SEND_TASK = 'form_sender.send_outbox'
+"""Имя задачи отправки писем из очереди."""
+
+RETRY_KEY = f'{SEND_TASK}:retry'
+"""Ключ задачи повторной отправки, отдельный от ключа новых писем."""
+
+UPDATE_FIELDS = (
+    'status',
+    'attempts',
+    'next_attempt_at',
+    'last_error',
+    'sent_at',
+)
+"""Поля письма, изменяемые при отправке."""
+
+
+def queue_email(
+    subject: str,
+    body: str,
+    recipients: list[str],
+    from_email: str | None = None,
+) -> OutgoingEmail:
+    """Сохраняет письмо в очередь и ставит задачу его отправки."""
+    with transaction.atomic():
+        email = OutgoingEmail.objects.create(
+            subject=subject,
+            body=body,
+            from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+            recipients=[recipient for recipient in recipients if recipient],
+        )
+        enqueue(SEND_TASK)
+    return email
+
+
+def get_retry_delay(attempts: int) -> float:
+    """Возвращает экспоненциальную задержку перед повтором в секундах."""
+    return settings.EMAIL_OUTBOX['RETRY_DELAY'] * 2 ** (attempts - 1)
+
+
+def record_failure(email: OutgoingEmail, error: Exception, now):
+    """Записывает неудачную попытку и время следующей."""
+    email.attempts += 1
+    email.last_error = str(error) or repr(error)
+    if email.attempts >= settings.EMAIL_OUTBOX['MAX_ATTEMPTS']:
+        email.status = OutgoingEmail.Status.FAILED
+        logger.error('Письмо %s не отправлено: %s', email.pk, error)
+    else:
+        email.next_attempt_at = now + timedelta(
+            seconds=get_retry_delay(email.attempts)
+        )
+
+
+def send_batch(emails: list[OutgoingEmail]) -> Counter:
+    """Отправляет пакет писем через одно соединение и записывает статусы."""
+    stats = Counter()
+    now = timezone.now()
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as e:
+        for email in emails:
+            record_failure(email, e, now)
+    else:
+        try:
+            for email in emails:
+                if not email.recipients:
+                    email.status = OutgoingEmail.Status.FAILED
+                    email.last_error = 'Не указаны получатели'
+                    continue
+                message = EmailMessage(
+                    email.subject,
+                    email.body,
+                    email.from_email,
+                    email.recipients,
+                    connection=connection,
+                )
+                try:
+                    connection.send_messages([message])
+                except Exception as e:
+                    record_failure(email, e, now)
+                    continue
+                email.attempts += 1
+                email.status = OutgoingEmail.Status.SENT
+                email.sent_at = timezone.now()
+                email.last_error = ''
+        finally:
+            connection.close()
+    for email in emails:
+        stats[email.status] += 1
+    OutgoingEmail.objects.bulk_update(emails, UPDATE_FIELDS)
+    return stats
+
+
+def send_pending(batch_size: int | None = None) -> Counter:
+    """Отправляет готовые письма очереди и возвращает число по статусам.
+
+    Пакет захватывается в транзакции и отправляется до её фиксации.
+    Письма, получившие задержку, в этом вызове повторно не
+    отправляются.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX['BATCH_SIZE']
+    stats = Counter()
+    while True:
+        with transaction.atomic():
+            emails = list(
+                OutgoingEmail.objects.select_for_update(skip_locked=True)
+                .filter(
+                    status=OutgoingEmail.Status.PENDING,
+                    next_attempt_at__lte=timezone.now(),
+                )
+                .order_by('next_attempt_at', 'pk')[:batch_size]
+            )
+            if not emails:
+                return stats
+            stats.update(send_batch(emails))
+
+
+def schedule_retry():
+    """Ставит задачу отправки ко времени ближайшей повторной попытки.
+
+    Если задача повтора уже ожидает выполнения, её запуск переносится
+    на более раннее время, но не откладывается. В режиме
+    JOBS_ALWAYS_EAGER задача выполнилась бы сразу, поэтому повторы
+    отправляются следующей задачей или командой send_outbox.
+    """
+    if settings.JOBS['ALWAYS_EAGER']:
+        return
+    next_attempt_at = OutgoingEmail.objects.filter(
+        status=OutgoingEmail.Status.PENDING
+    ).aggregate(next_attempt_at=Min('next_attempt_at'))['next_attempt_at']
+    if next_attempt_at is None:
+        return
+    delay = (next_attempt_at - timezone.now()).total_seconds()
+    job = enqueue(SEND_TASK, key=RETRY_KEY, delay=max(delay, 0))
+    if job is not None and job.run_at > next_attempt_at:
+        Job.objects.filter(
+            pk=job.pk,
+            status=Job.Status.PENDING,
+            run_at__gt=next_attempt_at,
+        ).update(run_at=next_attempt_at)
@@ -0,0 +1,16 @@
+"""Фоновые задачи приложения form_sender.
+
+Этот модуль содержит задачи очереди jobs:
+- form_sender.send_outbox: отправка писем из очереди исходящей почты.
+"""
+
+from form_sender.outbox import SEND_TASK, schedule_retry, send_pending
+from jobs.queue import task
+
+
+@task(SEND_TASK)
+def send_outbox_task() -> dict:
+    """Отправляет готовые письма и планирует повтор неотправленных."""
+    stats = send_pending()
+    schedule_retry()
+    return dict(stats)
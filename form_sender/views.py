@@ -2,12 +2,14 @@
 
 Содержит представления для следующих форм:
 - FeedbackFormView: форма обратной связи.
+
+Письма форм не отправляются в запросе, а сохраняются в очередь
+исходящей почты (form_sender.outbox) и отправляются воркером.
 """
 
 import os
 
 from django.conf import settings
-from django.core.mail import send_mail
 
 from drf_spectacular.utils import (
     extend_schema,
@@ -15,10 +17,12 @@ from drf_spectacular.utils import (
 
 from rest_framework import status
 from rest_framework.response import Response
-from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
 
+from rassvet.throttling import ScopedRateThrottle
+
 from .openapi import feedback_form_schema
+from .outbox import queue_email
 from .serializers import (
     FeedbackFormSerializer,
 )
@@ -39,13 +43,12 @@ class FeedbackFormView(APIView):
             name = serializer.validated_data['name']
             phone_number = serializer.validated_data['phone_number']
             message = serializer.validated_data['message']
-            send_mail(
+            queue_email(
                 'Форма обратной связи',
                 f'{name} оставил заявку на обратную связь.'
                 f'Телефон: {phone_number}. Сообщение: {message}',
-                settings.EMAIL_HOST_USER,
                 [os.environ.get('EMAIL_SEND')],
-                fail_silently=not settings.DEBUG,
+                from_email=settings.EMAIL_HOST_USER,
             )
             return Response(
                 {
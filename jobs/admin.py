@@ -0,0 +1,36 @@
+"""Модуль настройки административного интерфейса для фоновых задач."""
+
+from django.contrib import admin
+
+from jobs.models import Job
+from jobs.queue import requeue
+
+
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    """Настройка административного интерфейса для модели Job."""
+
+    list_display = ('name', 'key', 'status', 'attempts', 'run_at')
+    list_filter = ('status', 'name')
+    search_fields = ('name', 'key')
+    readonly_fields = (
+        'name',
+        'key',
+        'args',
+        'attempts',
+        'locked_at',
+        'last_error',
+        'created_at',
+        'updated_at',
+    )
+    actions = ('retry_jobs',)
+    list_per_page = 50
+
+    @admin.action(description='Повторить выбранные задачи')
+    def retry_jobs(self, request, queryset):
+        """Возвращает завершившиеся с ошибкой задачи в очередь."""
+        updated = sum(
+            requeue(job, reset_attempts=True)
+            for job in queryset.filter(status=Job.Status.FAILED)
+        )
+        self.message_user(request, f'Возвращено в очередь задач: {updated}')
@@ -0,0 +1,19 @@
+"""Конфигурация приложения jobs.
+
+Это приложение отвечает за фоновые задачи, выполняемые воркером.
+"""
+
+from django.apps import AppConfig
+from django.utils.module_loading import autodiscover_modules
+
+
+class JobsConfig(AppConfig):
+    """Конфигурационный класс приложения jobs."""
+
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'jobs'
+    verbose_name = 'Фоновые задачи'
+
+    def ready(self):
+        """Регистрирует задачи из модулей tasks установленных приложений."""
+        autodiscover_modules('tasks')
@@ -0,0 +1,78 @@
+"""Django command воркера фоновых задач.
+
+Команда в цикле захватывает готовые задачи из очереди (jobs.queue) и
+выполняет их. Для параллельной обработки запускается несколько
+процессов команды: задачи распределяются между ними без повторов.
+
+Использование:
+    python manage.py run_jobs
+    python manage.py run_jobs --once
+    python manage.py run_jobs --batch 20 --sleep 2
+"""
+
+import signal
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from jobs.queue import delete_finished_jobs, run_pending
+
+
+class Command(BaseCommand):
+    """Команда воркера фоновых задач."""
+
+    help = 'Выполняет фоновые задачи из очереди'
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы для команды."""
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Выполнить готовые задачи и завершиться',
+        )
+        parser.add_argument(
+            '--batch',
+            type=int,
+            default=10,
+            help='Число задач, захватываемых за один проход',
+        )
+        parser.add_argument(
+            '--sleep',
+            type=float,
+            default=1.0,
+            help='Пауза в секундах, когда очередь пуста',
+        )
+        parser.add_argument(
+            '--keep-days',
+            type=int,
+            default=7,
+            help='Сколько дней хранить выполненные задачи',
+        )
+
+    def handle(self, *args, **kwargs):
+        """Запускает цикл воркера до сигнала остановки."""
+        self.running = True
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        deleted = delete_finished_jobs(timedelta(days=kwargs['keep_days']))
+        if deleted:
+            self.stdout.write(f'Удалено выполненных задач: {deleted}')
+        self.stdout.write('Воркер фоновых задач запущен')
+        while self.running:
+            close_old_connections()
+            count = run_pending(kwargs['batch'])
+            if count:
+                self.stdout.write(f'Выполнено задач: {count}')
+            if kwargs['once'] and count < kwargs['batch']:
+                break
+            if not count:
+                time.sleep(kwargs['sleep'])
+        self.stdout.write(
+            self.style.SUCCESS('Воркер фоновых задач остановлен')
+        )
+
+    def stop(self, signum, frame):
+        """Завершает цикл после выполнения текущих задач."""
+        self.running = False
@@ -0,0 +1,68 @@
+"""Модуль с моделями приложения jobs.
+
+Модели:
+    1. Job: фоновая задача в очереди воркера.
+"""
+
+from django.db import models
+from django.db.models import Q
+
+
+class Job(models.Model):
+    """Модель фоновой задачи.
+
+    Задача ссылается на зарегистрированную функцию (jobs.queue.task) по
+    имени и хранит её аргументы в JSON. Ключ key делает постановку
+    идемпотентной: в очереди может ожидать не более одной задачи
+    с одинаковым ключом.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Ожидает'
+        RUNNING = 'running', 'Выполняется'
+        DONE = 'done', 'Выполнена'
+        FAILED = 'failed', 'Ошибка'
+
+    name = models.CharField(max_length=100, verbose_name='Задача')
+    key = models.CharField(max_length=255, verbose_name='Ключ')
+    args = models.JSONField(default=list, blank=True, verbose_name='Аргументы')
+    status = models.CharField(
+        max_length=10,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name='Статус',
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0, verbose_name='Попытки'
+    )
+    max_attempts = models.PositiveSmallIntegerField(
+        default=5, verbose_name='Максимум попыток'
+    )
+    run_at = models.DateTimeField(verbose_name='Запуск не ранее')
+    locked_at = models.DateTimeField(
+        blank=True, null=True, verbose_name='Взята в работу'
+    )
+    last_error = models.TextField(blank=True, verbose_name='Последняя ошибка')
+    created_at = models.DateTimeField(
+        auto_now_add=True, verbose_name='Дата создания'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True, verbose_name='Дата обновления'
+    )
+
+    class Meta:
+        verbose_name = 'Фоновая задача'
+        verbose_name_plural = 'Фоновые задачи'
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['status', 'run_at'])]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['key'],
+                condition=Q(status='pending'),
+                name='jobs_job_unique_pending_key',
+            )
+        ]
+
+    def __str__(self):
+        """Возвращает строковое представление задачи."""
+        return f'{self.name} ({self.key})'
@@ -0,0 +1,236 @@
+"""Очередь фоновых задач в базе данных.
+
+Этот модуль содержит:
+- task: декоратор регистрации функции как фоновой задачи.
+- enqueue: постановка задачи в очередь с идемпотентным ключом.
+- requeue: возврат задачи в очередь.
+- claim_jobs: захват готовых задач воркером.
+- run_job: выполнение задачи с повторами при ошибке.
+- run_pending: один проход воркера по очереди.
+
+Задачи хранятся в модели Job, поэтому постановка внутри транзакции
+фиксируется вместе с изменёнными данными и не видна воркеру до
+фиксации. Воркеры (команда run_jobs) захватывают задачи через
+SELECT ... FOR UPDATE SKIP LOCKED и могут работать в нескольких
+процессах. При JOBS_ALWAYS_EAGER задачи выполняются в текущем процессе
+после фиксации транзакции без записи в очередь (для тестов и локальной
+разработки).
+"""
+
+import logging
+import traceback
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from jobs.models import Job
+
+logger = logging.getLogger('rassvet.jobs')
+
+TASKS = {}
+"""Зарегистрированные задачи: имя задачи -> функция."""
+
+
+def task(name: str):
+    """Декоратор, регистрирующий функцию как фоновую задачу.
+
+    Аргументы задачи передаются через JSON, поэтому функция должна
+    принимать только сериализуемые в JSON значения.
+    """
+
+    def decorator(func):
+        if name in TASKS:
+            raise ValueError(f'Задача {name} уже зарегистрирована')
+        TASKS[name] = func
+        return func
+
+    return decorator
+
+
+def get_job_key(name: str, args) -> str:
+    """Возвращает ключ задачи по умолчанию: имя и аргументы."""
+    return ':'.join([name, *map(str, args)])
+
+
+def run_task(name: str, args):
+    """Выполняет зарегистрированную задачу в текущем процессе."""
+    return TASKS[name](*args)
+
+
+def enqueue(
+    name: str,
+    *args,
+    key: str | None = None,
+    delay: float = 0,
+    max_attempts: int | None = None,
+) -> Job | None:
+    """Ставит задачу в очередь.
+
+    Если задача с тем же ключом уже ожидает выполнения, новая не
+    создаётся и возвращается существующая. Задачи, которые выполняются
+    в данный момент, не учитываются: изменения, сделанные после их
+    захвата, будут обработаны новой задачей.
+
+    Args:
+        name: Имя зарегистрированной задачи.
+        *args: Аргументы задачи (сериализуемые в JSON).
+        key: Ключ идемпотентности, по умолчанию имя и аргументы.
+        delay: Задержка запуска в секундах.
+        max_attempts: Число попыток, по умолчанию JOBS_MAX_ATTEMPTS.
+
+    Returns:
+        Задача в очереди или None в режиме JOBS_ALWAYS_EAGER.
+    """
+    if name not in TASKS:
+        raise ValueError(f'Задача {name} не зарегистрирована')
+    if settings.JOBS['ALWAYS_EAGER']:
+        transaction.on_commit(partial(run_task, name, list(args)))
+        return None
+    key = key or get_job_key(name, args)
+    try:
+        with transaction.atomic():
+            return Job.objects.create(
+                name=name,
+                key=key,
+                args=list(args),
+                max_attempts=max_attempts or settings.JOBS['MAX_ATTEMPTS'],
+                run_at=timezone.now() + timedelta(seconds=delay),
+            )
+    except IntegrityError:
+        return Job.objects.filter(key=key, status=Job.Status.PENDING).first()
+
+
+def requeue(job: Job, run_at=None, reset_attempts: bool = False) -> bool:
+    """Возвращает задачу в очередь.
+
+    Если задача с тем же ключом уже ожидает выполнения, текущая
+    удаляется: ожидающая задача выполнит ту же работу.
+    Возвращает True, если задача возвращена в очередь.
+    """
+    job.status = Job.Status.PENDING
+    job.run_at = run_at or timezone.now()
+    job.locked_at = None
+    if reset_attempts:
+        job.attempts = 0
+    try:
+        with transaction.atomic():
+            job.save()
+    except IntegrityError:
+        job.delete()
+        return False
+    return True
+
+
+def get_retry_delay(attempts: int) -> float:
+    """Возвращает экспоненциальную задержку перед повтором в секундах."""
+    return settings.JOBS['RETRY_DELAY'] * 2 ** (attempts - 1)
+
+
+def release_stale_jobs() -> int:
+    """Возвращает в очередь задачи, захваченные упавшими воркерами.
+
+    Попытка учитывается при захвате задачи, поэтому задача, которая
+    каждый раз роняет воркер, после max_attempts попыток получает
+    статус failed, а не возвращается в очередь бесконечно.
+    """
+    now = timezone.now()
+    threshold = now - timedelta(seconds=settings.JOBS['LOCK_TIMEOUT'])
+    stale = Job.objects.filter(
+        status=Job.Status.RUNNING, locked_at__lt=threshold
+    )
+    released = 0
+    for job in stale:
+        if job.attempts >= job.max_attempts:
+            logger.error('Задача %s прервана вместе с воркером', job)
+            job.status = Job.Status.FAILED
+            job.locked_at = None
+            job.last_error = 'Воркер завершился во время выполнения задачи'
+            job.save()
+            continue
+        released += requeue(
+            job,
+            run_at=now + timedelta(seconds=get_retry_delay(job.attempts)),
+        )
+    return released
+
+
+def claim_jobs(limit: int) -> list[Job]:
+    """Захватывает готовые к выполнению задачи.
+
+    Строки блокируются с SKIP LOCKED, поэтому несколько воркеров
+    не получат одну и ту же задачу. Попытка засчитывается в том же
+    UPDATE, до выполнения задачи.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        jobs = list(
+            Job.objects.select_for_update(skip_locked=True)
+            .filter(status=Job.Status.PENDING, run_at__lte=now)
+            .order_by('run_at')[:limit]
+        )
+        Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+            status=Job.Status.RUNNING,
+            locked_at=now,
+            attempts=F('attempts') + 1,
+        )
+    for job in jobs:
+        job.status = Job.Status.RUNNING
+        job.locked_at = now
+        job.attempts += 1
+    return jobs
+
+
+def run_job(job: Job) -> bool:
+    """Выполняет захваченную задачу.
+
+    При ошибке задача возвращается в очередь с экспоненциальной
+    задержкой, пока не исчерпано число попыток, после чего получает
+    статус failed. Возвращает True при успешном выполнении.
+    """
+    try:
+        run_task(job.name, job.args)
+    except Exception:
+        job.last_error = traceback.format_exc()
+        if job.attempts < job.max_attempts:
+            logger.warning(
+                'Задача %s завершилась ошибкой (попытка %s из %s)',
+                job,
+                job.attempts,
+                job.max_attempts,
+            )
+            requeue(
+                job,
+                run_at=timezone.now()
+                + timedelta(seconds=get_retry_delay(job.attempts)),
+            )
+        else:
+            logger.error('Задача %s завершилась ошибкой', job, exc_info=True)
+            job.status = Job.Status.FAILED
+            job.save()
+        return False
+    job.status = Job.Status.DONE
+    job.last_error = ''
+    job.save()
+    return True
+
+
+def run_pending(limit: int = 10) -> int:
+    """Выполняет готовые задачи и возвращает их количество."""
+    release_stale_jobs()
+    jobs = claim_jobs(limit)
+    for job in jobs:
+        run_job(job)
+    return len(jobs)
+
+
+def delete_finished_jobs(older_than: timedelta) -> int:
+    """Удаляет выполненные задачи старше заданного возраста."""
+    count, _ = Job.objects.filter(
+        status=Job.Status.DONE,
+        updated_at__lt=timezone.now() - older_than,
+    ).delete()
+    return count
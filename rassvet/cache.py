@@ -0,0 +1,169 @@
+"""Двухуровневый бэкенд кэша проекта 'АПЦ Рассвет'.
+
+Этот модуль содержит:
+- TwoTierCache: бэкенд кэша с локальным LRU-уровнем в памяти процесса
+  перед общим кэшем (Redis, memcached или LocMemCache в тестах).
+
+Локальный уровень используется только для ключей с префиксами из опции
+LOCAL_KEY_PREFIXES. Это ключи, значение которых по построению
+не меняется: например, ключи ответов API содержат версии контента
+моделей, поэтому после сохранения в админке запрос формирует новый ключ
+и не может получить устаревший ответ из локального уровня другого
+процесса. Все остальные ключи (версии контента, счётчики ограничения
+частоты запросов и т.д.) читаются и пишутся только в общий кэш.
+"""
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.core.cache.backends.locmem import LocMemCache
+
+_MISSING = object()
+
+
+class TwoTierCache(BaseCache):
+    """Кэш с локальным LRU-уровнем перед общим кэшем.
+
+    Опции (OPTIONS):
+        SHARED_ALIAS: псевдоним общего кэша в CACHES.
+        LOCAL_KEY_PREFIXES: префиксы неизменяемых ключей, которые
+            можно хранить в памяти процесса.
+        LOCAL_MAX_ENTRIES: максимальное число записей локального уровня.
+        LOCAL_TIMEOUT: время жизни записи локального уровня в секундах.
+    """
+
+    def __init__(self, location, params):
+        """Инициализирует локальный уровень и параметры общего кэша."""
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        self._shared_alias = options.get('SHARED_ALIAS', 'shared')
+        self._local_prefixes = tuple(options.get('LOCAL_KEY_PREFIXES', ()))
+        self._local_timeout = options.get('LOCAL_TIMEOUT', 60)
+        self._local = LocMemCache(
+            location or 'two-tier-local',
+            {
+                'TIMEOUT': self._local_timeout,
+                'OPTIONS': {
+                    'MAX_ENTRIES': options.get('LOCAL_MAX_ENTRIES', 500),
+                    'CULL_FREQUENCY': 10,
+                },
+            },
+        )
+
+    @property
+    def shared(self) -> BaseCache:
+        """Возвращает общий кэш."""
+        return caches[self._shared_alias]
+
+    def _is_local(self, key) -> bool:
+        """Проверяет, можно ли хранить ключ в локальном уровне."""
+        return bool(self._local_prefixes) and str(key).startswith(
+            self._local_prefixes
+        )
+
+    def _get_local_timeout(self, timeout):
+        """Ограничивает время жизни записи локального уровня."""
+        if timeout is DEFAULT_TIMEOUT or timeout is None:
+            return self._local_timeout
+        return min(timeout, self._local_timeout)
+
+    def get(self, key, default=None, version=None):
+        """Возвращает значение из локального уровня или общего кэша."""
+        if not self._is_local(key):
+            return self.shared.get(key, default, version=version)
+        value = self._local.get(key, _MISSING, version=version)
+        if value is not _MISSING:
+            return value
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return default
+        self._local.set(key, value, version=version)
+        return value
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Сохраняет значение в общий кэш и, если можно, в локальный."""
+        self.shared.set(key, value, timeout, version=version)
+        if self._is_local(key):
+            self._local.set(
+                key, value, self._get_local_timeout(timeout), version=version
+            )
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        """Добавляет значение в общий кэш, если ключа ещё нет."""
+        added = self.shared.add(key, value, timeout, version=version)
+        if added and self._is_local(key):
+            self._local.set(
+                key, value, self._get_local_timeout(timeout), version=version
+            )
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        """Обновляет время жизни ключа в общем кэше."""
+        return self.shared.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        """Удаляет ключ из обоих уровней."""
+        self._local.delete(key, version=version)
+        return self.shared.delete(key, version=version)
+
+    def has_key(self, key, version=None):
+        """Проверяет наличие ключа в кэше."""
+        if self._is_local(key) and self._local.has_key(key, version=version):
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        """Атомарно увеличивает значение в общем кэше."""
+        return self.shared.incr(key, delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        """Атомарно уменьшает значение в общем кэше."""
+        return self.shared.decr(key, delta, version=version)
+
+    def get_many(self, keys, version=None):
+        """Возвращает значения нескольких ключей за одно обращение."""
+        result = {}
+        shared_keys = []
+        for key in keys:
+            value = _MISSING
+            if self._is_local(key):
+                value = self._local.get(key, _MISSING, version=version)
+            if value is _MISSING:
+                shared_keys.append(key)
+            else:
+                result[key] = value
+        if shared_keys:
+            found = self.shared.get_many(shared_keys, version=version)
+            for key, value in found.items():
+                if self._is_local(key):
+                    self._local.set(key, value, version=version)
+            result.update(found)
+        return result
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        """Сохраняет несколько значений за одно обращение."""
+        failed = self.shared.set_many(data, timeout, version=version)
+        local_data = {
+            key: value
+            for key, value in data.items()
+            if self._is_local(key) and key not in failed
+        }
+        if local_data:
+            self._local.set_many(
+                local_data, self._get_local_timeout(timeout), version=version
+            )
+        return failed
+
+    def delete_many(self, keys, version=None):
+        """Удаляет несколько ключей из обоих уровней."""
+        keys = list(keys)
+        self._local.delete_many(keys, version=version)
+        self.shared.delete_many(keys, version=version)
+
+    def clear(self):
+        """Очищает общий кэш и локальный уровень текущего процесса."""
+        self._local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        """Закрывает соединение общего кэша."""
+        self.shared.close(**kwargs)
@@ -0,0 +1,126 @@
+"""Метрики проекта 'АПЦ Рассвет' в формате Prometheus.
+
+Этот модуль содержит:
+- Метрики запросов: длительность, число и время SQL-запросов,
+  время сериализации, размер ответа и попадания в кэш ответов.
+- track_serialization: контекстный менеджер замера сериализации.
+- record_cache_result: учёт попадания или промаха кэша ответов.
+- metrics_view: представление /metrics, защищённое токеном.
+
+Метрики размечаются меткой view вида 'NewsViewSet.list', которую
+выставляет MetricsMiddleware. При запуске в несколько процессов
+(gunicorn) нужно задать переменную окружения PROMETHEUS_MULTIPROC_DIR,
+тогда /metrics собирает значения всех процессов.
+"""
+
+import hmac
+import os
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.http import Http404, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+UNKNOWN_VIEW = 'unknown'
+"""Метка запросов, не сопоставленных ни одному представлению."""
+
+REQUEST_LATENCY = Histogram(
+    'rassvet_http_request_duration_seconds',
+    'Длительность обработки HTTP-запроса.',
+    ['view', 'method', 'status'],
+)
+SQL_QUERIES = Histogram(
+    'rassvet_sql_queries_per_request',
+    'Число SQL-запросов на один HTTP-запрос.',
+    ['view'],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, float('inf')),
+)
+SQL_DURATION = Histogram(
+    'rassvet_sql_duration_seconds',
+    'Суммарное время SQL-запросов одного HTTP-запроса.',
+    ['view'],
+)
+SERIALIZATION_DURATION = Histogram(
+    'rassvet_serialization_duration_seconds',
+    'Время сериализации и рендеринга ответа без учёта SQL-запросов.',
+    ['view'],
+)
+RESPONSE_SIZE = Histogram(
+    'rassvet_response_size_bytes',
+    'Размер тела ответа.',
+    ['view'],
+    buckets=(2**10, 2**12, 2**14, 2**16, 2**18, 2**20, 2**22, float('inf')),
+)
+RESPONSE_CACHE = Counter(
+    'rassvet_response_cache_total',
+    'Обращения к кэшу ответов API.',
+    ['view', 'result'],
+)
+
+
+def get_view_label(request) -> str:
+    """Возвращает метку представления, выставленную MetricsMiddleware."""
+    return getattr(request, 'metrics_view', UNKNOWN_VIEW)
+
+
+@contextmanager
+def track_serialization(request):
+    """Замеряет время сериализации без учёта SQL-запросов внутри блока."""
+    stats = getattr(request, 'metrics_stats', None)
+    if stats is None:
+        yield
+        return
+    sql_before = stats.duration
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        SERIALIZATION_DURATION.labels(get_view_label(request)).observe(
+            max(elapsed - (stats.duration - sql_before), 0.0)
+        )
+
+
+def record_cache_result(request, hit: bool):
+    """Учитывает попадание или промах кэша ответов."""
+    if getattr(request, 'metrics_stats', None) is None:
+        return
+    RESPONSE_CACHE.labels(
+        get_view_label(request), 'hit' if hit else 'miss'
+    ).inc()
+
+
+def get_registry():
+    """Возвращает реестр метрик с учётом режима нескольких процессов."""
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics_view(request):
+    """Отдаёт метрики в формате Prometheus.
+
+    Доступ требует заголовка 'Authorization: Bearer <METRICS_TOKEN>'.
+    Без настроенного токена эндпоинт недоступен (404).
+    """
+    token = settings.METRICS_TOKEN
+    if not token:
+        raise Http404
+    expected = f'Bearer {token}'
+    provided = request.headers.get('Authorization', '')
+    if not hmac.compare_digest(provided.encode(), expected.encode()):
+        return HttpResponse(status=401)
+    return HttpResponse(
+        generate_latest(get_registry()), content_type=CONTENT_TYPE_LATEST
+    )
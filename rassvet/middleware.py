@@ -0,0 +1,216 @@
+"""Middleware проекта 'АПЦ Рассвет'.
+
+Этот модуль содержит:
+- QueryStats: статистика SQL-запросов одного HTTP-запроса.
+- QueryBudgetExceeded: исключение превышения бюджета запросов.
+- QueryInspectorMiddleware: подсчёт SQL-запросов, поиск N+1
+  и проверка бюджета запросов представлений.
+- MetricsMiddleware: сбор метрик запросов в формате Prometheus
+  (см. rassvet.metrics), включается настройкой METRICS_ENABLED.
+
+Настройки задаются словарём QUERY_INSPECTOR в settings:
+    ENABLED: включает middleware.
+    SAMPLE_RATE: доля инспектируемых запросов (0.0 - 1.0).
+    STRICT: при превышении бюджета выбрасывать QueryBudgetExceeded
+        вместо записи в лог (для тестов).
+    REPEAT_THRESHOLD: число повторов одной формы запроса, начиная
+        с которого она считается признаком N+1.
+
+Бюджет объявляется в ViewSet атрибутом query_budget - словарём
+{действие: максимальное число запросов}, например
+query_budget = {'list': 4, 'retrieve': 3}.
+"""
+
+import logging
+import random
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+
+from rassvet import metrics
+
+logger = logging.getLogger('rassvet.queries')
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER_RE = re.compile(r'%s|\?')
+_IN_LIST_RE = re.compile(r'IN \((?:\?, )*\?\)')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def normalize_sql(sql: str) -> str:
+    """Приводит SQL к форме без значений параметров.
+
+    Запросы, отличающиеся только литералами и длиной списка IN (...),
+    получают одинаковую форму.
+    """
+    shape = _STRING_RE.sub('?', sql)
+    shape = _NUMBER_RE.sub('?', shape)
+    shape = _PLACEHOLDER_RE.sub('?', shape)
+    shape = _IN_LIST_RE.sub('IN (...)', shape)
+    return _SPACE_RE.sub(' ', shape).strip()
+
+
+def resolve_view(request, view_func) -> tuple[type | None, str | None, str]:
+    """Возвращает класс представления, действие ViewSet и имя для логов."""
+    view_class = getattr(view_func, 'cls', None)
+    actions = getattr(view_func, 'actions', None) or {}
+    action = actions.get(request.method.lower())
+    if view_class is None:
+        name = getattr(view_func, '__qualname__', repr(view_func))
+    elif action:
+        name = f'{view_class.__name__}.{action}'
+    else:
+        name = view_class.__name__
+    return view_class, action, name
+
+
+class QueryBudgetExceeded(Exception):
+    """Представление выполнило больше SQL-запросов, чем объявлено."""
+
+
+class QueryStats:
+    """Статистика SQL-запросов одного HTTP-запроса.
+
+    Формы запросов запоминаются, только если track_shapes=True:
+    нормализация SQL заметно дороже простого подсчёта.
+    """
+
+    def __init__(self, track_shapes: bool = True):
+        """Инициализирует пустую статистику."""
+        self.count = 0
+        self.duration = 0.0
+        self.track_shapes = track_shapes
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        """Выполняет запрос, замеряя время и запоминая его форму."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            if self.track_shapes:
+                self.shapes[normalize_sql(sql)] += 1
+
+    def get_repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Возвращает формы запросов, повторённые не менее threshold раз."""
+        return [
+            (shape, count)
+            for shape, count in self.shapes.most_common()
+            if count >= threshold
+        ]
+
+
+class QueryInspectorMiddleware:
+    """Middleware подсчёта SQL-запросов и поиска N+1.
+
+    Статистика сохраняется в request.query_stats. Повторяющиеся формы
+    запросов и превышение бюджета представления записываются в лог
+    'rassvet.queries' вместе с именем представления.
+    """
+
+    def __init__(self, get_response):
+        """Сохраняет обработчик и читает настройки."""
+        self.get_response = get_response
+        options = getattr(settings, 'QUERY_INSPECTOR', {})
+        self.enabled = options.get('ENABLED', False)
+        self.sample_rate = options.get('SAMPLE_RATE', 1.0)
+        self.strict = options.get('STRICT', False)
+        self.repeat_threshold = options.get('REPEAT_THRESHOLD', 3)
+
+    def __call__(self, request):
+        """Выполняет запрос, собирая статистику SQL-запросов."""
+        if not self.enabled or random.random() >= self.sample_rate:
+            return self.get_response(request)
+        stats = QueryStats()
+        request.query_stats = stats
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        self.inspect(request, stats)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Запоминает имя представления, действие и его бюджет запросов."""
+        if not hasattr(request, 'query_stats'):
+            return
+        view_class, action, request.query_view_name = resolve_view(
+            request, view_func
+        )
+        request.query_budget = getattr(view_class, 'query_budget', {}).get(
+            action
+        )
+
+    def inspect(self, request, stats: QueryStats):
+        """Проверяет статистику на N+1 и превышение бюджета."""
+        view_name = getattr(request, 'query_view_name', request.path)
+        logger.debug(
+            '%s: %d SQL-запросов за %.1f мс',
+            view_name,
+            stats.count,
+            stats.duration * 1000,
+        )
+        for shape, count in stats.get_repeated(self.repeat_threshold):
+            logger.warning(
+                '%s: возможный N+1, запрос выполнен %d раз: %s',
+                view_name,
+                count,
+                shape,
+            )
+        budget = getattr(request, 'query_budget', None)
+        if budget is None or stats.count <= budget:
+            return
+        message = (
+            f'{view_name}: выполнено {stats.count} SQL-запросов '
+            f'при бюджете {budget}'
+        )
+        if self.strict:
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
+
+
+class MetricsMiddleware:
+    """Middleware сбора метрик запросов в формате Prometheus.
+
+    Замеряет длительность запроса, число и время SQL-запросов и размер
+    ответа. Для потоковых ответов размер не учитывается.
+    """
+
+    def __init__(self, get_response):
+        """Сохраняет обработчик и читает настройки."""
+        self.get_response = get_response
+        self.enabled = getattr(settings, 'METRICS_ENABLED', False)
+
+    def __call__(self, request):
+        """Выполняет запрос, собирая его метрики."""
+        if not self.enabled:
+            return self.get_response(request)
+        stats = QueryStats(track_shapes=False)
+        request.metrics_stats = stats
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+        view = metrics.get_view_label(request)
+        metrics.REQUEST_LATENCY.labels(
+            view, request.method, str(response.status_code)
+        ).observe(elapsed)
+        metrics.SQL_QUERIES.labels(view).observe(stats.count)
+        metrics.SQL_DURATION.labels(view).observe(stats.duration)
+        if not response.streaming:
+            metrics.RESPONSE_SIZE.labels(view).observe(len(response.content))
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Запоминает метку представления для метрик."""
+        if hasattr(request, 'metrics_stats'):
+            request.metrics_view = resolve_view(request, view_func)[2]
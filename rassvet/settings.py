@@ -4,7 +4,10 @@
 - Базовые параметры проекта (SECRET_KEY, DEBUG и т.д.)
 - Настройки приложений (INSTALLED_APPS)
 - Конфигурацию базы данных (PostgreSQL)
-- Настройки статических файлов и медиа
+- Настройки статических файлов и медиа (хранилище по хэшу содержимого)
+- Инспекцию SQL-запросов (QUERY_INSPECTOR) и метрики Prometheus
+- Очередь фоновых задач (JOBS) и исходящей почты (EMAIL_OUTBOX)
+- Конфигурацию кэша (общий Redis/memcached и локальный уровень)
 - Настройки аутентификации и авторизации
 - Конфигурацию REST Framework и DRF Spectacular для API
 - Настройки редактора CKEditor 5
@@ -29,6 +32,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'corsheaders',
     'rest_framework',
     'django_filters',
@@ -37,11 +41,14 @@ INSTALLED_APPS = [
     'content',
     'form_sender',
     'users',
+    'jobs',
     'debug_toolbar',
     'ordered_model',
 ]
 
 MIDDLEWARE = [
+    'rassvet.middleware.MetricsMiddleware',
+    'rassvet.middleware.QueryInspectorMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -56,6 +63,27 @@ MIDDLEWARE = [
 
 INTERNAL_IPS = ALLOWED_HOSTS
 
+METRICS_ENABLED = os.environ.get('METRICS_ENABLED', 'True') == 'True'
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+
+QUERY_INSPECTOR = {
+    'ENABLED': os.environ.get('QUERY_INSPECTOR_ENABLED', 'True') == 'True',
+    'SAMPLE_RATE': float(
+        os.environ.get('QUERY_INSPECTOR_SAMPLE_RATE', 1.0 if DEBUG else 0.05)
+    ),
+    'STRICT': os.environ.get('QUERY_INSPECTOR_STRICT', 'False') == 'True',
+    'REPEAT_THRESHOLD': int(
+        os.environ.get('QUERY_INSPECTOR_REPEAT_THRESHOLD', 3)
+    ),
+}
+
+JOBS = {
+    'ALWAYS_EAGER': os.environ.get('JOBS_ALWAYS_EAGER', 'False') == 'True',
+    'MAX_ATTEMPTS': int(os.environ.get('JOBS_MAX_ATTEMPTS', 5)),
+    'RETRY_DELAY': int(os.environ.get('JOBS_RETRY_DELAY', 30)),
+    'LOCK_TIMEOUT': int(os.environ.get('JOBS_LOCK_TIMEOUT', 60 * 15)),
+}
+
 CORS_ALLOW_ALL_ORIGINS = (
     os.environ.get('CORS_ALLOW_ALL_ORIGINS', 'True') == 'True'
 )
@@ -130,13 +158,44 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'memcached': 'django.core.cache.backends.memcached.PyMemcacheCache',
+}
+
+SHARED_CACHE = {
+    'BACKEND': CACHE_BACKENDS[os.environ.get('CACHE_BACKEND', 'locmem')],
+    'LOCATION': os.environ.get('CACHE_LOCATION', 'unique-snowflake'),
+    'TIMEOUT': 300,
+}
+
 CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+    'default': SHARED_CACHE,
+    'shared': SHARED_CACHE,
+}
+
+if os.environ.get('CACHE_LOCAL_TIER', 'False') == 'True':
+    CACHES['default'] = {
+        'BACKEND': 'rassvet.cache.TwoTierCache',
         'TIMEOUT': 300,
+        'OPTIONS': {
+            'SHARED_ALIAS': 'shared',
+            'LOCAL_KEY_PREFIXES': ['content:response:'],
+            'LOCAL_MAX_ENTRIES': int(
+                os.environ.get('CACHE_LOCAL_MAX_ENTRIES', 500)
+            ),
+            'LOCAL_TIMEOUT': int(os.environ.get('CACHE_LOCAL_TIMEOUT', 60)),
+        },
     }
-}
+
+# Счётчики ограничения частоты запросов (rassvet.throttling) хранятся
+# в общем кэше, чтобы лимит действовал на все процессы.
+THROTTLE_CACHE_ALIAS = 'shared'
+
+RESPONSE_CACHE_TIMEOUT = int(
+    os.environ.get('RESPONSE_CACHE_TIMEOUT', 60 * 60 * 24)
+)
 
 LANGUAGE_CODE = 'ru-RU'
 
@@ -152,6 +211,21 @@ STATIC_ROOT = BASE_DIR / 'static'
 MEDIA_URL = 'media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Изображения полей моделей хранятся по хэшу содержимого
+# (cas/ab/cd/<sha256>), неиспользуемые удаляет команда collect_media.
+# Документы (отчёты, файлы литературы) сохраняют исходные имена.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'images': {
+        'BACKEND': 'content.storage.ContentAddressedStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'django.contrib.staticfiles.storage.StaticFilesStorage',
+    },
+}
+
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'users.RassvetUser'
@@ -169,6 +243,12 @@ EMAIL_HOST_USER = 'my_email@example.com'
 EMAIL_HOST_PASSWORD = 'mypassword'
 DEFAULT_FROM_EMAIL = 'my_email@example.com'
 
+EMAIL_OUTBOX = {
+    'BATCH_SIZE': int(os.environ.get('EMAIL_OUTBOX_BATCH_SIZE', 50)),
+    'MAX_ATTEMPTS': int(os.environ.get('EMAIL_OUTBOX_MAX_ATTEMPTS', 8)),
+    'RETRY_DELAY': int(os.environ.get('EMAIL_OUTBOX_RETRY_DELAY', 60)),
+}
+
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
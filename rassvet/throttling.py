@@ -0,0 +1,101 @@
+"""Ограничение частоты запросов API по скользящему окну.
+
+Этот модуль содержит:
+- SlidingWindowRateThrottle: базовый класс ограничения частоты.
+- AnonRateThrottle, UserRateThrottle, ScopedRateThrottle: замены
+  одноимённых классов DRF с тем же выбором ключа и лимита.
+
+Классы DRF хранят в кэше список времён всех запросов окна и
+перезаписывают его при каждой проверке. Здесь вместо списка
+используются два счётчика фиксированных окон (текущего и предыдущего),
+а число запросов за последние duration секунд оценивается как
+previous * (1 - elapsed / duration) + current. Счётчик текущего окна
+увеличивается атомарным cache.incr, поэтому проверка выполняется за
+O(1) обращений к кэшу и лимит соблюдается между процессами.
+
+Счётчики хранятся в кэше THROTTLE_CACHE_ALIAS (по умолчанию общий кэш
+'shared', минуя локальный уровень rassvet.cache.TwoTierCache). В тестах
+общим кэшем служит LocMemCache, который выполняет incr атомарно
+в пределах процесса.
+"""
+
+from django.conf import settings
+from django.core.cache import caches
+from rest_framework import throttling
+
+
+def increment_counter(cache, key: str, timeout: int) -> int:
+    """Атомарно увеличивает счётчик, создавая его при отсутствии."""
+    try:
+        return cache.incr(key)
+    except ValueError:
+        if cache.add(key, 1, timeout):
+            return 1
+        return cache.incr(key)
+
+
+class SlidingWindowRateThrottle(throttling.SimpleRateThrottle):
+    """Ограничение частоты запросов по скользящему окну счётчиков.
+
+    Отклонённые запросы не учитываются в счётчике, поэтому после
+    ожидания, указанного в Retry-After, запрос будет принят.
+    """
+
+    @property
+    def cache(self):
+        """Возвращает кэш счётчиков ограничения частоты."""
+        return caches[getattr(settings, 'THROTTLE_CACHE_ALIAS', 'shared')]
+
+    def allow_request(self, request, view) -> bool:
+        """Учитывает запрос и проверяет, не превышен ли лимит."""
+        if self.rate is None:
+            return True
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+        self.now = self.timer()
+        window = int(self.now // self.duration)
+        self.elapsed = self.now - window * self.duration
+        current_key = f'{self.key}:{window}'
+        self.previous = self.cache.get(f'{self.key}:{window - 1}', 0)
+        self.current = increment_counter(
+            self.cache, current_key, self.duration * 2
+        )
+        if self.get_estimate() > self.num_requests:
+            self.cache.decr(current_key)
+            self.current -= 1
+            return self.throttle_failure()
+        return True
+
+    def get_estimate(self, elapsed: float | None = None) -> float:
+        """Возвращает оценку числа запросов за последние duration секунд."""
+        if elapsed is None:
+            elapsed = self.elapsed
+        weight = 1 - elapsed / self.duration
+        return self.previous * weight + self.current
+
+    def wait(self) -> float:
+        """Возвращает время в секундах до приёма следующего запроса."""
+        remaining = self.duration - self.elapsed
+        if self.current + 1 > self.num_requests:
+            # В следующем окне текущий счётчик станет предыдущим.
+            share = (self.num_requests - 1) / self.current
+            return remaining + self.duration * (1 - share)
+        if not self.previous:
+            return 0
+        share = (self.num_requests - 1 - self.current) / self.previous
+        return max(self.duration * (1 - share) - self.elapsed, 0)
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, SlidingWindowRateThrottle):
+    """Ограничение частоты запросов анонимных пользователей по IP."""
+
+
+class UserRateThrottle(throttling.UserRateThrottle, SlidingWindowRateThrottle):
+    """Ограничение частоты запросов по пользователю или IP."""
+
+
+class ScopedRateThrottle(
+    throttling.ScopedRateThrottle, SlidingWindowRateThrottle
+):
+    """Ограничение частоты запросов по области throttle_scope view."""
@@ -4,6 +4,7 @@
 - Маршруты административной панели Django и восстановления пароля
 - Маршруты для API приложений
 - Маршруты для редактора CKEditor 5
+- Маршрут метрик Prometheus (/metrics)
 """
 
 from django.conf import settings
@@ -12,6 +13,8 @@ from django.contrib import admin
 from django.contrib.auth import views as auth_views
 from django.urls import include, path
 
+from rassvet.metrics import metrics_view
+
 urlpatterns = [
     path(
         'admin/password_reset/',
@@ -37,6 +40,7 @@ urlpatterns = [
     path('api/v1/forms/', include('form_sender.urls')),
     path('api/', include('content.urls')),
     path('ckeditor5/', include('django_ckeditor_5.urls')),
+    path('metrics', metrics_view, name='metrics'),
 ]
 if settings.DEBUG:
     urlpatterns = [